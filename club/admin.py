@@ -1,4 +1,5 @@
 from django.contrib import admin
+from core.admin import SoftDeleteAdmin
 from .models import Club
 
-admin.site.register(Club)
\ No newline at end of file
+admin.site.register(Club, SoftDeleteAdmin)
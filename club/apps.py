@@ -4,3 +4,8 @@ from django.apps import AppConfig
 class ClubConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'club'
+
+    def ready(self):
+        from . import signals # noqa: F401 (클럽 목록 캐시 무효화 시그널 등록)
+        from .autocomplete import club_names
+        club_names.warm_on_first_request()
@@ -0,0 +1,159 @@
+import bisect
+import unicodedata
+from types import MappingProxyType
+
+from core.reference_cache import ReferenceCache
+from .cache import CLUB_LIST_VERSION_KEY
+from .models import Club
+
+
+CHOSEONG = 'ㄱㄲㄴㄷㄸㄹㅁㅂㅃㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎ'
+JUNGSEONG = 'ㅏㅐㅑㅒㅓㅔㅕㅖㅗㅘㅙㅚㅛㅜㅝㅞㅟㅠㅡㅢㅣ'
+JONGSEONG = ('', 'ㄱ', 'ㄲ', 'ㄳ', 'ㄴ', 'ㄵ', 'ㄶ', 'ㄷ', 'ㄹ', 'ㄺ', 'ㄻ', 'ㄼ', 'ㄽ', 'ㄾ', 'ㄿ', 'ㅀ',
+             'ㅁ', 'ㅂ', 'ㅄ', 'ㅅ', 'ㅆ', 'ㅇ', 'ㅈ', 'ㅊ', 'ㅋ', 'ㅌ', 'ㅍ', 'ㅎ')
+# 겹모음 / 겹받침은 입력 순서대로 나눠야 입력 중인 글자(고 -> 과, 달 -> 닭)도 앞부분으로 일치한다
+_SPLIT_JAMO = str.maketrans({
+    'ㅘ': 'ㅗㅏ', 'ㅙ': 'ㅗㅐ', 'ㅚ': 'ㅗㅣ', 'ㅝ': 'ㅜㅓ', 'ㅞ': 'ㅜㅔ', 'ㅟ': 'ㅜㅣ', 'ㅢ': 'ㅡㅣ',
+    'ㄳ': 'ㄱㅅ', 'ㄵ': 'ㄴㅈ', 'ㄶ': 'ㄴㅎ', 'ㄺ': 'ㄹㄱ', 'ㄻ': 'ㄹㅁ', 'ㄼ': 'ㄹㅂ', 'ㄽ': 'ㄹㅅ',
+    'ㄾ': 'ㄹㅌ', 'ㄿ': 'ㄹㅍ', 'ㅀ': 'ㄹㅎ', 'ㅄ': 'ㅂㅅ',
+})
+_HANGUL_BASE = 0xAC00
+_HANGUL_COUNT = 11172
+_SPACES = ' \t\n\r\u3000'
+
+MAX_SCAN = 200 # 한 글자처럼 짧은 검색어에서 일치 범위가 넓어도 클럽 이만큼만 모아서 순위를 매긴다
+
+
+def _build_tables():
+    # 음절 11172자를 미리 풀어둔 변환표 (str.translate 한번으로 이름 전체를 변환)
+    jamo, initial = {}, {}
+    for code in range(_HANGUL_COUNT):
+        cho, rest = divmod(code, 588)
+        jung, jong = divmod(rest, 28)
+        syllable = _HANGUL_BASE + code
+        jamo[syllable] = (CHOSEONG[cho] + JUNGSEONG[jung] + JONGSEONG[jong]).translate(_SPLIT_JAMO)
+        initial[syllable] = CHOSEONG[cho]
+    jamo.update(_SPLIT_JAMO)
+    for char in _SPACES:
+        jamo[ord(char)] = initial[ord(char)] = None
+    return jamo, initial
+
+
+_JAMO_TABLE, _INITIAL_TABLE = _build_tables()
+
+
+def decompose(text):
+    """
+    한글 음절을 입력 순서대로의 자모로 풀고 (서울 -> ㅅㅓㅇㅜㄹ), 라틴 문자는 소문자로 바꾼다 (공백 제거)
+    입력 중인 글자 '성' (ㅅㅓㅇ) 도 '서울' 의 앞부분이 된다.
+    """
+    return unicodedata.normalize('NFC', text).lower().translate(_JAMO_TABLE)
+
+
+def initials(text):
+    """
+    초성 검색용 키 (서울 테니스 -> ㅅㅇㅌㄴㅅ, 한글이 아닌 글자는 소문자 그대로)
+    """
+    return unicodedata.normalize('NFC', text).lower().translate(_INITIAL_TABLE)
+
+
+def _is_initials_query(query):
+    return all(char in CHOSEONG for char in query)
+
+
+class PrefixIndex:
+    """
+    정렬된 키 목록에서 이분 탐색으로 앞부분이 일치하는 범위를 찾는 인덱스
+    """
+    def __init__(self, entries):
+        entries.sort()
+        self.keys = [key for key, _ in entries]
+        self.club_ids = [club_id for _, club_id in entries]
+
+    def scan(self, prefix, limit=MAX_SCAN):
+        # 앞부분이 일치하는 클럽 id (키 순서, 중복 제외 limit 개까지)
+        matches = {}
+        i = bisect.bisect_left(self.keys, prefix)
+        while i < len(self.keys) and len(matches) < limit and self.keys[i].startswith(prefix):
+            matches[self.club_ids[i]] = None
+            i += 1
+        return list(matches)
+
+
+class NameIndex:
+    """
+    이름 맨 앞부터의 키와 (두번째 단어부터) 각 단어부터 끝까지의 키를 따로 담은 인덱스
+    '클럽' 으로 '서울 테니스 클럽' 도 찾되, 단어 키가 아무리 많아도 이름 맨 앞부터 일치하는 클럽(클럽하우스)을 먼저 모은다.
+    """
+    def __init__(self, full_entries=(), word_entries=()):
+        self.full = PrefixIndex(list(full_entries))
+        self.words = PrefixIndex(list(word_entries))
+
+    def scan(self, prefix, limit=MAX_SCAN):
+        # club id -> 0 (이름 맨 앞부터 일치) / 1 (단어 앞부분 일치)
+        matches = dict.fromkeys(self.full.scan(prefix, limit), 0)
+        if len(matches) < limit:
+            for club_id in self.words.scan(prefix, limit):
+                matches.setdefault(club_id, 1)
+        return matches
+
+
+class ClubNameIndex(ReferenceCache):
+    """
+    클럽 이름 자동완성용 프로세스 메모리 인덱스 (회원가입 클럽 선택)
+    클럽 목록 캐시와 같은 버전 키를 쓰므로 클럽이 저장 / 삭제되면 check_interval 안에 다시 만들어지고,
+    그 사이의 검색은 DB / 공유 캐시 조회 없이 메모리에서만 처리된다.
+    """
+    def __init__(self, check_interval=5):
+        super().__init__(
+            lambda: Club.objects.exclude(name__isnull=True).exclude(name='').values_list('id', 'name', 'address'),
+            CLUB_LIST_VERSION_KEY, check_interval,
+        )
+        self.index = (self.items, NameIndex(), NameIndex())
+
+    def load(self, version):
+        with self._lock:
+            if version == self.version:
+                return
+            items = {}
+            jamo_full, jamo_suffixes = [], []
+            initial_full, initial_suffixes = [], []
+            for club_id, name, address in self.get_queryset():
+                items[club_id] = {'id': club_id, 'name': name, 'address': address}
+                # 단어마다 1번씩만 변환하고, 각 단어부터 끝까지 이어 붙여서 키를 만든다
+                words = unicodedata.normalize('NFC', name).lower().split()
+                jamo_words = [word.translate(_JAMO_TABLE) for word in words]
+                initial_words = [word.translate(_INITIAL_TABLE) for word in words]
+                for word in range(len(words)):
+                    (jamo_suffixes if word else jamo_full).append((''.join(jamo_words[word:]), club_id))
+                    (initial_suffixes if word else initial_full).append((''.join(initial_words[word:]), club_id))
+            self.items = MappingProxyType(items)
+            # 검색 중인 다른 스레드가 섞인 상태(새 클럽 목록 + 이전 인덱스)를 보지 않도록 튜플 하나로 교체
+            self.index = (
+                self.items, NameIndex(jamo_full, jamo_suffixes), NameIndex(initial_full, initial_suffixes),
+            )
+            self.version = version
+
+    def clear(self):
+        super().clear()
+        self.index = (self.items, NameIndex(), NameIndex())
+
+    def complete(self, query, limit=10):
+        """
+        query 로 시작하는(단어 단위) 클럽 목록 (이름 맨 앞부터 일치 / 짧은 이름 / 가나다 순)
+        자음만 입력하면 초성으로 찾는다. (ㅅㅇ -> 서울)
+        """
+        self.all() # check_interval 마다 버전 확인
+        items, jamo_index, initial_index = self.index
+        key = decompose(query)
+        if not key:
+            return []
+        matches = jamo_index.scan(key)
+        if _is_initials_query(key):
+            for club_id, word in initial_index.scan(key).items():
+                matches[club_id] = min(word, matches.get(club_id, word))
+        ranked = sorted(matches, key=lambda club_id: (matches[club_id], len(items[club_id]['name']), items[club_id]['name']))
+        return [items[club_id] for club_id in ranked[:limit]]
+
+
+club_names = ClubNameIndex()
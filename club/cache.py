@@ -0,0 +1,60 @@
+import hashlib
+import json
+import time
+
+from django.core.cache import cache
+from django.core.serializers.json import DjangoJSONEncoder
+
+
+CLUB_LIST_VERSION_KEY = 'club:list:version'
+CLUB_LIST_TIMEOUT = 60 * 60 * 24 # 버전 키로 무효화하므로 만료시간은 넉넉하게
+
+
+def _new_version():
+    # 버전 키가 캐시에서 사라져도 예전 버전 번호와 겹치지 않도록 현재 시간(ms)으로 시작
+    return int(time.time() * 1000)
+
+
+def get_club_list_version():
+    version = cache.get(CLUB_LIST_VERSION_KEY)
+    if version is None:
+        cache.add(CLUB_LIST_VERSION_KEY, _new_version(), None)
+        version = cache.get(CLUB_LIST_VERSION_KEY)
+    return version
+
+
+def bump_club_list_version():
+    """
+    클럽 목록 캐시 무효화 (Club / ImageUrl 저장, soft delete 시그널에서 호출)
+    """
+    try:
+        cache.incr(CLUB_LIST_VERSION_KEY)
+    except ValueError:
+        cache.set(CLUB_LIST_VERSION_KEY, _new_version(), None)
+
+
+def make_etag(data):
+    # 같은 데이터면 항상 같은 응답이 나오므로 데이터 해시를 strong ETag 로 사용
+    payload = json.dumps(data, cls=DjangoJSONEncoder, ensure_ascii=False, sort_keys=True)
+    return '"%s"' % hashlib.sha1(payload.encode()).hexdigest()
+
+
+def get_cached_club_list(build):
+    """
+    현재 버전의 (etag, data) 를 캐시에서 꺼내고, 없으면 build() 로 만들어서 저장
+    """
+    key = f'club:list:{get_club_list_version()}'
+    cached = cache.get(key)
+    if cached is None:
+        data = build()
+        cached = (make_etag(data), data)
+        cache.set(key, cached, CLUB_LIST_TIMEOUT)
+    return cached
+
+
+def get_club_list_etag():
+    """
+    DB 조회 없이 현재 버전의 ETag 만 확인 (캐시가 비어있으면 None)
+    """
+    cached = cache.get(f'club:list:{get_club_list_version()}')
+    return cached[0] if cached else None
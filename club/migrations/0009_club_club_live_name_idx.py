@@ -0,0 +1,18 @@
+# Generated by Django 5.0.14 on 2026-10-18 19:57
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('club', '0008_alter_club_id'),
+        ('image_url', '0015_imageurl_original_imageurl_variant_size'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='club',
+            index=models.Index(fields=['is_deleted', 'name'], name='club_live_name_idx'),
+        ),
+    ]
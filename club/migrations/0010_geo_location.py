@@ -0,0 +1,33 @@
+# Generated by Django 5.0.14 on 2026-10-18 21:08
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('club', '0009_club_club_live_name_idx'),
+        ('image_url', '0015_imageurl_original_imageurl_variant_size'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='club',
+            name='geohash',
+            field=models.CharField(blank=True, max_length=12, null=True),
+        ),
+        migrations.AddField(
+            model_name='club',
+            name='latitude',
+            field=models.FloatField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='club',
+            name='longitude',
+            field=models.FloatField(blank=True, null=True),
+        ),
+        migrations.AddIndex(
+            model_name='club',
+            index=models.Index(fields=['geohash'], name='club_geohash_idx'),
+        ),
+    ]
@@ -1,7 +1,8 @@
 from django.db import models
 from core.models import TimeStampedModel, SoftDeleteModel
+from geo.models import GeoPointModel
 
-class Club(TimeStampedModel, SoftDeleteModel):
+class Club(TimeStampedModel, SoftDeleteModel, GeoPointModel):
     id = models.AutoField(primary_key=True)
     address = models.CharField(max_length=100, blank=True, null=True)
     phone = models.CharField(max_length=30, blank=True, null=True)
@@ -9,9 +10,16 @@ class Club(TimeStampedModel, SoftDeleteModel):
     description = models.CharField(max_length=100, blank=True, null=True)
     image_url = models.ForeignKey('image_url.ImageUrl', on_delete=models.DO_NOTHING, blank=True, null=True)
 
+    SOFT_DELETE_CASCADE = (('coach.Coach', 'club'), ('team.Team', 'club')) # 클럽 삭제 시 코치 / 팀도 삭제
+
     def __str__(self):
         return self.name
 
 
     class Meta:
         db_table = 'club'
+        indexes = [
+            models.Index(fields=['is_deleted', 'name'], name='club_live_name_idx'), # 클럽 목록 (삭제되지 않은 클럽)
+            # 근처 클럽 검색 (geohash 칸마다의 범위 조건을 OR 로 묶으므로 부분 인덱스가 아닌 일반 인덱스여야 칸마다 범위 조회가 됨)
+            models.Index(fields=['geohash'], name='club_geohash_idx'),
+        ]
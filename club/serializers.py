@@ -10,7 +10,7 @@ from image_url.serializers import ImageUrlSerializer
 
 # 전체 클럽 목록 조회 serializer
 class ClubListSerializer(serializers.ModelSerializer):
-    image_url = ImageUrlSerializer(read_only=True)  # ImageUrl 모델에 대한 시리얼라이저를 사용
+    image_url = ImageUrlSerializer(read_only=True, variant_size=256)  # ImageUrl 모델에 대한 시리얼라이저를 사용 (목록용 리사이즈 이미지)
 
     class Meta:
         model = Club
@@ -33,7 +33,7 @@ class ClubDetailSerializer(serializers.ModelSerializer):
         
 
 class UserWithTeamInfoSerializer(serializers.ModelSerializer):
-    image_url = ImageUrlSerializer(read_only=True)
+    image_url = ImageUrlSerializer(read_only=True, variant_size=128)  # 프로필 아바타용 리사이즈 이미지
     team = serializers.SerializerMethodField()  # 사용자의 팀 정보를 커스텀하게 가져오기 위해 사용
 
     class Meta:
@@ -63,7 +63,7 @@ class CoachSerializer(serializers.ModelSerializer):
 
 
 class TeamSerializer(serializers.ModelSerializer):
-    image_url = ImageUrlSerializer(read_only=True)
+    image_url = ImageUrlSerializer(read_only=True, variant_size=256)
     
     class Meta:
         model = Team
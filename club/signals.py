@@ -0,0 +1,27 @@
+from django.db import transaction
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+from core.signals import soft_deleted
+from image_url.models import ImageUrl
+from image_url.signals import image_variants_created
+from .models import Club
+from .cache import bump_club_list_version
+
+
+# 트랜잭션이 커밋된 후에 무효화해야 커밋 전 데이터가 새 버전으로 캐시되지 않는다
+@receiver(post_save, sender=Club)
+@receiver(post_delete, sender=Club)
+@receiver(soft_deleted, sender=Club) # 어드민 일괄 soft delete (instance 없이 pks 로 전달)
+def invalidate_club_list_on_club_change(sender, **kwargs):
+    transaction.on_commit(bump_club_list_version)
+
+
+@receiver(post_save, sender=ImageUrl)
+@receiver(post_delete, sender=ImageUrl)
+@receiver(image_variants_created, sender=ImageUrl)
+def invalidate_club_list_on_image_change(sender, instance, created=False, **kwargs):
+    # 새로 만든 이미지는 아직 클럽에 연결되지 않았으므로 (연결 시 Club 저장으로 무효화됨) 건너뛴다
+    if created:
+        return
+    if Club.objects.filter(image_url_id=instance.pk).exists():
+        transaction.on_commit(bump_club_list_version)
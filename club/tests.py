@@ -1,3 +1,253 @@
+import json
+from django.core.cache import cache
 from django.test import TestCase
+from django.urls import reverse
+from rest_framework.test import APIClient
+from .autocomplete import club_names, decompose
+from .models import Club
+from users.models import CustomUser
+from team.models import Team
+from coach.models import Coach
+from image_url.models import ImageUrl
 
-# Create your tests here.
+
+# 테스트용 클럽 생성 (멤버 / 팀 / 코치 / 이미지 포함)
+def create_club(member_count, team_count=5, coach_count=3):
+    club = Club.objects.create(
+        name='테스트클럽',
+        image_url=ImageUrl.objects.create(image_url='https://example.com/club.png'),
+    )
+    teams = [
+        Team.objects.create(
+            name=f'팀{i}',
+            club=club,
+            image_url=ImageUrl.objects.create(image_url=f'https://example.com/team{i}.png'),
+        )
+        for i in range(team_count)
+    ]
+    images = ImageUrl.objects.bulk_create([
+        ImageUrl(image_url=f'https://example.com/user{i}.png') for i in range(member_count)
+    ])
+    # 비밀번호 해시를 피하기 위해 bulk_create로 유저 생성
+    CustomUser.objects.bulk_create([
+        CustomUser(
+            phone=f'club{club.id}-{i}',
+            username=f'유저{i}',
+            birth=1990,
+            gender='male',
+            club=club,
+            team=teams[i % team_count],
+            image_url=images[i],
+        )
+        for i in range(member_count)
+    ])
+    users = CustomUser.objects.filter(club=club).order_by('id')[:coach_count]
+    Coach.objects.bulk_create([Coach(club=club, user=user) for user in users])
+    return club
+
+
+class ClubDetailViewQueryTest(TestCase):
+    """
+    클럽 규모와 상관없이 클럽 상세 조회 쿼리 수가 일정한지 확인하는 테스트
+    """
+    # 클럽 / 코치 / 팀 / 유저 조회 (유저 조회에는 코치 제외 서브쿼리가 포함됨)
+    # + 코치 / 팀 / 유저 리사이즈 이미지 prefetch
+    EXPECTED_QUERIES = 7
+
+    def setUp(self):
+        self.client = APIClient()
+
+    def get_club_detail(self, club):
+        return self.client.get(reverse('club-detail', kwargs={'pk': club.pk}))
+
+    def test_query_count_is_fixed_for_small_club(self):
+        club = create_club(member_count=10)
+
+        with self.assertNumQueries(self.EXPECTED_QUERIES):
+            response = self.get_club_detail(club)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.data['coaches']), 3)
+        self.assertEqual(len(response.data['users']), 7)
+
+    def test_query_count_is_fixed_for_large_club(self):
+        club = create_club(member_count=800, team_count=20, coach_count=10)
+
+        with self.assertNumQueries(self.EXPECTED_QUERIES):
+            response = self.get_club_detail(club)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.data['coaches']), 10)
+        self.assertEqual(len(response.data['teams']), 20)
+        self.assertEqual(len(response.data['users']), 790)
+        # 중첩된 유저 / 팀 / 이미지 정보가 그대로 내려오는지 확인
+        coach_user = response.data['coaches'][0]['user']
+        self.assertIsNotNone(coach_user['image_url'])
+        self.assertIsNotNone(coach_user['team'])
+
+    def test_missing_club_returns_404(self):
+        response = self.client.get(reverse('club-detail', kwargs={'pk': 9999}))
+
+        self.assertEqual(response.status_code, 404)
+
+
+class ClubListViewCacheTest(TestCase):
+    """
+    클럽 목록 캐시 / ETag 테스트
+    """
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        self.url = reverse('club-list')
+        self.club = Club.objects.create(
+            name='테스트클럽',
+            image_url=ImageUrl.objects.create(image_url='https://example.com/club.png'),
+        )
+
+    def test_cached_list_is_served_without_queries(self):
+        first = self.client.get(self.url)
+
+        with self.assertNumQueries(0):
+            second = self.client.get(self.url)
+
+        self.assertEqual(second.status_code, 200)
+        self.assertEqual(second['ETag'], first['ETag'])
+        self.assertEqual(second.data['data'], first.data['data'])
+
+    def test_matching_etag_returns_304_without_queries(self):
+        etag = self.client.get(self.url)['ETag']
+
+        with self.assertNumQueries(0):
+            response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response['ETag'], etag)
+
+    def test_club_save_and_soft_delete_invalidate_list(self):
+        etag = self.client.get(self.url)['ETag']
+
+        with self.captureOnCommitCallbacks(execute=True):
+            Club.objects.create(name='새클럽')
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.data['data']), 2)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.club.delete()
+        response = self.client.get(self.url)
+        self.assertEqual([club['name'] for club in response.data['data']], ['새클럽'])
+
+    def test_club_image_change_invalidates_list(self):
+        etag = self.client.get(self.url)['ETag']
+
+        with self.captureOnCommitCallbacks(execute=True):
+            image = self.club.image_url
+            image.image_url = 'https://example.com/new.png'
+            image.save()
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['data'][0]['image_url']['image_url'], 'https://example.com/new.png')
+
+
+class ClubSubResourcePaginationTest(TestCase):
+    """
+    클럽 멤버 / 코치 / 팀 커서 페이지네이션 테스트
+    """
+    def setUp(self):
+        self.client = APIClient()
+        self.club = create_club(member_count=120, team_count=3, coach_count=2)
+
+    def fetch_all(self, name, page_size):
+        url = reverse(name, kwargs={'pk': self.club.pk}) + f'?page_size={page_size}'
+        ids = []
+        while url:
+            with self.assertNumQueries(3): # 클럽 확인 / 목록 페이지 / 리사이즈 이미지
+                response = self.client.get(url)
+            self.assertEqual(response.status_code, 200)
+            ids.extend(row['id'] for row in response.data['results'])
+            url = response.data['next']
+        return ids
+
+    def test_members_are_paginated_in_id_order(self):
+        ids = self.fetch_all('club-members', page_size=50)
+
+        coach_user_ids = set(Coach.objects.values_list('user', flat=True))
+        expected = list(CustomUser.objects.filter(club=self.club).exclude(id__in=coach_user_ids)
+                        .order_by('id').values_list('id', flat=True))
+        self.assertEqual(ids, expected)
+        self.assertEqual(len(ids), 118)
+
+    def test_coaches_and_teams_are_paginated(self):
+        self.assertEqual(len(self.fetch_all('club-coaches', page_size=1)), 2)
+        self.assertEqual(len(self.fetch_all('club-teams', page_size=2)), 3)
+
+    def test_missing_club_returns_404(self):
+        response = self.client.get(reverse('club-members', kwargs={'pk': 9999}))
+
+        self.assertEqual(response.status_code, 404)
+
+    def test_stream_returns_every_member_in_camel_case(self):
+        response = self.client.get(reverse('club-members', kwargs={'pk': self.club.pk}) + '?stream=1')
+
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.streaming)
+        rows = json.loads(b''.join(response.streaming_content))
+        self.assertEqual([row['id'] for row in rows], self.fetch_all('club-members', page_size=100))
+        self.assertIn('imageUrl', rows[0])
+        self.assertNotIn('image_url', rows[0])
+
+
+class ClubAutocompleteTest(TestCase):
+    """
+    클럽 이름 자동완성 (자모 / 초성 / 단어 앞부분 일치) 테스트
+    """
+    def setUp(self):
+        cache.clear()
+        club_names.clear()
+        self.client = APIClient()
+        self.url = reverse('club-autocomplete')
+        for name in ['서울 테니스 클럽', '서울대 테니스', '수원 ACE', '부산 스매시', '과천 닭갈비 클럽']:
+            Club.objects.create(name=name)
+
+    def complete(self, query):
+        return [club['name'] for club in club_names.complete(query)]
+
+    def test_decompose_splits_syllables_in_typing_order(self):
+        self.assertEqual(decompose('서울 Ace'), 'ㅅㅓㅇㅜㄹace')
+        self.assertEqual(decompose('과'), 'ㄱㅗㅏ')
+
+    def test_partially_typed_syllable_matches(self):
+        self.assertEqual(self.complete('서울'), ['서울대 테니스', '서울 테니스 클럽'])
+        self.assertEqual(self.complete('성'), ['서울대 테니스', '서울 테니스 클럽']) # 서울을 입력하는 중간 상태
+        self.assertEqual(self.complete('서울 테'), ['서울 테니스 클럽'])
+        self.assertEqual(self.complete('고'), ['과천 닭갈비 클럽'])
+        self.assertEqual(self.complete('과천 달'), ['과천 닭갈비 클럽'])
+
+    def test_initials_word_starts_and_latin(self):
+        self.assertEqual(self.complete('ㅂㅅ'), ['부산 스매시'])
+        self.assertEqual(self.complete('클럽'), ['과천 닭갈비 클럽', '서울 테니스 클럽']) # 같은 길이면 가나다 순
+        self.assertEqual(self.complete('ace'), ['수원 ACE'])
+        self.assertEqual(self.complete('대구'), [])
+
+    def test_full_name_match_is_not_crowded_out_by_word_matches(self):
+        Club.objects.bulk_create([Club(name=f'동네{i} 테니스 클럽') for i in range(399)])
+        Club.objects.create(name='클럽하우스')
+        club_names.clear()
+
+        self.assertEqual(self.complete('클럽')[0], '클럽하우스')
+        self.assertEqual(len(self.complete('클럽')), 10)
+
+    def test_lookups_do_not_query_and_changes_rebuild_index(self):
+        club_names.warm()
+
+        with self.assertNumQueries(0):
+            response = self.client.get(self.url, {'q': '수원'})
+        self.assertEqual(response.data['results'][0]['name'], '수원 ACE')
+
+        with self.captureOnCommitCallbacks(execute=True):
+            Club.objects.create(name='수원 챌린저스')
+            Club.objects.get(name='수원 ACE').delete()
+        club_names.checked_at = 0 # check_interval 이 지난 것으로 처리
+
+        self.assertEqual(self.complete('수원'), ['수원 챌린저스'])
@@ -1,9 +1,19 @@
 from django.urls import path
 from .views import (ClubListView,
-                    ClubDetailView
+                    ClubDetailView,
+                    ClubMemberListView,
+                    ClubCoachListView,
+                    ClubTeamListView,
+                    ClubAutocompleteView,
+                    ClubNearbyView
 )
 
 urlpatterns = [
     path('club/list/', ClubListView.as_view(), name='club-list'), # 클럽 목록 조회 API
+    path('club/autocomplete/', ClubAutocompleteView.as_view(), name='club-autocomplete'), # 클럽 이름 자동완성 API (회원가입 클럽 선택)
+    path('club/nearby/', ClubNearbyView.as_view(), name='club-nearby'), # 근처 클럽 검색 API (geohash 인덱스)
     path('club/<int:pk>/', ClubDetailView.as_view(), name='club-detail'), # 클럽 상세 정보 API
+    path('club/<int:pk>/members/', ClubMemberListView.as_view(), name='club-members'), # 클럽 멤버 목록 API (커서 페이지네이션)
+    path('club/<int:pk>/coaches/', ClubCoachListView.as_view(), name='club-coaches'), # 클럽 코치 목록 API (커서 페이지네이션)
+    path('club/<int:pk>/teams/', ClubTeamListView.as_view(), name='club-teams'), # 클럽 팀 목록 API (커서 페이지네이션)
 ]
@@ -2,6 +2,7 @@ from django.shortcuts import render
 from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework import status
+from django.utils.http import parse_etags
 from .models import Club
 from users.models import CustomUser
 from team.models import Team
@@ -13,30 +14,59 @@ from .serializers import (
                     TeamSerializer,
                     UserWithTeamInfoSerializer
 )
+from .autocomplete import club_names
+from .cache import get_cached_club_list, get_club_list_etag
+from core.views import SubResourceListView
+from geo.nearby import find_nearby
 
 
 # 클럽 목록 조회 API (회원가입 전용)
 class ClubListView(APIView):
     """
     클럽 목록 조회 API (회원가입 때 이용)
+    직렬화된 목록을 캐시하고 ETag 를 내려줘서, 변경이 없으면 DB 조회 없이 304 응답
     """
+    authentication_classes = () # 회원가입 전 화면이라 인증 불필요 (인증 유저 조회 쿼리 방지)
+    query_budget = 2 # 캐시 미스일 때 클럽 목록 / 리사이즈 이미지 2
+
     def get(self, request):
         try:
-            # is_deleted=False를 사용하여 삭제되지 않은 클럽만 조회
-            clubs = Club.objects.filter(is_deleted=False)
-            serializer = ClubListSerializer(clubs, many=True)
+            if_none_match = request.META.get('HTTP_IF_NONE_MATCH')
+            if if_none_match:
+                etag = get_club_list_etag()
+                if etag and etag in parse_etags(if_none_match):
+                    return self.not_modified(etag)
+
+            etag, data = get_cached_club_list(self.build_club_list)
+            if if_none_match and etag in parse_etags(if_none_match):
+                return self.not_modified(etag)
+
             # 성공 시 성공 메세지와 함께 데이터 반환
-            return Response({
+            response = Response({
                 'code': '200',
                 "message": "클럽 목록 조회 성공",
-                "data": serializer.data
+                "data": data
             }, status=status.HTTP_200_OK)
+            response['ETag'] = etag
+            response['Cache-Control'] = 'no-cache' # 캐시는 하되 매번 ETag 로 재검증
+            return response
         except Exception:
             # 예외 발생 시 단순한 에러 메세지 반환
             return Response({
                 "code": "500",
                 "message": "클럽 목록 조회 중 오류발생"
             }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+    def build_club_list(self):
+        # 기본 매니저(SoftDeleteManager)가 삭제되지 않은 클럽만 조회
+        clubs = Club.objects.all().select_related('image_url').prefetch_related('image_url__variants')
+        return list(ClubListSerializer(clubs, many=True).data)
+
+    def not_modified(self, etag):
+        response = Response(status=status.HTTP_304_NOT_MODIFIED)
+        response['ETag'] = etag
+        response['Cache-Control'] = 'no-cache'
+        return response
             
             
             
@@ -47,28 +77,38 @@ class ClubDetailView(APIView):
     """
     클럽 상세 정보 조회하는 API
     """
+    query_budget = 8 # 인증 1 + 클럽 / 코치 / 팀 / 유저 4 + 코치 / 팀 / 유저 리사이즈 이미지 3 (클럽 규모와 상관없이 고정)
+
     def get(self, request, pk):
         try:
-            club = Club.objects.get(pk=pk)
+            # select_related로 이미지까지 JOIN 하여 한번에 조회
+            club = Club.objects.select_related('image_url').get(pk=pk)
             club_serializer = ClubDetailSerializer(club)
 
             # 클럽에 속한 코치 정보 가져오기
-            coaches = Coach.objects.filter(club=club)
+            # 코치 -> 유저 -> 팀/이미지를 JOIN 해서 코치 수와 상관없이 쿼리 1번으로 처리 (N+1 방지)
+            coaches = Coach.objects.filter(club=club).select_related(
+                'user__image_url', 'user__team'
+            ).prefetch_related('user__image_url__variants')
             coach_serializer = CoachSerializer(coaches, many=True)
             
             # 클럽에 속한 팀 정보 가져오기
-            teams = Team.objects.filter(club=club)
+            teams = Team.objects.filter(club=club).select_related('image_url').prefetch_related('image_url__variants')
             team_serializer = TeamSerializer(teams, many=True)
             
             
             # 클럽에 속한 코치들의 유저 ID 목록 가져오기
-            # values_list => 특정 필드의 값을 리스트 형태로 가져올 때 사용
-            # flat=True => 하나의 필드를 불러올 때 True 값을 줘서 튜플형태가 아닌 단일 값으로 가져온다
-            coaches_users_ids = coaches.values_list('user', flat=True) 
+            # values => 평가하지 않고 서브쿼리로 넘겨서 별도의 쿼리가 발생하지 않도록 한다
+            coaches_users_ids = Coach.objects.filter(club=club).values('user')
             
 
             # 클럽에 속한 유저 정보 가져오기 (코치로 등록된 유저 제외)
-            users = CustomUser.objects.filter(club=club).exclude(id__in=coaches_users_ids) # exclude 함수는 조건에 해당하는 객체는 제외시켜준다.
+            users = (
+                CustomUser.objects.filter(club=club)
+                .exclude(id__in=coaches_users_ids) # exclude 함수는 조건에 해당하는 객체는 제외시켜준다.
+                .select_related('image_url', 'team')
+                .prefetch_related('image_url__variants') # 리사이즈 이미지는 목록 전체를 한번에 조회
+            )
             user_serializer = UserWithTeamInfoSerializer(users, many=True)
 
             # 클럽 정보와 함께 코치, 팀, 유저 정보 포함하여 응답
@@ -81,4 +121,111 @@ class ClubDetailView(APIView):
             
             return Response(response_data)
         except Club.DoesNotExist:
-            return Response({'error': '해당클럽이 존재하지 않습니다.'}, status=404)
\ No newline at end of file
+            return Response({'error': '해당클럽이 존재하지 않습니다.'}, status=404)
+
+
+
+# 클럽 하위 목록 (멤버 / 코치 / 팀) 커서 페이지네이션 API
+class ClubSubResourceView(SubResourceListView):
+    """
+    클럽 상세 API 의 코치 / 팀 / 유저 목록을 나눠서 커서(keyset) 페이지네이션으로 조회하는 API
+    ?cursor= 로 다음 페이지, ?page_size= 로 페이지 크기 지정 (최대 100), ?stream=1 이면 전체 목록 스트리밍
+    """
+    parent_model = Club
+    not_found_message = '해당클럽이 존재하지 않습니다.'
+    query_budget = 4 # 인증 1 + 클럽 확인 / 목록 페이지 / 리사이즈 이미지 3 (페이지 위치와 상관없이 고정)
+
+
+class ClubMemberListView(ClubSubResourceView):
+    """
+    클럽 멤버 목록 API (코치로 등록된 유저 제외)
+    """
+    serializer_class = UserWithTeamInfoSerializer
+
+    def get_queryset(self, club_id):
+        coaches_users_ids = Coach.objects.filter(club_id=club_id).values('user')
+        return (
+            CustomUser.objects.filter(club_id=club_id)
+            .exclude(id__in=coaches_users_ids)
+            .select_related('image_url', 'team')
+            .prefetch_related('image_url__variants')
+        )
+
+
+class ClubCoachListView(ClubSubResourceView):
+    """
+    클럽 코치 목록 API
+    """
+    serializer_class = CoachSerializer
+
+    def get_queryset(self, club_id):
+        return (
+            Coach.objects.filter(club_id=club_id)
+            .select_related('user__image_url', 'user__team')
+            .prefetch_related('user__image_url__variants')
+        )
+
+
+class ClubTeamListView(ClubSubResourceView):
+    """
+    클럽 팀 목록 API
+    """
+    serializer_class = TeamSerializer
+
+    def get_queryset(self, club_id):
+        return Team.objects.filter(club_id=club_id).select_related('image_url').prefetch_related('image_url__variants')
+
+
+# 클럽 자동완성 API (회원가입 클럽 선택)
+class ClubAutocompleteView(APIView):
+    """
+    클럽 이름 자동완성 API (회원가입 때 이용)
+    ?q= 입력 중인 검색어 (한글 자모 단위 / 초성 / 단어 앞부분 일치), ?limit= 최대 개수 (기본 10, 최대 50)
+    프로세스 메모리의 이름 인덱스에서 찾으므로 클럽 목록 전체를 내려받지 않아도 된다.
+    """
+    authentication_classes = () # 회원가입 전 화면이라 인증 불필요
+    query_budget = 1 # 클럽이 바뀐 뒤 인덱스를 다시 만들 때만 클럽 목록 1
+
+    MAX_LIMIT = 50
+
+    def get(self, request):
+        try:
+            limit = min(max(int(request.query_params.get('limit', 10)), 1), self.MAX_LIMIT)
+        except ValueError:
+            return Response({'error': 'limit 는 숫자여야 합니다.'}, status=status.HTTP_400_BAD_REQUEST)
+        results = club_names.complete(request.query_params.get('q', ''), limit)
+        return Response({'results': results})
+
+
+# 근처 클럽 검색 API
+class ClubNearbyView(APIView):
+    """
+    근처 클럽 검색 API
+    ?lat= / ?lng= 현재 위치, ?radius= 반경 km (기본 5, 최대 50), ?limit= 최대 개수 (기본 20, 최대 50)
+    geohash 인덱스 범위 조회로 후보만 읽고 정확한 거리는 후보에만 계산해서 가까운 순으로 반환
+    """
+    authentication_classes = ()
+    query_budget = 3 # 후보 좌표 / 클럽 (이미지 JOIN) / 리사이즈 이미지 3
+
+    MAX_RADIUS_KM = 50
+    MAX_LIMIT = 50
+
+    def get(self, request):
+        try:
+            latitude = float(request.query_params['lat'])
+            longitude = float(request.query_params['lng'])
+            radius = float(request.query_params.get('radius', 5))
+            limit = int(request.query_params.get('limit', 20))
+        except (KeyError, ValueError):
+            return Response({'error': 'lat / lng 는 필수이며 lat / lng / radius / limit 는 숫자여야 합니다.'}, status=status.HTTP_400_BAD_REQUEST)
+        if not (-90 <= latitude <= 90 and -180 <= longitude <= 180) or not 0 < radius <= self.MAX_RADIUS_KM:
+            return Response({'error': f'좌표 범위를 벗어났거나 radius 가 0 ~ {self.MAX_RADIUS_KM}km 가 아닙니다.'}, status=status.HTTP_400_BAD_REQUEST)
+        limit = min(max(limit, 1), self.MAX_LIMIT)
+
+        hits = find_nearby(Club.objects.all(), latitude, longitude, radius, limit)
+        clubs = Club.objects.select_related('image_url').prefetch_related('image_url__variants').in_bulk([pk for pk, _ in hits])
+        hits = [(pk, distance) for pk, distance in hits if pk in clubs]
+        results = ClubListSerializer([clubs[pk] for pk, _ in hits], many=True).data
+        for data, (_, distance) in zip(results, hits):
+            data['distance_km'] = round(distance, 2)
+        return Response({'results': results})
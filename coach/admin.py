@@ -1,4 +1,5 @@
 from django.contrib import admin
+from core.admin import SoftDeleteAdmin
 from .models import Coach
 
-admin.site.register(Coach)
+admin.site.register(Coach, SoftDeleteAdmin)
@@ -0,0 +1,20 @@
+# Generated by Django 5.0.14 on 2026-10-18 19:57
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('club', '0009_club_club_live_name_idx'),
+        ('coach', '0003_alter_coach_id'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='coach',
+            index=models.Index(fields=['club', 'is_deleted'], name='coach_club_live_idx'),
+        ),
+    ]
@@ -0,0 +1,24 @@
+# Generated by Django 5.0.14 on 2026-10-18 20:01
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('club', '0009_club_club_live_name_idx'),
+        ('coach', '0004_coach_coach_club_live_idx'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='coach',
+            name='coach_club_live_idx',
+        ),
+        migrations.AddIndex(
+            model_name='coach',
+            index=models.Index(fields=['club', 'is_deleted', 'id'], name='coach_club_live_idx'),
+        ),
+    ]
@@ -12,4 +12,7 @@ class Coach(TimeStampedModel, SoftDeleteModel):
         return self.id
 
     class Meta:
-        db_table = 'coach'
\ No newline at end of file
+        db_table = 'coach'
+        indexes = [
+            models.Index(fields=['club', 'is_deleted', 'id'], name='coach_club_live_idx'), # 클럽 소속 코치 조회 (id 순 커서 페이지네이션 포함)
+        ]
\ No newline at end of file
@@ -1,3 +1,20 @@
-from django.contrib import admin
+from django.contrib import admin, messages
+from core.admin import SoftDeleteAdmin
+from match.bracket import generate_bracket
+from .models import Competition
 
-# Register your models here.
+
+@admin.register(Competition)
+class CompetitionAdmin(SoftDeleteAdmin):
+    actions = ['generate_brackets']
+
+    @admin.action(description='선택한 대회 대진표 생성 (대회 종목 포인트 순 시드 배정)')
+    def generate_brackets(self, request, queryset):
+        for competition in queryset:
+            try:
+                # 대회 종목의 포인트로만 시드 배정 (다른 종목 포인트는 합산하지 않음)
+                matches = generate_bracket(competition, competition.match_type_id)
+            except ValueError as e:
+                self.message_user(request, f'{competition.name}: {e}', messages.ERROR)
+            else:
+                self.message_user(request, f'{competition.name}: 경기 {len(matches)}개 생성')
@@ -0,0 +1,129 @@
+import random
+import time
+from datetime import datetime, timedelta
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+from rest_framework.test import APIRequestFactory
+from competition.models import Competition
+from competition.views import CompetitionListView
+from matchtype.models import MatchType
+from tier.models import Tier
+
+
+LOCATIONS = ['서울', '경기', '인천', '부산', '대구', '광주', '대전', '울산', '세종', '강원', '충북', '충남', '전북', '전남', '경북', '경남', '제주']
+STATUSES = ['open', 'closed', 'done']
+# 전체 스캔 / 정렬용 임시 B-tree 가 생기면 실행 계획에 나오는 문구 (SQLite / PostgreSQL)
+FULL_SCAN_MARKERS = ('USE TEMP B-TREE', 'Seq Scan', 'Sort Key')
+
+
+class Rollback(Exception):
+    pass
+
+
+class Command(BaseCommand):
+    """
+    대회 N개 테이블에서 대회 목록 API 의 필터 조합마다 첫 페이지 / 깊은 페이지 조회 시간과
+    실행 계획(EXPLAIN)을 출력하고, 전체 스캔이나 정렬이 있으면 실패한다.
+    벤치마크 데이터는 트랜잭션 안에서 만들고 끝나면 롤백한다.
+        python manage.py benchmark_competition_list --competitions 1000000
+    """
+    help = '대회 목록 조회 벤치마크'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--competitions', type=int, default=1000000, help='대회 수')
+        parser.add_argument('--depth', type=int, default=20, help='커서로 따라갈 페이지 수')
+
+    def handle(self, *args, **options):
+        try:
+            with transaction.atomic():
+                failures = self.run(options)
+                raise Rollback()
+        except Rollback:
+            pass
+        if failures:
+            raise CommandError(f'인덱스를 타지 않는 조회: {", ".join(failures)}')
+
+    def run(self, options):
+        rng = random.Random(0)
+        match_types = [MatchType.objects.create(gender='bench', type=f'bench{i}') for i in range(4)]
+        tiers = [
+            Tier.objects.create(name=f'티어{i}', level=i, match_type=match_type)
+            for match_type in match_types for i in range(5)
+        ]
+        base = datetime(2022, 1, 1)
+
+        start = time.perf_counter()
+        Competition.objects.bulk_create((
+            Competition(
+                name=f'대회{i}',
+                status=rng.choice(STATUSES),
+                location=rng.choice(LOCATIONS),
+                start_date=base + timedelta(minutes=rng.randrange(3 * 365 * 24 * 60)),
+                match_type=rng.choice(match_types),
+                tier=rng.choice(tiers),
+            )
+            for i in range(options['competitions'])
+        ), batch_size=5000)
+        with connection.cursor() as cursor:
+            cursor.execute(f'ANALYZE {Competition._meta.db_table}')
+        self.stdout.write(f'대회 {options["competitions"]}개 생성 {time.perf_counter() - start:.1f}s')
+
+        scenarios = {
+            '필터 없음': {},
+            '상태': {'status': 'open'},
+            '지역': {'location': '제주'},
+            '종목': {'match_type': match_types[0].id},
+            '티어': {'tier': tiers[7].id},
+            '시작일 범위': {'start_from': '2023-03-01', 'start_to': '2023-04-01'},
+            '지역 + 시작일 범위': {'location': '부산', 'start_from': '2023-03-01', 'start_to': '2023-04-01'},
+            '상태 + 티어': {'status': 'open', 'tier': tiers[7].id},
+        }
+        failures = []
+        for label, params in scenarios.items():
+            plan, first, deep = self.measure(params, options['depth'])
+            full_scan = [line for line in plan if any(marker in line for marker in FULL_SCAN_MARKERS)]
+            full_scan += [line for line in plan if 'SCAN' in line and 'INDEX' not in line]
+            if full_scan:
+                failures.append(label)
+            self.stdout.write(
+                f'[{label}] 첫 페이지 {first * 1000:.2f}ms / {options["depth"]}번째 페이지 {deep * 1000:.2f}ms'
+                f'{" (전체 스캔)" if full_scan else ""}'
+            )
+            for line in plan:
+                self.stdout.write(f'    {line}')
+        return failures
+
+    def measure(self, params, depth):
+        factory = APIRequestFactory()
+        view = CompetitionListView.as_view()
+        request = factory.get('/competitions/', {**params, 'page_size': 20})
+        queries = []
+
+        def capture(execute, sql, params, many, context):
+            queries.append((sql, params))
+            return execute(sql, params, many, context)
+
+        url = None
+        first = deep = 0
+        for page in range(depth):
+            if url:
+                request = factory.get(url)
+            with connection.execute_wrapper(capture):
+                started = time.perf_counter()
+                response = view(request)
+                elapsed = time.perf_counter() - started
+            if page == 0:
+                first = elapsed
+                # 대회 페이지 조회 SQL 의 실행 계획 (리사이즈 이미지 prefetch 는 제외)
+                sql, sql_params = queries[0]
+            deep = elapsed
+            url = response.data['next']
+            if not url:
+                break
+
+        with connection.cursor() as cursor:
+            explain = 'EXPLAIN QUERY PLAN ' if connection.vendor == 'sqlite' else 'EXPLAIN '
+            cursor.execute(explain + sql, sql_params)
+            plan = [str(row[-1]) for row in cursor.fetchall()]
+        return plan, first, deep
@@ -0,0 +1,18 @@
+# Generated by Django 5.0.14 on 2026-10-18 19:57
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('competition', '0006_alter_competition_id'),
+        ('image_url', '0015_imageurl_original_imageurl_variant_size'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='competition',
+            index=models.Index(fields=['is_deleted', 'start_date'], name='competition_live_start_idx'),
+        ),
+    ]
@@ -0,0 +1,47 @@
+# Generated by Django 5.0.14 on 2026-10-18 20:15
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('competition', '0007_competition_competition_live_start_idx'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='CompetitionPlayerInfo',
+            fields=[
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('is_deleted', models.BooleanField(default=False)),
+                ('id', models.AutoField(primary_key=True, serialize=False)),
+                ('registration_date', models.DateTimeField(blank=True, db_column='registrationDate', null=True)),
+                ('competition', models.ForeignKey(on_delete=django.db.models.deletion.DO_NOTHING, to='competition.competition')),
+            ],
+            options={
+                'db_table': 'competition_player_info',
+            },
+        ),
+        migrations.CreateModel(
+            name='CompetitionPlayer',
+            fields=[
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('id', models.AutoField(primary_key=True, serialize=False)),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.DO_NOTHING, to=settings.AUTH_USER_MODEL)),
+                ('competition_player_info', models.ForeignKey(on_delete=django.db.models.deletion.DO_NOTHING, related_name='players', to='competition.competitionplayerinfo')),
+            ],
+            options={
+                'db_table': 'competition_player',
+            },
+        ),
+        migrations.AddIndex(
+            model_name='competitionplayerinfo',
+            index=models.Index(fields=['competition', 'is_deleted', 'id'], name='entry_competition_live_idx'),
+        ),
+    ]
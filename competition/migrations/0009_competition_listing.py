@@ -0,0 +1,51 @@
+# Generated by Django 5.0.14 on 2026-10-18 20:48
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('competition', '0008_competitionplayerinfo_competitionplayer_and_more'),
+        ('image_url', '0015_imageurl_original_imageurl_variant_size'),
+        ('matchtype', '0002_alter_matchtype_id'),
+        ('tier', '0005_tier_min_points'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='competition',
+            name='competition_live_start_idx',
+        ),
+        migrations.AddField(
+            model_name='competition',
+            name='match_type',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.DO_NOTHING, to='matchtype.matchtype'),
+        ),
+        migrations.AddField(
+            model_name='competition',
+            name='tier',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.DO_NOTHING, to='tier.tier'),
+        ),
+        migrations.AddIndex(
+            model_name='competition',
+            index=models.Index(condition=models.Q(('is_deleted', False)), fields=['start_date', 'id'], name='competition_live_start_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='competition',
+            index=models.Index(condition=models.Q(('is_deleted', False)), fields=['status', 'start_date', 'id'], name='competition_status_start_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='competition',
+            index=models.Index(condition=models.Q(('is_deleted', False)), fields=['location', 'start_date', 'id'], name='competition_location_start_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='competition',
+            index=models.Index(condition=models.Q(('is_deleted', False)), fields=['match_type', 'start_date', 'id'], name='competition_type_start_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='competition',
+            index=models.Index(condition=models.Q(('is_deleted', False)), fields=['tier', 'start_date', 'id'], name='competition_tier_start_idx'),
+        ),
+    ]
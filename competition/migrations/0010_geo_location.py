@@ -0,0 +1,35 @@
+# Generated by Django 5.0.14 on 2026-10-18 21:08
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('competition', '0009_competition_listing'),
+        ('image_url', '0015_imageurl_original_imageurl_variant_size'),
+        ('matchtype', '0002_alter_matchtype_id'),
+        ('tier', '0005_tier_min_points'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='competition',
+            name='geohash',
+            field=models.CharField(blank=True, max_length=12, null=True),
+        ),
+        migrations.AddField(
+            model_name='competition',
+            name='latitude',
+            field=models.FloatField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='competition',
+            name='longitude',
+            field=models.FloatField(blank=True, null=True),
+        ),
+        migrations.AddIndex(
+            model_name='competition',
+            index=models.Index(fields=['geohash'], name='competition_geohash_idx'),
+        ),
+    ]
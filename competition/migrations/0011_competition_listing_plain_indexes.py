@@ -0,0 +1,56 @@
+# Generated by Django 5.0.14 on 2026-10-18 21:33
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('competition', '0010_geo_location'),
+        ('image_url', '0015_imageurl_original_imageurl_variant_size'),
+        ('matchtype', '0002_alter_matchtype_id'),
+        ('tier', '0005_tier_min_points'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='competition',
+            name='competition_live_start_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='competition',
+            name='competition_status_start_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='competition',
+            name='competition_location_start_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='competition',
+            name='competition_type_start_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='competition',
+            name='competition_tier_start_idx',
+        ),
+        migrations.AddIndex(
+            model_name='competition',
+            index=models.Index(fields=['start_date', 'id'], name='competition_start_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='competition',
+            index=models.Index(fields=['status', 'start_date', 'id'], name='competition_status_start_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='competition',
+            index=models.Index(fields=['location', 'start_date', 'id'], name='competition_location_start_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='competition',
+            index=models.Index(fields=['match_type', 'start_date', 'id'], name='competition_type_start_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='competition',
+            index=models.Index(fields=['tier', 'start_date', 'id'], name='competition_tier_start_idx'),
+        ),
+    ]
@@ -1,8 +1,11 @@
 from django.db import models
 from core.models import TimeStampedModel, SoftDeleteModel
+from geo.models import GeoPointModel
+from matchtype.models import MatchType
+from tier.models import Tier
 
 
-class Competition(TimeStampedModel, SoftDeleteModel):
+class Competition(TimeStampedModel, SoftDeleteModel, GeoPointModel):
     id = models.AutoField(primary_key=True)
     name = models.CharField(max_length=30, blank=True, null=True)
     status = models.CharField(max_length=6, blank=True, null=True)
@@ -22,8 +25,42 @@ class Competition(TimeStampedModel, SoftDeleteModel):
     site_link = models.TextField(db_column='siteLink', blank=True, null=True)  
     feedback = models.CharField(max_length=255, blank=True, null=True)
     image_url = models.ForeignKey('image_url.ImageUrl', on_delete=models.DO_NOTHING, blank=True, null=True)
-    # match_type = models.ForeignKey('MatchType', models.DO_NOTHING)
-    # tier = models.ForeignKey('Tier', models.DO_NOTHING)
+    match_type = models.ForeignKey(MatchType, models.DO_NOTHING, blank=True, null=True)
+    tier = models.ForeignKey(Tier, models.DO_NOTHING, blank=True, null=True) # 참가 가능 티어
 
     class Meta:
         db_table = 'competition'
+        # 대회 목록 API: 필터 1개(같음 조건) + 시작일 범위 + (시작일, id) 커서 정렬을 인덱스 범위 조회 한번으로 처리
+        # 부분 인덱스는 MySQL 에서 만들어지지 않으므로 일반 복합 인덱스로 만들고, 기본 매니저의 is_deleted 조건은 인덱스 순서로 읽은 행에서 거른다
+        # (is_deleted 를 앞 컬럼에 두면 SQLite 에서 NOT is_deleted 가 같음 조건으로 쓰이지 않아 정렬이 생긴다)
+        indexes = [
+            models.Index(fields=['start_date', 'id'], name='competition_start_idx'), # 필터 없이 시작일 순
+            models.Index(fields=['status', 'start_date', 'id'], name='competition_status_start_idx'),
+            models.Index(fields=['location', 'start_date', 'id'], name='competition_location_start_idx'),
+            models.Index(fields=['match_type', 'start_date', 'id'], name='competition_type_start_idx'),
+            models.Index(fields=['tier', 'start_date', 'id'], name='competition_tier_start_idx'),
+            models.Index(fields=['geohash'], name='competition_geohash_idx'), # 근처 대회 검색 (club_geohash_idx 와 같은 이유로 일반 인덱스)
+        ]
+
+
+# 대회 참가 엔트리 (단식 1명 / 복식 2명, 대진표의 a_team / b_team 단위)
+class CompetitionPlayerInfo(TimeStampedModel, SoftDeleteModel):
+    id = models.AutoField(primary_key=True)
+    registration_date = models.DateTimeField(db_column='registrationDate', blank=True, null=True)
+    competition = models.ForeignKey(Competition, models.DO_NOTHING)
+
+    class Meta:
+        db_table = 'competition_player_info'
+        indexes = [
+            models.Index(fields=['competition', 'is_deleted', 'id'], name='entry_competition_live_idx'),
+        ]
+
+
+# 엔트리에 속한 선수
+class CompetitionPlayer(TimeStampedModel):
+    id = models.AutoField(primary_key=True)
+    user = models.ForeignKey('users.CustomUser', models.DO_NOTHING)
+    competition_player_info = models.ForeignKey(CompetitionPlayerInfo, models.DO_NOTHING, related_name='players')
+
+    class Meta:
+        db_table = 'competition_player'
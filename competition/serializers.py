@@ -0,0 +1,26 @@
+from rest_framework import serializers
+from image_url.serializers import ImageUrlSerializer
+from matchtype.cache import match_types
+from matchtype.serializers import MatchTypeSerializer
+from tier.cache import tiers
+from tier.serializers import TierSerializer
+from .models import Competition
+
+
+class CompetitionListSerializer(serializers.ModelSerializer):
+    image_url = ImageUrlSerializer(read_only=True, variant_size=256)
+    # 종목 / 티어는 DB 조인 없이 프로세스 메모리의 참조 캐시에서 조회
+    match_type = serializers.SerializerMethodField()
+    tier = serializers.SerializerMethodField()
+
+    class Meta:
+        model = Competition
+        fields = ['id', 'name', 'status', 'start_date', 'end_date', 'location', 'address', 'fee', 'image_url', 'match_type', 'tier']
+
+    def get_match_type(self, obj):
+        match_type = match_types.get(obj.match_type_id)
+        return MatchTypeSerializer(match_type).data if match_type else None
+
+    def get_tier(self, obj):
+        tier = tiers.get(obj.tier_id)
+        return TierSerializer(tier).data if tier else None
@@ -1,3 +1,97 @@
+from datetime import datetime, timedelta
+from urllib.parse import quote
+
+from django.core.cache import cache
 from django.test import TestCase
+from django.urls import reverse
+from rest_framework.test import APIClient
+from matchtype.cache import match_types
+from matchtype.models import MatchType
+from tier.cache import tiers
+from tier.models import Tier
+from .models import Competition
+
+
+class CompetitionListViewTest(TestCase):
+    """
+    대회 목록 필터 / 커서 페이지네이션 테스트
+    """
+    def setUp(self):
+        cache.clear()
+        tiers.clear()
+        match_types.clear()
+        self.client = APIClient()
+        self.url = reverse('competition-list')
+        self.single = MatchType.objects.create(gender='male', type='single')
+        self.double = MatchType.objects.create(gender='male', type='double')
+        self.gold = Tier.objects.create(name='골드', level=3, match_type=self.single)
+        self.base = datetime(2024, 5, 1, 9)
+        # 같은 시작일이 여러 개 있어도 (시작일, id) 순서로 빠짐없이 내려오는지 확인하기 위해 2개씩 같은 날짜
+        self.competitions = Competition.objects.bulk_create([
+            Competition(
+                name=f'대회{i}',
+                status='open' if i % 2 else 'closed',
+                location='서울' if i % 3 else '부산',
+                start_date=self.base + timedelta(days=i // 2),
+                match_type=self.single if i % 2 else self.double,
+                tier=self.gold if i % 4 == 1 else None,
+            )
+            for i in range(30)
+        ])
+        Competition.objects.create(name='미정', status='open') # 시작일이 없는 대회는 목록에서 제외
+        Competition.objects.create(name='삭제', status='open', start_date=self.base).delete()
+
+    def fetch_all(self, query=''):
+        url = f'{self.url}?page_size=7{query}'
+        ids = []
+        while url:
+            response = self.client.get(url)
+            self.assertEqual(response.status_code, 200)
+            ids.extend(row['id'] for row in response.data['results'])
+            url = response.data['next']
+        return ids
+
+    def expected(self, **filters):
+        return list(
+            Competition.objects.filter(start_date__isnull=False, **filters)
+            .order_by('start_date', 'id').values_list('id', flat=True)
+        )
+
+    def test_all_competitions_are_paginated_by_start_date(self):
+        ids = self.fetch_all()
+
+        self.assertEqual(ids, self.expected())
+        self.assertEqual(len(ids), 30)
+
+    def test_filters(self):
+        self.assertEqual(self.fetch_all('&status=open'), self.expected(status='open'))
+        self.assertEqual(self.fetch_all('&location=' + quote('부산')), self.expected(location='부산'))
+        self.assertEqual(self.fetch_all(f'&match_type={self.double.id}'), self.expected(match_type=self.double))
+        self.assertEqual(self.fetch_all(f'&tier={self.gold.id}&status=open'), self.expected(tier=self.gold))
+        self.assertEqual(
+            self.fetch_all('&start_from=2024-05-03&start_to=2024-05-06'),
+            self.expected(start_date__gte=self.base.replace(day=3, hour=0), start_date__lt=self.base.replace(day=6, hour=0)),
+        )
+
+    def test_match_type_and_tier_come_from_reference_cache(self):
+        tiers.warm()
+        match_types.warm()
+
+        with self.assertNumQueries(1): # 대회 페이지 (이미지가 없으므로 리사이즈 이미지 prefetch 없음)
+            response = self.client.get(f'{self.url}?tier={self.gold.id}')
+
+        row = response.data['results'][0]
+        self.assertEqual(row['tier']['name'], '골드')
+        self.assertEqual(row['match_type']['type'], 'single')
+
+    def test_invalid_date_returns_400(self):
+        for query in ('start_from=어제', 'start_from=2024-13-45', 'start_to=2024-02-30T25:00:00'):
+            response = self.client.get(f'{self.url}?{query}')
+
+            self.assertEqual(response.status_code, 400, query)
+
+    def test_invalid_id_filter_returns_400(self):
+        for query in ('match_type=abc', 'tier=x', 'tier=-1', 'tier=0', f'tier={quote("²")}', 'tier=99999999999999999999999'):
+            response = self.client.get(f'{self.url}?{query}')
 
-# Create your tests here.
+            self.assertEqual(response.status_code, 400, query)
@@ -0,0 +1,7 @@
+from django.urls import path
+from .views import CompetitionListView
+
+
+urlpatterns = [
+    path('competitions/', CompetitionListView.as_view(), name='competition-list'), # 대회 목록 조회 API (필터 + 커서 페이지네이션)
+]
@@ -1,3 +1,72 @@
-from django.shortcuts import render
+from django.utils.dateparse import parse_date, parse_datetime
+from rest_framework.views import APIView
+from rest_framework.response import Response
+from core.pagination import StartDateCursorPagination
+from .models import Competition
+from .serializers import CompetitionListSerializer
 
-# Create your views here.
+
+MAX_ID = 2 ** 31 - 1 # AutoField(INT) 최대값
+
+
+def _parse_id_param(value):
+    # int() 로 바꿀 수 없는 값(abc, ²) / 범위를 벗어난 값(-1, DB 정수 범위 초과)은 None
+    try:
+        value = int(value)
+    except ValueError:
+        return None
+    return value if 1 <= value <= MAX_ID else None
+
+
+def _parse_datetime_param(value):
+    # 2024-05-01 / 2024-05-01T09:00:00 둘 다 허용, 형식은 맞지만 없는 날짜(2024-13-45)는 ValueError 대신 None
+    try:
+        return parse_datetime(value) or parse_date(value)
+    except ValueError:
+        return None
+
+
+class CompetitionListView(APIView):
+    """
+    대회 목록 조회 API (시작일 순 커서 페이지네이션)
+    ?status= / ?location= / ?match_type= / ?tier= 같음 필터, ?start_from= / ?start_to= 시작일 범위 필터
+    필터마다 (필터 컬럼, start_date, id) 복합 인덱스가 있어 정렬 / 전체 스캔 없이 조회된다.
+    """
+    authentication_classes = ()
+    pagination_class = StartDateCursorPagination
+    query_budget = 4 # 대회 페이지 (이미지 JOIN) / 리사이즈 이미지 2 + (참조 캐시를 다시 불러올 때 종목 / 티어 2)
+
+    FILTER_FIELDS = {
+        'status': 'status',
+        'location': 'location',
+        'match_type': 'match_type_id',
+        'tier': 'tier_id',
+    }
+    ID_PARAMS = ('match_type', 'tier')
+
+    def get(self, request):
+        queryset = Competition.objects.filter(start_date__isnull=False)
+        for param, field in self.FILTER_FIELDS.items():
+            value = request.query_params.get(param)
+            if not value:
+                continue
+            if param in self.ID_PARAMS:
+                value = _parse_id_param(value)
+                if value is None:
+                    return Response({'error': f'{param} 는 숫자여야 합니다.'}, status=400)
+            queryset = queryset.filter(**{field: value})
+
+        for param, lookup in (('start_from', 'start_date__gte'), ('start_to', 'start_date__lt')):
+            value = request.query_params.get(param)
+            if not value:
+                continue
+            parsed = _parse_datetime_param(value)
+            if parsed is None:
+                return Response({'error': f'{param} 는 YYYY-MM-DD 형식이어야 합니다.'}, status=400)
+            queryset = queryset.filter(**{lookup: parsed})
+
+        queryset = queryset.select_related('image_url').prefetch_related('image_url__variants')
+        paginator = self.pagination_class()
+        page = paginator.paginate_queryset(queryset, request, view=self)
+        serializer = CompetitionListSerializer(page, many=True)
+        return paginator.get_paginated_response(serializer.data)
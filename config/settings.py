@@ -2,6 +2,7 @@
 from pathlib import Path
 from datetime import timedelta
 import os
+import sys
 from dotenv import load_dotenv
 
 
@@ -22,6 +23,14 @@ AWS_SECRET_ACCESS_KEY = os.environ.get('AWS_SECRET_ACCESS_KEY')
 AWS_STORAGE_BUCKET_NAME = os.environ.get('AWS_STORAGE_BUCKET_NAME')
 AWS_S3_CUSTOM_DOMAIN = f'{AWS_STORAGE_BUCKET_NAME}.s3.amazonaws.com'
 DEFAULT_FILE_STORAGE = 'storages.backends.s3boto3.S3Boto3Storage'
+AWS_S3_ENDPOINT_URL = os.environ.get('AWS_S3_ENDPOINT_URL') # 로컬 s3 대체 서버(moto server 등) 주소, 비워두면 실제 s3 사용
+AWS_S3_MAX_POOL_CONNECTIONS = 32 # 프로세스 공유 s3 클라이언트의 커넥션 풀 크기
+AWS_S3_MULTIPART_THRESHOLD = 8 * 1024 * 1024 # 이 크기(byte)보다 큰 파일은 멀티파트 업로드
+AWS_S3_MULTIPART_CHUNKSIZE = 8 * 1024 * 1024
+AWS_S3_MAX_CONCURRENCY = 4 # 멀티파트 업로드 시 동시에 전송할 청크 수
+IMAGE_UPLOAD_WORKERS = 4 # 회원가입 프로필 이미지 / 리사이즈 이미지 백그라운드 업로드 스레드 수
+IMAGE_VARIANT_SIZES = (128, 256, 512) # 업로드 때 미리 만들어두는 리사이즈 이미지 크기 (가로/세로 최대 px)
+IMAGE_VARIANT_FORMAT = 'WEBP' # 리사이즈 이미지 포맷 (WEBP / JPEG)
 
 
 # 로컬 환경에서는 True로 설정하고, 서버 환경에서는 False로 설정합니다.
@@ -43,6 +52,10 @@ CUSTOM_APPS = [
     'tier.apps.TierConfig',
     'image_url.apps.ImageUrlConfig',
     'matchtype.apps.MatchTypeConfig',
+    'point.apps.PointConfig',
+    'match.apps.MatchConfig',
+    'search.apps.SearchConfig',
+    'geo.apps.GeoConfig',
 ]
 
 
@@ -66,6 +79,7 @@ INSTALLED_APPS = CUSTOM_APPS + SYSTEM_APPS
 
 MIDDLEWARE = [
     'corsheaders.middleware.CorsMiddleware', # <- 가능한 높게 위치시켜야 한다.
+    'core.log_middleware.RequestMetricsMiddleware', # 요청별 SQL / 시리얼라이저 / 전체 시간 측정 및 쿼리 예산 검사
     'django.middleware.security.SecurityMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
@@ -73,9 +87,15 @@ MIDDLEWARE = [
     'django.contrib.auth.middleware.AuthenticationMiddleware',
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
-    'djangorestframework_camel_case.middleware.CamelCaseMiddleWare',
+    'core.middleware.CamelCaseMiddleware', # 쿼리 파라미터 snake_case 변환 (async 도 지원하는 CamelCaseMiddleWare)
 ]
 
+# 테스트 실행 중에는 뷰의 query_budget 초과 시 경고 대신 예외를 발생시켜 테스트를 실패시킨다
+TESTING = len(sys.argv) > 1 and sys.argv[1] == 'test'
+QUERY_BUDGET_STRICT = TESTING
+# 티어 / 종목 참조 캐시를 워커 첫 요청 때 미리 불러옴 (테스트에서는 요청별 쿼리 수가 달라지지 않도록 끔)
+REFERENCE_CACHE_WARM = not TESTING
+
 ROOT_URLCONF = 'config.urls'
 
 TEMPLATES = [
@@ -108,6 +128,25 @@ DATABASES = {
 }
 
 
+# Cache
+# 로컬 / 테스트 환경은 로컬 메모리 캐시, 서버 환경은 REDIS_URL 로 워커 간 공유 캐시 사용
+REDIS_URL = os.environ.get('REDIS_URL')
+
+if REDIS_URL:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+            'LOCATION': REDIS_URL,
+        }
+    }
+else:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        }
+    }
+
+
 # Password validation
 # https://docs.djangoproject.com/en/5.0/ref/settings/#auth-password-validators
 
@@ -160,7 +199,7 @@ AUTH_USER_MODEL = 'users.CustomUser'
 # jwt
 REST_FRAMEWORK = {
     'DEFAULT_AUTHENTICATION_CLASSES': (
-        'rest_framework_simplejwt.authentication.JWTAuthentication',
+        'users.authentication.CachedJWTAuthentication', # 유저 조회를 캐시하는 JWT 인증 (users/authentication.py)
     ),
      'DEFAULT_PARSER_CLASSES': (
         'djangorestframework_camel_case.parser.CamelCaseFormParser',
@@ -175,6 +214,10 @@ REST_FRAMEWORK = {
     ),
 }
 
+AUTH_USER_CACHE_TIMEOUT = 60 # JWT 인증 유저 캐시 유지 시간(초)
+LOGIN_HASH_WORKERS = 2 # 로그인 비밀번호 해시 전용 스레드 수 (로그인 동시 처리 한도)
+LOGIN_MAX_PENDING = 64 # 해시 대기열 최대 길이, 넘으면 429 응답
+
 SIMPLE_JWT = {
     'TOKEN_OBTAIN_SERIALIZER': 'users.serializers.CustomTokenObtainPairSerializer',
     'ACCESS_TOKEN_LIFETIME': timedelta(minutes=15),
@@ -26,6 +26,9 @@ urlpatterns = [
     path('api/v1/', include('users.urls')), # include를 활용하여 각 독립적인app의 urls.py 를 포함 시킴
     path('api/v1/', include('club.urls')),
     path('api/v1/', include('team.urls')),
+    path('api/v1/', include('point.urls')),
+    path('api/v1/', include('competition.urls')),
+    path('api/v1/', include('search.urls')),
 ]
 
 if settings.DEBUG:
@@ -1,3 +1,18 @@
 from django.contrib import admin
 
-# Register your models here.
+
+class SoftDeleteAdminMixin:
+    """
+    SoftDeleteModel 어드민 공통 mixin
+    선택 삭제 / 단건 삭제 모두 레코드별 save 대신 SoftDeleteQuerySet.soft_delete() 로
+    배치마다 UPDATE 1번 + 하위 레코드 cascade + soft_deleted 시그널 1번으로 처리
+    """
+    def delete_queryset(self, request, queryset):
+        queryset.soft_delete()
+
+    def delete_model(self, request, obj):
+        self.model.all_objects.filter(pk=obj.pk).soft_delete()
+
+
+class SoftDeleteAdmin(SoftDeleteAdminMixin, admin.ModelAdmin):
+    pass
@@ -4,3 +4,8 @@ from django.apps import AppConfig
 class CoreConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'core'
+
+    def ready(self):
+        from .log_middleware import install_query_recorder, install_serializer_timer
+        install_query_recorder()
+        install_serializer_timer()
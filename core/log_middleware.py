@@ -0,0 +1,166 @@
+import logging
+import time
+from contextvars import ContextVar
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.db import connections
+from django.db.backends.signals import connection_created
+from rest_framework.serializers import BaseSerializer
+
+
+logger = logging.getLogger(__name__)
+
+# 현재 요청의 측정값 (시리얼라이저 타이머가 요청 객체 없이 접근하기 위해 사용)
+_current_metrics = ContextVar('request_metrics', default=None)
+
+
+class QueryBudgetExceeded(Exception):
+    """
+    뷰에 선언된 query_budget 보다 많은 쿼리가 실행되었을 때 발생 (QUERY_BUDGET_STRICT 일 때만)
+    """
+
+
+class RequestMetrics:
+    """
+    요청 1건에 대한 SQL 쿼리 수, SQL 시간, 시리얼라이저 시간, 전체 처리 시간(초)
+    """
+    def __init__(self):
+        self.query_count = 0
+        self.sql_time = 0.0
+        self.serializer_time = 0.0
+        self.wall_time = 0.0
+        self._serializer_depth = 0
+
+    def __call__(self, execute, sql, params, many, context):
+        start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.query_count += 1
+            self.sql_time += time.perf_counter() - start
+
+
+def _record_query(execute, sql, params, many, context):
+    # 모든 DB 연결에 한번 등록되어 모든 SQL 실행을 감싼다 (DEBUG 여부와 상관없이 동작)
+    # 측정값은 ContextVar 로 찾으므로 ASGI 에서 sync_to_async 스레드로 넘어간 쿼리도 같은 요청에 집계된다
+    metrics = _current_metrics.get()
+    if metrics is None:
+        return execute(sql, params, many, context)
+    return metrics(execute, sql, params, many, context)
+
+
+def _add_query_recorder(connection, **kwargs):
+    if _record_query not in connection.execute_wrappers:
+        connection.execute_wrappers.append(_record_query)
+
+
+def install_query_recorder():
+    """
+    DB 연결마다 쿼리 측정 래퍼를 등록한다 (CoreConfig.ready 에서 1번 호출)
+    """
+    connection_created.connect(_add_query_recorder, dispatch_uid='core.log_middleware.query_recorder')
+    for connection in connections.all(initialized_only=True):
+        _add_query_recorder(connection)
+
+
+def _timed_data(fget):
+    def data(self):
+        metrics = _current_metrics.get()
+        # 측정 중이 아니거나, 다른 시리얼라이저 안에서 호출된 경우 중복 집계하지 않는다
+        if metrics is None or metrics._serializer_depth:
+            return fget(self)
+        metrics._serializer_depth += 1
+        start = time.perf_counter()
+        try:
+            return fget(self)
+        finally:
+            metrics._serializer_depth -= 1
+            metrics.serializer_time += time.perf_counter() - start
+
+    data._timed = True
+    return data
+
+
+def install_serializer_timer():
+    """
+    BaseSerializer.data 를 감싸서 시리얼라이저 직렬화 시간을 측정한다 (CoreConfig.ready 에서 1번 호출)
+    지연 로딩으로 발생하는 SQL 시간도 시리얼라이저 시간에 포함된다.
+    """
+    fget = BaseSerializer.data.fget
+    if getattr(fget, '_timed', False):
+        return
+    BaseSerializer.data = property(_timed_data(fget))
+
+
+class RequestMetricsMiddleware:
+    """
+    요청마다 SQL 쿼리 수 / SQL 시간 / 시리얼라이저 시간 / 전체 시간을 URL name 기준으로 기록하는 미들웨어
+
+    뷰 클래스에 query_budget 이 선언되어 있으면 쿼리 수를 검사해서
+    운영 환경에서는 경고 로그를 남기고, QUERY_BUDGET_STRICT(테스트) 에서는 예외를 발생시킨다.
+    """
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        # 미들웨어 체인이 모두 async 를 지원하면 ASGI 에서 async 로 실행된다 (async 뷰가 요청 스레드를 막지 않음)
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        metrics, token, start = self.start(request)
+        try:
+            response = self.get_response(request)
+        finally:
+            _current_metrics.reset(token)
+        return self.finish(request, response, metrics, start)
+
+    async def __acall__(self, request):
+        metrics, token, start = self.start(request)
+        try:
+            response = await self.get_response(request)
+        finally:
+            _current_metrics.reset(token)
+        return self.finish(request, response, metrics, start)
+
+    def start(self, request):
+        metrics = RequestMetrics()
+        request.metrics = metrics
+        return metrics, _current_metrics.set(metrics), time.perf_counter()
+
+    def finish(self, request, response, metrics, start):
+        metrics.wall_time = time.perf_counter() - start
+
+        url_name = request.resolver_match.url_name if request.resolver_match else None
+        logger.info(
+            '%s %s [%s] status=%s queries=%d sql=%.1fms serializer=%.1fms wall=%.1fms',
+            request.method, request.path, url_name, response.status_code, metrics.query_count,
+            metrics.sql_time * 1000, metrics.serializer_time * 1000, metrics.wall_time * 1000,
+        )
+        if settings.DEBUG:
+            response['Server-Timing'] = (
+                f'sql;dur={metrics.sql_time * 1000:.1f}, '
+                f'serializer;dur={metrics.serializer_time * 1000:.1f}, '
+                f'total;dur={metrics.wall_time * 1000:.1f}'
+            )
+
+        self.check_query_budget(request, url_name, metrics)
+        return response
+
+    def check_query_budget(self, request, url_name, metrics):
+        view_func = getattr(request.resolver_match, 'func', None)
+        budget = getattr(getattr(view_func, 'view_class', None), 'query_budget', None)
+        if budget is None or metrics.query_count <= budget:
+            return
+
+        message = (
+            f'{request.method} {request.path} [{url_name}] '
+            f'쿼리 예산 초과: {metrics.query_count}회 실행 (예산 {budget}회)'
+        )
+        if getattr(settings, 'QUERY_BUDGET_STRICT', False):
+            raise QueryBudgetExceeded(message)
+        logger.warning(message)
@@ -0,0 +1,68 @@
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+from club.models import Club
+from users.models import CustomUser
+
+
+class Rollback(Exception):
+    pass
+
+
+class Command(BaseCommand):
+    """
+    삭제된 레코드가 80% 인 테이블에서 is_deleted 복합 인덱스 유무에 따른 살아있는 레코드 조회 비교
+    벤치마크 데이터는 트랜잭션 안에서 만들고 끝나면 롤백한다.
+        python manage.py benchmark_soft_delete --rows 200000
+    """
+    help = 'soft delete 인덱스 벤치마크'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--rows', type=int, default=200000, help='생성할 유저 수')
+        parser.add_argument('--clubs', type=int, default=100)
+        parser.add_argument('--deleted-ratio', type=float, default=0.8)
+        parser.add_argument('--repeat', type=int, default=200, help='조회 반복 횟수')
+
+    def handle(self, *args, **options):
+        try:
+            with transaction.atomic():
+                self.run(options)
+                raise Rollback()
+        except Rollback:
+            pass
+
+    def run(self, options):
+        clubs = Club.objects.bulk_create([Club(name=f'bench-{i}') for i in range(options['clubs'])])
+        deleted_every = round(1 / (1 - options['deleted_ratio']))
+        CustomUser.objects.bulk_create([
+            CustomUser(
+                phone=f'bench-{i}', username='bench', birth=1990, gender='male',
+                club=clubs[i % len(clubs)], is_deleted=i % deleted_every != 0,
+            )
+            for i in range(options['rows'])
+        ], batch_size=5000)
+        with connection.cursor() as cursor:
+            cursor.execute(f'ANALYZE {CustomUser._meta.db_table}')
+
+        club = clubs[0]
+        queryset = CustomUser.objects.filter(club=club).values_list('id', flat=True)
+        self.stdout.write(f'유저 {options["rows"]}명 (삭제 비율 {options["deleted_ratio"]:.0%})')
+
+        self.measure('복합 인덱스 사용', queryset, options['repeat'])
+
+        # 같은 트랜잭션 안에서 인덱스를 지우고 다시 측정 (롤백되므로 실제로 지워지지 않음)
+        with connection.cursor() as cursor:
+            for index in CustomUser._meta.indexes:
+                cursor.execute(f'DROP INDEX {connection.ops.quote_name(index.name)}')
+        # (sqlite 는 같은 SQL 의 EXPLAIN 결과를 재사용하므로 두번째 측정은 실행계획을 출력하지 않음)
+        self.measure('club FK 인덱스만 사용', queryset, options['repeat'], explain=False)
+
+    def measure(self, label, queryset, repeat, explain=True):
+        start = time.perf_counter()
+        for _ in range(repeat):
+            rows = len(queryset.all())
+        elapsed = (time.perf_counter() - start) / repeat
+        self.stdout.write(f'\n[{label}] 살아있는 유저 {rows}명 조회 평균 {elapsed * 1000:.2f}ms')
+        if explain:
+            self.stdout.write(queryset.all().explain())
@@ -0,0 +1,38 @@
+from django.apps import apps
+from django.db import models, transaction
+from django.utils import timezone
+from .signals import soft_deleted
+
+
+class SoftDeleteQuerySet(models.QuerySet):
+    def soft_delete(self, batch_size=1000):
+        """
+        쿼리셋 전체를 batch_size 개씩 UPDATE 1번으로 soft delete 하고 삭제된 레코드 수를 반환
+
+        레코드별 save / post_save 대신 배치마다 soft_deleted 시그널을 1번 보내고,
+        모델의 SOFT_DELETE_CASCADE 에 선언된 하위 레코드(예: 클럽의 코치 / 팀)도 같은 방식으로 함께 삭제한다.
+        """
+        model = self.model
+        pks = list(self.filter(is_deleted=False).values_list('pk', flat=True))
+        changes = {'is_deleted': True}
+        if any(field.name == 'updated_at' for field in model._meta.concrete_fields):
+            changes['updated_at'] = timezone.now()
+
+        for start in range(0, len(pks), batch_size):
+            batch = pks[start:start + batch_size]
+            with transaction.atomic():
+                model.all_objects.filter(pk__in=batch).update(**changes)
+                for related_label, field_name in getattr(model, 'SOFT_DELETE_CASCADE', ()):
+                    related_model = apps.get_model(related_label)
+                    related_model.all_objects.filter(**{f'{field_name}__in': batch}).soft_delete(batch_size)
+                soft_deleted.send(sender=model, pks=batch)
+        return len(pks)
+
+
+class SoftDeleteManager(models.Manager.from_queryset(SoftDeleteQuerySet)):
+    """
+    soft delete 된(is_deleted=True) 레코드를 제외하는 기본 매니저
+    삭제된 레코드까지 조회해야 할 때는 all_objects 매니저를 사용
+    """
+    def get_queryset(self):
+        return super().get_queryset().filter(is_deleted=False)
@@ -0,0 +1,30 @@
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from djangorestframework_camel_case.settings import api_settings
+from djangorestframework_camel_case.util import underscoreize
+
+
+class CamelCaseMiddleware:
+    """
+    djangorestframework_camel_case.middleware.CamelCaseMiddleWare 와 같이 쿼리 파라미터를 snake_case 로 바꾸는 미들웨어
+    원본은 sync 전용이라 ASGI 에서 체인 전체가 sync 로 실행되므로 (async 뷰도 요청 스레드를 막음) async 도 지원하도록 다시 구현
+    """
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        self.underscoreize_query(request)
+        return self.get_response(request)
+
+    async def __acall__(self, request):
+        self.underscoreize_query(request)
+        return await self.get_response(request)
+
+    def underscoreize_query(self, request):
+        request.GET = underscoreize(request.GET, **api_settings.JSON_UNDERSCOREIZE)
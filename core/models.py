@@ -1,4 +1,5 @@
 from django.db import models
+from .manager import SoftDeleteManager, SoftDeleteQuerySet
 
 
 class TimeStampedModel(models.Model): # 테이블에 생성시간 , 수정시간 기능을 넣어주기 위한 공통 모델
@@ -13,6 +14,12 @@ class TimeStampedModel(models.Model): # 테이블에 생성시간 , 수정시간
 class SoftDeleteModel(models.Model): # soft delete 모델 (레코드를 실제로 데이터베이스에서 삭제하지 않고, 삭제된 것으로 표시하여 나중에 복구할 수 있는 기능을 구현할 수 있음)
     is_deleted = models.BooleanField(default=False) # 대회 생성했다가 삭제, 경기기록 삭제, 유저 탈퇴, admin 부분에서 삭제기능 진행 (soft delete)
 
+    objects = SoftDeleteManager() # 기본 매니저: 삭제되지 않은 레코드만 조회
+    all_objects = SoftDeleteQuerySet.as_manager() # 삭제된 레코드까지 모두 조회
+
+    # 쿼리셋 soft_delete() 시 함께 삭제할 하위 레코드 (('앱.모델', '이 모델을 가리키는 FK 필드명'), ...)
+    SOFT_DELETE_CASCADE = ()
+
     def delete(self, *args, **kwargs):
         self.is_deleted = True
         self.save()
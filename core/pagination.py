@@ -0,0 +1,24 @@
+from rest_framework.pagination import CursorPagination
+
+
+class IdCursorPagination(CursorPagination):
+    """
+    pk 순서 커서(keyset) 페이지네이션
+    OFFSET 을 쓰지 않고 "id > 마지막 id" 로 다음 페이지를 조회하므로 얼마나 뒤 페이지든 조회 비용이 같다.
+    (필터 컬럼 + id 로 구성된 인덱스가 있어야 정렬 없이 인덱스 범위 조회로 처리됨)
+    """
+    ordering = 'id'
+    page_size = 50
+    page_size_query_param = 'page_size'
+    max_page_size = 100
+
+
+class StartDateCursorPagination(CursorPagination):
+    """
+    시작일 순서 커서(keyset) 페이지네이션 (같은 시작일은 id 순)
+    커서에 마지막 시작일을 담아서 "start_date > 마지막 시작일" 로 다음 페이지를 조회한다. (start_date 가 null 인 행은 제외해야 함)
+    """
+    ordering = ('start_date', 'id')
+    page_size = 20
+    page_size_query_param = 'page_size'
+    max_page_size = 100
@@ -0,0 +1,86 @@
+import threading
+import time
+from types import MappingProxyType
+
+from django.conf import settings
+from django.core.cache import cache
+from django.core.signals import request_started
+
+
+class ReferenceCache:
+    """
+    거의 바뀌지 않는 작은 참조 테이블(티어 / 종목)을 id 로 바로 찾을 수 있게 프로세스 메모리에 들고 있는 캐시
+
+    조회할 때마다 공유 캐시를 보지 않고 check_interval 초마다 한번 버전 키만 확인해서,
+    다른 프로세스에서 저장되어 버전이 바뀌었으면 테이블 전체를 다시 불러온다. (요청마다 DB / 캐시 조회 없음)
+    불러온 매핑은 읽기 전용이며, 들어있는 모델 인스턴스도 수정하지 않고 읽기만 해야 한다.
+    """
+    def __init__(self, get_queryset, version_key, check_interval=5):
+        self.get_queryset = get_queryset
+        self.version_key = version_key
+        self.check_interval = check_interval
+        self.items = MappingProxyType({})
+        self.version = None
+        self.checked_at = 0
+        self._lock = threading.Lock()
+
+    def get(self, pk):
+        if pk is None:
+            return None
+        return self.all().get(pk)
+
+    def all(self):
+        if time.monotonic() - self.checked_at > self.check_interval:
+            version = self._get_version()
+            if version != self.version:
+                self.load(version)
+            self.checked_at = time.monotonic()
+        return self.items
+
+    def warm(self):
+        self.load(self._get_version())
+        self.checked_at = time.monotonic()
+
+    def warm_on_first_request(self):
+        """
+        AppConfig.ready 에서 호출, 워커의 첫 요청이 시작될 때 미리 불러온다
+        (앱 초기화 중에는 DB 에 접근하지 않기 위해 첫 요청까지 미룸)
+        """
+        if getattr(settings, 'REFERENCE_CACHE_WARM', True):
+            request_started.connect(self._warm_once, weak=False, dispatch_uid=self.version_key)
+
+    def _warm_once(self, **kwargs):
+        request_started.disconnect(dispatch_uid=self.version_key)
+        if self.version is None:
+            self.warm()
+
+    def load(self, version):
+        with self._lock:
+            if version == self.version:
+                return
+            self.items = MappingProxyType({item.pk: item for item in self.get_queryset()})
+            self.version = version
+
+    def bump_version(self):
+        """
+        참조 테이블이 바뀐 뒤(커밋 후) 호출, 모든 프로세스가 check_interval 안에 다시 불러온다
+        """
+        if not cache.add(self.version_key, 1, None):
+            try:
+                cache.incr(self.version_key)
+            except ValueError:
+                cache.set(self.version_key, 1, None)
+
+    def clear(self):
+        with self._lock:
+            self.items = MappingProxyType({})
+            self.version = None
+            self.checked_at = 0
+
+    def _get_version(self):
+        version = cache.get(self.version_key)
+        if version is None:
+            # 캐시에서 사라졌으면 새 버전으로 시작해서 모든 프로세스가 다시 불러오도록 함
+            cache.add(self.version_key, int(time.time() * 1000), None)
+            version = cache.get(self.version_key)
+        return version
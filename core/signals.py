@@ -0,0 +1,6 @@
+from django.dispatch import Signal
+
+
+# SoftDeleteQuerySet.soft_delete() 로 여러 레코드가 한번에 soft delete 되었을 때 배치마다 1번 발생
+# (UPDATE 로 처리하므로 레코드별 post_save 가 발생하지 않음) sender=모델, pks=삭제된 pk 목록
+soft_deleted = Signal()
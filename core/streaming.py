@@ -0,0 +1,42 @@
+from itertools import islice
+
+from django.http import StreamingHttpResponse
+from djangorestframework_camel_case.settings import api_settings as camel_case_settings
+from djangorestframework_camel_case.util import camelize
+from rest_framework.settings import api_settings
+from rest_framework.utils.encoders import JSONEncoder
+
+
+class StreamingJSONListResponse(StreamingHttpResponse):
+    """
+    쿼리셋을 chunk_size 개씩 읽어서 직렬화한 JSON 배열을 조금씩 내보내는 응답
+
+    전체 목록을 메모리에 만들지 않으므로 결과가 아무리 커도 워커 메모리가 일정하게 유지된다.
+    키는 CamelCaseJSONRenderer 와 같은 규칙으로 camelCase 로 변환한다.
+    """
+    def __init__(self, queryset, serializer_class, chunk_size=500, **kwargs):
+        kwargs.setdefault('content_type', 'application/json')
+        super().__init__(self.stream(queryset, serializer_class, chunk_size), **kwargs)
+
+    @staticmethod
+    def stream(queryset, serializer_class, chunk_size):
+        encoder = JSONEncoder(
+            ensure_ascii=not api_settings.UNICODE_JSON,
+            separators=(',', ':') if api_settings.COMPACT_JSON else (', ', ': '),
+            allow_nan=not api_settings.STRICT_JSON,
+        )
+        rows = queryset.iterator(chunk_size=chunk_size)
+        separator = ''
+        yield '['
+        while True:
+            chunk = list(islice(rows, chunk_size))
+            if not chunk:
+                break
+            data = camelize(serializer_class(chunk, many=True).data, **camel_case_settings.JSON_UNDERSCOREIZE)
+            yield separator + ','.join(encoder.encode(item) for item in data)
+            separator = ','
+        yield ']'
+
+
+def is_stream_requested(request):
+    return request.query_params.get('stream', '').lower() in ('1', 'true')
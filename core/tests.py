@@ -1,3 +1,170 @@
-from django.test import TestCase
+import json
+from unittest import mock
 
-# Create your tests here.
+from asgiref.sync import async_to_sync
+from django.contrib import admin
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from rest_framework.test import APIClient
+from club.models import Club
+from club.views import ClubDetailView
+from club.serializers import TeamSerializer
+from coach.models import Coach
+from team.models import Team
+from users.models import CustomUser
+from .log_middleware import QueryBudgetExceeded
+from .signals import soft_deleted
+from .streaming import StreamingJSONListResponse
+
+
+class RequestMetricsMiddlewareTest(TestCase):
+    """
+    core.log_middleware.RequestMetricsMiddleware 측정값 / 쿼리 예산 검사 테스트
+    """
+    def setUp(self):
+        self.client = APIClient()
+        self.club = Club.objects.create(name='테스트클럽')
+        self.url = reverse('club-detail', kwargs={'pk': self.club.pk})
+
+    def test_records_request_metrics(self):
+        response = self.client.get(self.url)
+
+        metrics = response.wsgi_request.metrics
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(metrics.query_count, 4)
+        self.assertGreater(metrics.sql_time, 0)
+        self.assertGreater(metrics.serializer_time, 0)
+        self.assertGreaterEqual(metrics.wall_time, metrics.sql_time)
+
+    def test_records_metrics_under_asgi(self):
+        # ASGI 에서는 뷰의 쿼리가 sync_to_async 스레드에서 실행되어도 같은 요청으로 집계된다
+        response = async_to_sync(self.async_client.get)(self.url)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.asgi_request.metrics.query_count, 4)
+
+    def test_budget_exceeded_fails_in_strict_mode(self):
+        with mock.patch.object(ClubDetailView, 'query_budget', 1):
+            with self.assertRaises(QueryBudgetExceeded):
+                self.client.get(self.url)
+
+    @override_settings(QUERY_BUDGET_STRICT=False)
+    def test_budget_exceeded_logs_warning_in_production(self):
+        with mock.patch.object(ClubDetailView, 'query_budget', 1):
+            with self.assertLogs('core.log_middleware', level='WARNING') as logs:
+                response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertIn('club-detail', logs.output[0])
+
+
+class SoftDeleteManagerTest(TestCase):
+    """
+    SoftDeleteManager 기본 매니저 / all_objects 테스트
+    """
+    def setUp(self):
+        self.client = APIClient()
+        self.club = Club.objects.create(name='삭제될클럽')
+        self.user = CustomUser.objects.create_user(
+            phone='01000000000', password='password1234!', username='탈퇴유저', birth=1990, gender='male',
+        )
+        self.club.delete()
+        self.user.delete()
+
+    def test_default_manager_excludes_deleted_rows(self):
+        self.assertFalse(Club.objects.filter(pk=self.club.pk).exists())
+        self.assertTrue(Club.all_objects.filter(pk=self.club.pk).exists())
+        self.assertFalse(CustomUser.objects.filter(pk=self.user.pk).exists())
+        self.assertTrue(CustomUser.all_objects.filter(pk=self.user.pk).exists())
+
+    def test_detail_views_return_404_for_deleted_rows(self):
+        response = self.client.get(reverse('club-detail', kwargs={'pk': self.club.pk}))
+        self.assertEqual(response.status_code, 404)
+
+        response = self.client.get(reverse('user-detail', kwargs={'pk': self.user.pk}))
+        self.assertEqual(response.status_code, 404)
+
+    def test_deleted_users_phone_cannot_be_reused(self):
+        response = self.client.post(reverse('signup'), {
+            'phone': '01000000000', 'password': 'password1234!', 'username': '새유저', 'birth': 1990, 'gender': 'male',
+        }, format='json')
+
+        self.assertEqual(response.status_code, 400)
+        self.assertIn('phone', response.data['errors'])
+
+
+class SoftDeleteQuerySetTest(TestCase):
+    """
+    일괄 soft delete (UPDATE + cascade + 배치 시그널) 테스트
+    """
+    def setUp(self):
+        self.clubs = [Club.objects.create(name=f'클럽{i}') for i in range(3)]
+        for club in self.clubs:
+            Team.objects.create(name='팀', club=club)
+        self.users = CustomUser.objects.bulk_create([
+            CustomUser(phone=f'0100000000{i}', username='유저', birth=1990, gender='male', club=self.clubs[0])
+            for i in range(5)
+        ])
+        Coach.objects.create(club=self.clubs[0], user=self.users[0])
+
+    def test_soft_delete_cascades_to_coaches_and_teams(self):
+        deleted = Club.objects.filter(pk__in=[self.clubs[0].pk, self.clubs[1].pk]).soft_delete()
+
+        self.assertEqual(deleted, 2)
+        self.assertEqual(list(Club.objects.values_list('pk', flat=True)), [self.clubs[2].pk])
+        self.assertEqual(list(Team.objects.values_list('club', flat=True)), [self.clubs[2].pk])
+        self.assertFalse(Coach.objects.exists())
+        self.assertTrue(Coach.all_objects.get().is_deleted)
+
+    def test_soft_delete_sends_one_signal_per_batch(self):
+        received = []
+
+        def receiver(sender, pks, **kwargs):
+            received.append((sender, sorted(pks)))
+
+        soft_deleted.connect(receiver, sender=CustomUser)
+        self.addCleanup(soft_deleted.disconnect, receiver, sender=CustomUser)
+        with mock.patch.object(CustomUser, 'save') as save:
+            CustomUser.objects.all().soft_delete(batch_size=3)
+
+        save.assert_not_called()
+        self.assertEqual(received, [
+            (CustomUser, [user.pk for user in self.users[:3]]),
+            (CustomUser, [user.pk for user in self.users[3:]]),
+        ])
+        self.assertFalse(CustomUser.objects.exists())
+
+    def test_admin_delete_queryset_uses_soft_delete(self):
+        model_admin = admin.site._registry[CustomUser]
+
+        # 유저 수와 상관없이 pk 조회 / UPDATE / 코치 pk 조회 / 코치 UPDATE / 인증 캐시 키용 비밀번호 조회 / 검색 문서 DELETE + savepoint 4
+        with self.assertNumQueries(10):
+            model_admin.delete_queryset(None, CustomUser.objects.all())
+
+        self.assertEqual(CustomUser.all_objects.filter(is_deleted=True).count(), 5)
+
+
+class StreamingJSONListResponseTest(TestCase):
+    """
+    스트리밍 JSON 응답이 chunk 단위로 조회 / 직렬화되는지 확인하는 테스트
+    """
+    def setUp(self):
+        club = Club.objects.create(name='테스트클럽')
+        Team.objects.bulk_create([Team(name=f'팀{i}', club=club) for i in range(25)])
+
+    def test_rows_are_streamed_per_chunk(self):
+        response = StreamingJSONListResponse(Team.objects.order_by('id'), TeamSerializer, chunk_size=10)
+
+        # SQLite 는 서버 사이드 커서가 없어 iterator 가 chunk_size 만큼씩 가져온다
+        with self.assertNumQueries(1):
+            chunks = [chunk for chunk in response.streaming_content]
+
+        self.assertEqual(len(chunks), 5) # '[' + 10 / 10 / 5 행 + ']'
+        rows = json.loads(b''.join(chunks))
+        self.assertEqual([row['name'] for row in rows], [f'팀{i}' for i in range(25)])
+        self.assertIn('imageUrl', rows[0])
+
+    def test_empty_queryset_is_empty_array(self):
+        response = StreamingJSONListResponse(Team.objects.none(), TeamSerializer)
+
+        self.assertEqual(b''.join(response.streaming_content), b'[]')
@@ -1,3 +1,31 @@
-from django.shortcuts import render
+from rest_framework.views import APIView
+from rest_framework.response import Response
+from .pagination import IdCursorPagination
+from .streaming import StreamingJSONListResponse, is_stream_requested
 
-# Create your views here.
+
+class SubResourceListView(APIView):
+    """
+    상위 리소스(클럽 / 팀 등)에 속한 목록을 조회하는 공통 API
+    기본은 커서(keyset) 페이지네이션, ?stream=1 이면 전체 목록을 스트리밍 JSON 배열로 응답
+    """
+    parent_model = None
+    not_found_message = '해당 리소스가 존재하지 않습니다.'
+    pagination_class = IdCursorPagination
+    serializer_class = None
+
+    def get_queryset(self, parent_id):
+        raise NotImplementedError
+
+    def get(self, request, pk):
+        if not self.parent_model.objects.filter(pk=pk).exists():
+            return Response({'error': self.not_found_message}, status=404)
+
+        queryset = self.get_queryset(pk)
+        if is_stream_requested(request):
+            return StreamingJSONListResponse(queryset.order_by(self.pagination_class.ordering), self.serializer_class)
+
+        paginator = self.pagination_class()
+        page = paginator.paginate_queryset(queryset, request, view=self)
+        serializer = self.serializer_class(page, many=True)
+        return paginator.get_paginated_response(serializer.data)
@@ -0,0 +1,97 @@
+import csv
+import functools
+import re
+from pathlib import Path
+
+from django.db import transaction
+from .geohash import encode
+
+
+# 시 / 도 / 시군구 대표 좌표(시청 / 구청 부근) 표 (외부 지오코딩 API 없이 주소를 좌표로 바꾸기 위한 로컬 표)
+AREAS_PATH = Path(__file__).resolve().parent / 'data' / 'areas.csv'
+
+_METROPOLITAN = ('서울', '부산', '대구', '인천', '광주', '대전', '울산', '세종')
+# 주소에 쓰이는 시 / 도 표기 -> areas.csv 의 시 / 도 이름
+SIDO_ALIASES = {
+    **{name: name for name in _METROPOLITAN},
+    **{f'{name}시': name for name in _METROPOLITAN},
+    '서울특별시': '서울', '세종특별자치시': '세종',
+    **{f'{name}광역시': name for name in ('부산', '대구', '인천', '광주', '대전', '울산')},
+    '경기': '경기', '경기도': '경기',
+    '강원': '강원', '강원도': '강원', '강원특별자치도': '강원',
+    '충북': '충북', '충청북도': '충북',
+    '충남': '충남', '충청남도': '충남',
+    '전북': '전북', '전라북도': '전북', '전북특별자치도': '전북',
+    '전남': '전남', '전라남도': '전남',
+    '경북': '경북', '경상북도': '경북',
+    '경남': '경남', '경상남도': '경남',
+    '제주': '제주', '제주도': '제주', '제주특별자치도': '제주',
+}
+_PUNCTUATION = re.compile(r'[,()\[\]]')
+
+
+@functools.cache
+def load_areas():
+    """
+    (시 / 도, 시군구) -> (위도, 경도), 시군구 이름 -> 그 이름이 있는 시 / 도 목록
+    시군구가 빈 문자열인 행은 시 / 도 대표 좌표
+    """
+    areas = {}
+    sidos_by_sigungu = {}
+    with open(AREAS_PATH, encoding='utf-8') as f:
+        for row in csv.DictReader(f):
+            areas[(row['sido'], row['sigungu'])] = (float(row['latitude']), float(row['longitude']))
+            if row['sigungu']:
+                sidos_by_sigungu.setdefault(row['sigungu'], []).append(row['sido'])
+    return areas, sidos_by_sigungu
+
+
+def geocode(address):
+    """
+    주소를 (위도, 경도) 로 변환, 찾을 수 없으면 None
+    표에 있는 가장 좁은 지역(시군구 > 시 / 도)의 대표 좌표를 반환한다. (시 / 도 없이 쓴 시군구는 이름이 1곳에만 있을 때만 인정)
+    """
+    if not address:
+        return None
+    areas, sidos_by_sigungu = load_areas()
+    tokens = _PUNCTUATION.sub(' ', address).split()
+
+    sido = next((SIDO_ALIASES[token] for token in tokens[:2] if token in SIDO_ALIASES), None)
+    for token in tokens:
+        candidates = [name for name in sidos_by_sigungu.get(token, ()) if sido in (None, name)]
+        if len(candidates) == 1:
+            return areas[(candidates[0], token)]
+    if sido:
+        return areas[(sido, '')]
+    return None
+
+
+def geocode_model(model, batch_size=1000, refresh=False):
+    """
+    model(GeoPointModel) 의 address 로 좌표 / geohash 를 채운다 (기본: 아직 좌표가 없는 레코드만, refresh 면 전체)
+    같은 지역은 같은 대표 좌표가 되므로 배치마다 좌표별로 묶어서 UPDATE 1번씩 실행한다.
+    반환값: (확인한 레코드 수, 좌표를 찾은 레코드 수)
+    """
+    queryset = model.objects.exclude(address__isnull=True).exclude(address='')
+    if not refresh:
+        queryset = queryset.filter(geohash__isnull=True)
+    checked = located = 0
+    last_pk = 0
+    while True:
+        rows = list(queryset.filter(pk__gt=last_pk).order_by('pk').values_list('pk', 'address')[:batch_size])
+        if not rows:
+            return checked, located
+        last_pk = rows[-1][0]
+        checked += len(rows)
+
+        groups = {}
+        for pk, address in rows:
+            location = geocode(address)
+            if location:
+                groups.setdefault(location, []).append(pk)
+        with transaction.atomic():
+            for (latitude, longitude), pks in groups.items():
+                model.all_objects.filter(pk__in=pks).update(
+                    latitude=latitude, longitude=longitude, geohash=encode(latitude, longitude),
+                )
+                located += len(pks)
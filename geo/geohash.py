@@ -0,0 +1,74 @@
+import math
+
+
+BASE32 = '0123456789bcdefghjkmnpqrstuvwxyz'
+PRECISION = 9 # 저장할 때의 geohash 길이 (약 5m)
+EARTH_RADIUS_KM = 6371.0088
+KM_PER_DEGREE = 111.32
+
+
+def encode(latitude, longitude, precision=PRECISION):
+    """
+    위도 / 경도를 geohash 문자열로 변환 (앞부분이 같을수록 가까운 칸)
+    """
+    lat_range, lng_range = [-90.0, 90.0], [-180.0, 180.0]
+    chars = []
+    bits = value = 0
+    even = True # 경도 비트부터 번갈아 가며 범위를 반으로 나눈다
+    while len(chars) < precision:
+        target, coord = (lng_range, longitude) if even else (lat_range, latitude)
+        mid = (target[0] + target[1]) / 2
+        value <<= 1
+        if coord >= mid:
+            value |= 1
+            target[0] = mid
+        else:
+            target[1] = mid
+        even = not even
+        bits += 1
+        if bits == 5:
+            chars.append(BASE32[value])
+            bits = value = 0
+    return ''.join(chars)
+
+
+def cell_size(precision):
+    """
+    geohash 길이별 칸 크기 (위도 각도, 경도 각도)
+    """
+    lng_bits = (5 * precision + 1) // 2
+    lat_bits = 5 * precision // 2
+    return 180.0 / 2 ** lat_bits, 360.0 / 2 ** lng_bits
+
+
+def covering_prefixes(latitude, longitude, radius_km, max_cells=16):
+    """
+    중심에서 radius_km 안쪽(경계 사각형)을 덮는 geohash 칸 목록
+    칸 수가 max_cells 이하인 가장 작은 칸 크기를 골라서, 칸마다 인덱스 범위 조회 1번으로 후보를 찾을 수 있게 한다.
+    (날짜 변경선 / 극지방 근처의 경계는 고려하지 않음)
+    """
+    dlat = radius_km / KM_PER_DEGREE
+    dlng = radius_km / (KM_PER_DEGREE * max(math.cos(math.radians(latitude)), 0.01))
+    min_lat, max_lat = max(latitude - dlat, -90.0), min(latitude + dlat, 90.0)
+    min_lng, max_lng = max(longitude - dlng, -180.0), min(longitude + dlng, 180.0)
+
+    for precision in range(PRECISION, 0, -1):
+        cell_lat, cell_lng = cell_size(precision)
+        rows = range(math.floor((min_lat + 90) / cell_lat), math.floor((max_lat + 90) / cell_lat) + 1)
+        cols = range(math.floor((min_lng + 180) / cell_lng), math.floor((max_lng + 180) / cell_lng) + 1)
+        if len(rows) * len(cols) <= max_cells:
+            break
+    return sorted({
+        # 칸의 중심 좌표로 칸의 geohash 를 구함
+        encode(min((row + 0.5) * cell_lat - 90, 90.0), min((col + 0.5) * cell_lng - 180, 180.0), precision)
+        for row in rows for col in cols
+    })
+
+
+def distance_km(lat1, lng1, lat2, lng2):
+    """
+    두 좌표 사이의 거리 (haversine, km)
+    """
+    lat1, lng1, lat2, lng2 = map(math.radians, (lat1, lng1, lat2, lng2))
+    a = math.sin((lat2 - lat1) / 2) ** 2 + math.cos(lat1) * math.cos(lat2) * math.sin((lng2 - lng1) / 2) ** 2
+    return 2 * EARTH_RADIUS_KM * math.asin(math.sqrt(a))
@@ -0,0 +1,30 @@
+import time
+
+from django.core.management.base import BaseCommand
+from club.models import Club
+from competition.models import Competition
+from geo.geocoder import geocode_model
+
+
+class Command(BaseCommand):
+    """
+    클럽 / 대회 주소를 로컬 지역 좌표표(geo/data/areas.csv)로 좌표 / geohash 로 변환해서 저장
+    주소가 바뀐 뒤나 cron 등으로 주기적으로 실행 (--refresh 면 이미 좌표가 있는 레코드도 다시 계산)
+        python manage.py geocode_addresses --model club
+    """
+    help = '주소 -> 좌표 변환 (근처 검색용)'
+
+    MODELS = {'club': Club, 'competition': Competition}
+
+    def add_arguments(self, parser):
+        parser.add_argument('--model', choices=sorted(self.MODELS), action='append', help='변환할 모델 (기본: 전체)')
+        parser.add_argument('--batch-size', type=int, default=1000, help='한번에 변환할 레코드 수')
+        parser.add_argument('--refresh', action='store_true', help='좌표가 있는 레코드도 다시 계산')
+
+    def handle(self, *args, **options):
+        for name in options['model'] or sorted(self.MODELS):
+            start = time.perf_counter()
+            checked, located = geocode_model(
+                self.MODELS[name], batch_size=options['batch_size'], refresh=options['refresh'],
+            )
+            self.stdout.write(f'{name} {checked}개 확인, 좌표 {located}개 저장 ({time.perf_counter() - start:.1f}s)')
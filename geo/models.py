@@ -0,0 +1,16 @@
+from django.db import models
+from .geohash import encode
+
+
+class GeoPointModel(models.Model): # 위치(위도 / 경도) 공통 모델 (주소는 각 모델에, 좌표는 geocode_addresses 로 채움)
+    latitude = models.FloatField(blank=True, null=True)
+    longitude = models.FloatField(blank=True, null=True)
+    geohash = models.CharField(max_length=12, blank=True, null=True) # 근처 검색용 (앞부분이 같으면 가까운 위치, 각 모델에서 인덱스 선언)
+
+    def set_location(self, latitude, longitude):
+        self.latitude = latitude
+        self.longitude = longitude
+        self.geohash = encode(latitude, longitude) if latitude is not None and longitude is not None else None
+
+    class Meta:
+        abstract = True
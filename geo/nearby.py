@@ -0,0 +1,21 @@
+from django.db.models import Q
+from .geohash import covering_prefixes, distance_km
+
+
+def find_nearby(queryset, latitude, longitude, radius_km, limit):
+    """
+    queryset(GeoPointModel) 에서 중심으로부터 radius_km 안에 있는 레코드를 가까운 순으로 limit 개 찾는다
+    geohash 칸마다 인덱스 범위 조회로 후보의 (id, 좌표) 만 읽고, 정확한 거리 계산 / 정렬은 후보에만 한다.
+    반환값: [(id, 거리 km), ...]
+    """
+    ranges = Q()
+    for prefix in covering_prefixes(latitude, longitude, radius_km):
+        # geohash 문자는 0-9 / b-z 이므로 prefix ~ prefix + '~' 가 해당 칸 전체 (LIKE 는 SQLite 에서 인덱스를 타지 않음)
+        ranges |= Q(geohash__gte=prefix, geohash__lt=prefix + '~')
+    hits = []
+    for pk, lat, lng in queryset.filter(ranges).values_list('pk', 'latitude', 'longitude'):
+        distance = distance_km(latitude, longitude, lat, lng)
+        if distance <= radius_km:
+            hits.append((distance, pk))
+    hits.sort()
+    return [(pk, distance) for distance, pk in hits[:limit]]
@@ -0,0 +1,97 @@
+from django.core.management import call_command
+from django.db import connection
+from django.test import TestCase
+from django.urls import reverse
+from rest_framework.test import APIClient
+from club.models import Club
+from competition.models import Competition
+from .geocoder import geocode
+from .geohash import covering_prefixes, distance_km, encode
+from .nearby import find_nearby
+
+
+class GeohashTest(TestCase):
+    def test_encode_known_value(self):
+        self.assertEqual(encode(57.64911, 10.40744, 11), 'u4pruydqqvj')
+
+    def test_covering_prefixes_contain_every_point_in_radius(self):
+        center = (37.5145, 127.1059)
+        prefixes = covering_prefixes(*center, radius_km=3)
+
+        self.assertLessEqual(len(prefixes), 16)
+        for dlat in (-0.026, 0, 0.026):
+            for dlng in (-0.033, 0, 0.033):
+                point = (center[0] + dlat, center[1] + dlng)
+                if distance_km(*center, *point) <= 3:
+                    self.assertTrue(any(encode(*point).startswith(prefix) for prefix in prefixes))
+
+
+class GeocoderTest(TestCase):
+    def test_most_specific_area_is_used(self):
+        self.assertEqual(geocode('서울특별시 송파구 올림픽로 424'), (37.5145, 127.1059))
+        self.assertEqual(geocode('경기도 광주시 오포읍'), (37.4294, 127.2551)) # 광주광역시가 아닌 경기 광주시
+        self.assertEqual(geocode('부산 중구 중앙대로'), (35.1062, 129.0323)) # 시 / 도마다 있는 '중구'
+        self.assertEqual(geocode('해운대구 우동'), (35.1631, 129.1635)) # 시 / 도 없이 1곳에만 있는 구
+        self.assertEqual(geocode('강원특별자치도 홍천군'), (37.8813, 127.7298)) # 표에 없는 군은 도 대표 좌표
+
+    def test_unknown_address_returns_none(self):
+        self.assertIsNone(geocode('중구 어딘가'))
+        self.assertIsNone(geocode(''))
+
+
+class ClubNearbyTest(TestCase):
+    """
+    주소 좌표 변환 / 근처 클럽 검색 테스트
+    """
+    def setUp(self):
+        self.client = APIClient()
+        self.url = reverse('club-nearby')
+        Club.objects.bulk_create([
+            Club(name='송파', address='서울 송파구 올림픽로'),
+            Club(name='강동', address='서울특별시 강동구 성내로'),
+            Club(name='강남', address='서울 강남구 학동로'),
+            Club(name='해운대', address='부산광역시 해운대구'),
+            Club(name='주소없음'),
+        ])
+        Competition.objects.create(name='대회', address='서울 송파구')
+        call_command('geocode_addresses', stdout=open('/dev/null', 'w'))
+
+    def test_geocode_command_fills_coordinates(self):
+        songpa = Club.objects.get(name='송파')
+
+        self.assertEqual((songpa.latitude, songpa.longitude), (37.5145, 127.1059))
+        self.assertEqual(songpa.geohash, encode(37.5145, 127.1059))
+        self.assertIsNone(Club.objects.get(name='주소없음').geohash)
+        self.assertIsNotNone(Competition.objects.get().geohash)
+
+    def test_nearby_clubs_are_ranked_by_distance_within_radius(self):
+        with self.assertNumQueries(2): # 후보 좌표 / 클럽 (이미지가 없으므로 리사이즈 이미지 prefetch 없음)
+            response = self.client.get(self.url, {'lat': 37.5150, 'lng': 127.1050, 'radius': 6})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual([club['name'] for club in response.data['results']], ['송파', '강동', '강남'])
+        self.assertEqual(response.data['results'][0]['distance_km'], 0.1)
+
+        response = self.client.get(self.url, {'lat': 37.5150, 'lng': 127.1050, 'radius': 2})
+        self.assertEqual([club['name'] for club in response.data['results']], ['송파']) # 강동 ~2.4km
+
+    def test_candidates_are_read_with_index_range_scans(self):
+        sql, params = None, None
+
+        def capture(execute, query, query_params, many, context):
+            nonlocal sql, params
+            sql, params = sql or query, params or query_params
+            return execute(query, query_params, many, context)
+
+        with connection.execute_wrapper(capture):
+            find_nearby(Club.objects.all(), 37.5150, 127.1050, 5, 10)
+        with connection.cursor() as cursor:
+            cursor.execute('EXPLAIN QUERY PLAN ' + sql, params)
+            plan = ' '.join(str(row[-1]) for row in cursor.fetchall())
+
+        self.assertIn('SEARCH club USING INDEX club_geohash_idx (geohash>? AND geohash<?)', plan)
+        self.assertNotIn('SCAN club', plan)
+
+    def test_invalid_parameters_return_400(self):
+        self.assertEqual(self.client.get(self.url, {'lat': 37.5}).status_code, 400)
+        self.assertEqual(self.client.get(self.url, {'lat': 37.5, 'lng': 127.1, 'radius': 500}).status_code, 400)
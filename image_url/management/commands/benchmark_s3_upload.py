@@ -0,0 +1,62 @@
+import time
+
+import boto3
+from django.conf import settings
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management.base import BaseCommand
+
+from image_url.utils import S3ImageUploader, create_s3_client
+
+
+class Command(BaseCommand):
+    """
+    기존 업로드 방식(업로드마다 클라이언트 생성 + 기본 설정 upload_fileobj)과
+    공유 클라이언트 + S3_TRANSFER_CONFIG 업로드 방식의 처리량 비교
+
+    로컬에서는 moto server 를 띄우고 AWS_S3_ENDPOINT_URL 을 지정해서 실행
+        moto_server -p 5000
+        AWS_S3_ENDPOINT_URL=http://localhost:5000 python manage.py benchmark_s3_upload --create-bucket
+    """
+    help = 's3 이미지 업로드 처리량 벤치마크'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--count', type=int, default=20, help='업로드 횟수')
+        parser.add_argument('--size-mb', type=float, default=16, help='업로드할 파일 크기(MB)')
+        parser.add_argument('--bucket', default=settings.AWS_STORAGE_BUCKET_NAME)
+        parser.add_argument('--create-bucket', action='store_true', help='버킷이 없으면 생성 (moto server 용)')
+
+    def handle(self, *args, **options):
+        bucket = options['bucket']
+        count = options['count']
+        payload = b'\0' * int(options['size_mb'] * 1024 * 1024)
+
+        if options['create_bucket']:
+            create_s3_client().create_bucket(Bucket=bucket)
+
+        def make_file():
+            return SimpleUploadedFile('benchmark.jpg', payload, content_type='image/jpeg')
+
+        def legacy_upload():
+            # 변경 전 S3ImageUploader 와 같은 방식: 업로드마다 새 클라이언트 + 기본 TransferConfig 의 upload_fileobj
+            # (moto server 에 보내기 위한 endpoint_url 만 추가)
+            options = {'endpoint_url': settings.AWS_S3_ENDPOINT_URL}
+            if settings.IS_LOCAL:
+                options['aws_access_key_id'] = settings.AWS_ACCESS_KEY_ID
+                options['aws_secret_access_key'] = settings.AWS_SECRET_ACCESS_KEY
+            client = boto3.client('s3', **options)
+            client.upload_fileobj(make_file(), bucket, 'benchmark-legacy.jpg')
+
+        def pooled_upload():
+            S3ImageUploader(bucket_name=bucket).upload_file(make_file())
+
+        for label, upload in (('legacy', legacy_upload), ('pooled', pooled_upload)):
+            upload() # 워밍업
+            start = time.perf_counter()
+            for _ in range(count):
+                upload()
+            elapsed = time.perf_counter() - start
+            throughput = len(payload) * count / elapsed / (1024 * 1024)
+            self.stdout.write(
+                f'{label:>7}: {count}회 {elapsed:.2f}s '
+                f'(평균 {elapsed / count * 1000:.1f}ms, {throughput:.1f}MB/s)'
+            )
@@ -0,0 +1,18 @@
+# Generated by Django 5.0.14 on 2026-10-18 19:50
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('image_url', '0013_alter_imageurl_id'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='imageurl',
+            name='upload_status',
+            field=models.CharField(choices=[('pending', '업로드 중'), ('ready', '업로드 완료'), ('failed', '업로드 실패')], default='ready', max_length=10),
+        ),
+    ]
@@ -0,0 +1,24 @@
+# Generated by Django 5.0.14 on 2026-10-18 19:51
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('image_url', '0014_imageurl_upload_status'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='imageurl',
+            name='original',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='variants', to='image_url.imageurl'),
+        ),
+        migrations.AddField(
+            model_name='imageurl',
+            name='variant_size',
+            field=models.IntegerField(blank=True, null=True),
+        ),
+    ]
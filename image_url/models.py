@@ -3,14 +3,34 @@ from core.models import TimeStampedModel
 
 
 class ImageUrl(TimeStampedModel):
+    # 백그라운드 업로드 상태 (회원가입 프로필 이미지처럼 비동기로 업로드 되는 경우 pending -> ready / failed)
+    UPLOAD_STATUS_CHOICES = (
+        ('pending', '업로드 중'),
+        ('ready', '업로드 완료'),
+        ('failed', '업로드 실패'),
+    )
     id = models.AutoField(primary_key=True)
     image_url = models.CharField(max_length=1024, blank=True, null=True)
     extension = models.CharField(max_length=10, blank=True, null=True)
     size = models.IntegerField(null=True, blank=True)
+    upload_status = models.CharField(max_length=10, choices=UPLOAD_STATUS_CHOICES, default='ready')
+    # 업로드 때 미리 만들어두는 리사이즈 이미지 (원본 이미지의 variants 로 연결, variant_size 는 가로/세로 최대 px)
+    original = models.ForeignKey('self', on_delete=models.CASCADE, related_name='variants', blank=True, null=True)
+    variant_size = models.IntegerField(null=True, blank=True)
     
 
     class Meta:
         db_table = 'image_url'
 
+    def get_variant(self, size):
+        """
+        요청한 크기 이상인 variant 중 가장 작은 것을 반환 (요청한 크기보다 큰 variant 가 없으면 None -> 원본 사용)
+        목록 조회에서는 prefetch_related('...image_url__variants') 로 미리 불러와야 추가 쿼리가 발생하지 않음
+        """
+        for variant in sorted(self.variants.all(), key=lambda variant: variant.variant_size):
+            if variant.variant_size >= size:
+                return variant
+        return None
+
     def __str__(self):
         return f"{self.id} - {self.image_url if self.image_url else 'No Image'}"
@@ -3,10 +3,24 @@ from .models import ImageUrl
 
 
 class ImageUrlSerializer(serializers.ModelSerializer):
-    
+    """
+    variant_size 를 지정하면 원본 대신 해당 크기에 맞는 리사이즈 이미지 URL 을 반환 (없으면 원본)
+    """
+    def __init__(self, *args, variant_size=None, **kwargs):
+        self.variant_size = variant_size
+        super().__init__(*args, **kwargs)
+
     class Meta:
         model = ImageUrl
-        fields = ['image_url']
+        fields = ['image_url', 'upload_status']
+
+    def to_representation(self, instance):
+        data = super().to_representation(instance)
+        if self.variant_size:
+            variant = instance.get_variant(self.variant_size)
+            if variant:
+                data['image_url'] = variant.image_url
+        return data
         
         
 
@@ -0,0 +1,6 @@
+from django.dispatch import Signal
+
+
+# 원본 이미지의 리사이즈 이미지(variants)가 bulk_create 로 만들어졌을 때 발생 (post_save 가 발생하지 않으므로 별도 시그널)
+# sender=ImageUrl, instance=원본 ImageUrl
+image_variants_created = Signal()
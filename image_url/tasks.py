@@ -0,0 +1,142 @@
+import io
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+
+from django.conf import settings
+from django.db import close_old_connections, transaction
+from PIL import Image, ImageOps, UnidentifiedImageError
+from .models import ImageUrl
+from .signals import image_variants_created
+from .utils import S3ImageUploader
+
+
+logger = logging.getLogger(__name__)
+
+# 이미지 업로드 전용 스레드 풀 (요청 스레드가 s3 왕복을 기다리지 않도록 함)
+_executor = None
+_executor_lock = threading.Lock()
+
+
+def get_upload_executor():
+    global _executor
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(
+                    max_workers=getattr(settings, 'IMAGE_UPLOAD_WORKERS', 4),
+                    thread_name_prefix='image-upload',
+                )
+    return _executor
+
+
+def upload_image_in_background(file):
+    """
+    ImageUrl 을 pending 상태로 먼저 만들어서 반환하고, s3 업로드는 백그라운드에서 진행
+    업로드 결과에 따라 upload_status 가 ready / failed 로 바뀐다.
+    """
+    uploader = S3ImageUploader()
+    file_name = uploader.make_file_name(file)
+
+    # 요청이 끝나면 업로드 파일이 닫히므로 내용을 미리 읽어둔다 (프로필 이미지 크기 기준)
+    file.seek(0)
+    content = file.read()
+
+    image = ImageUrl.objects.create(
+        image_url=uploader.get_file_url(file_name),
+        extension=file_name.split('.')[-1],
+        size=int(file.size / 1024),
+        upload_status='pending',
+    )
+    # 커밋된 후에 작업을 넘겨야 워커에서 ImageUrl 을 찾을 수 있다
+    transaction.on_commit(
+        partial(get_upload_executor().submit, upload_image, image.pk, uploader.bucket_name, file_name, content)
+    )
+    return image
+
+
+def upload_image(image_id, bucket_name, file_name, content):
+    """
+    백그라운드 워커에서 실행: s3 업로드 후 ImageUrl 업로드 상태 갱신
+    """
+    close_old_connections()
+    try:
+        try:
+            S3ImageUploader(bucket_name=bucket_name).upload_fileobj(io.BytesIO(content), file_name)
+            upload_status = 'ready'
+        except Exception:
+            logger.exception('이미지 업로드 실패 (image_url id=%s)', image_id)
+            upload_status = 'failed'
+        ImageUrl.objects.filter(pk=image_id).update(upload_status=upload_status)
+        if upload_status == 'ready':
+            # 이미 워커 스레드이므로 리사이즈 이미지도 이어서 만든다
+            create_image_variants(image_id, bucket_name, file_name, content)
+    finally:
+        close_old_connections()
+
+
+def schedule_image_variants(image, bucket_name, content):
+    """
+    이미 업로드가 끝난 이미지(ImageUploadView 등)의 리사이즈 이미지를 백그라운드에서 생성
+    """
+    file_name = image.image_url.rsplit('/', 1)[-1]
+    transaction.on_commit(
+        partial(get_upload_executor().submit, run_image_variants, image.pk, bucket_name, file_name, content)
+    )
+
+
+def run_image_variants(image_id, bucket_name, file_name, content):
+    close_old_connections()
+    try:
+        create_image_variants(image_id, bucket_name, file_name, content)
+    finally:
+        close_old_connections()
+
+
+def create_image_variants(image_id, bucket_name, file_name, content):
+    """
+    IMAGE_VARIANT_SIZES 크기별로 리사이즈 이미지를 만들어 업로드하고 원본의 variants 로 저장
+    원본보다 큰 크기는 만들지 않는다 (그 크기를 요청하면 원본을 사용)
+    """
+    image_format = getattr(settings, 'IMAGE_VARIANT_FORMAT', 'WEBP')
+    extension = 'webp' if image_format == 'WEBP' else 'jpg'
+    try:
+        source = ImageOps.exif_transpose(Image.open(io.BytesIO(content)))
+    except (UnidentifiedImageError, OSError):
+        logger.warning('리사이즈 할 수 없는 이미지 (image_url id=%s)', image_id)
+        return []
+
+    if image_format == 'JPEG' and source.mode not in ('RGB', 'L'):
+        source = source.convert('RGB')
+
+    uploader = S3ImageUploader(bucket_name=bucket_name)
+    stem = file_name.rsplit('.', 1)[0]
+    variants = []
+    for variant_size in getattr(settings, 'IMAGE_VARIANT_SIZES', (128, 256, 512)):
+        if variant_size >= max(source.size):
+            continue
+        resized = source.copy()
+        resized.thumbnail((variant_size, variant_size), Image.LANCZOS)
+        buffer = io.BytesIO()
+        resized.save(buffer, format=image_format, quality=80)
+
+        variant_name = f'{stem}_{variant_size}.{extension}'
+        try:
+            uploader.upload_fileobj(buffer, variant_name)
+        except Exception:
+            logger.exception('리사이즈 이미지 업로드 실패 (image_url id=%s, size=%s)', image_id, variant_size)
+            continue
+        variants.append(ImageUrl(
+            image_url=uploader.get_file_url(variant_name),
+            extension=extension,
+            size=int(buffer.tell() / 1024),
+            original_id=image_id,
+            variant_size=variant_size,
+        ))
+
+    if variants:
+        ImageUrl.objects.bulk_create(variants)
+        original = ImageUrl.objects.get(pk=image_id)
+        image_variants_created.send(sender=ImageUrl, instance=original)
+    return variants
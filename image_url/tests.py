@@ -1,3 +1,83 @@
-from django.test import TestCase
+import io
+from unittest import mock
 
-# Create your tests here.
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.test import SimpleTestCase, TestCase
+from PIL import Image
+from .models import ImageUrl
+from .serializers import ImageUrlSerializer
+from .tasks import create_image_variants
+from .utils import S3ImageUploader, S3_TRANSFER_CONFIG, get_s3_client, reset_s3_client
+
+
+class S3ImageUploaderTest(SimpleTestCase):
+    """
+    공유 s3 클라이언트 / 멀티파트 업로드 설정 테스트 (실제 s3 호출 없음)
+    """
+    def setUp(self):
+        reset_s3_client()
+        self.addCleanup(reset_s3_client)
+
+    def test_client_is_shared_across_uploaders(self):
+        with mock.patch('image_url.utils.create_s3_client', return_value=mock.Mock()) as create:
+            first = S3ImageUploader(bucket_name='bucket')
+            second = S3ImageUploader(bucket_name='bucket')
+
+        self.assertIs(first.s3, second.s3)
+        self.assertIs(first.s3, get_s3_client())
+        create.assert_called_once()
+
+    def test_upload_uses_multipart_transfer_config(self):
+        with mock.patch('image_url.utils.create_s3_client', return_value=mock.Mock()):
+            uploader = S3ImageUploader(bucket_name='bucket')
+        image = SimpleUploadedFile('avatar.png', b'\0' * 4096, content_type='image/png')
+
+        file_url, extension, size = uploader.upload_file(image)
+
+        args, kwargs = uploader.s3.upload_fileobj.call_args
+        self.assertIs(kwargs['Config'], S3_TRANSFER_CONFIG)
+        self.assertEqual(args[1], 'bucket')
+        self.assertEqual(file_url, f'https://bucket.s3.amazonaws.com/{args[2]}')
+        self.assertEqual(extension, 'png')
+        self.assertEqual(size, 4)
+
+
+
+@mock.patch('image_url.utils.S3ImageUploader.upload_fileobj')
+class ImageVariantTest(TestCase):
+    """
+    업로드 이미지 리사이즈(variants) 생성 / 선택 테스트
+    """
+    def setUp(self):
+        self.image = ImageUrl.objects.create(
+            image_url='https://bucket.s3.amazonaws.com/photo.jpg', extension='jpg', size=2048,
+        )
+
+    def make_content(self, width, height):
+        buffer = io.BytesIO()
+        Image.new('RGB', (width, height), 'white').save(buffer, format='JPEG')
+        return buffer.getvalue()
+
+    def test_creates_variants_smaller_than_original(self, upload_fileobj):
+        variants = create_image_variants(self.image.pk, 'bucket', 'photo.jpg', self.make_content(400, 300))
+
+        self.assertEqual([variant.variant_size for variant in variants], [128, 256])
+        self.assertEqual(upload_fileobj.call_count, 2)
+        variant = self.image.variants.get(variant_size=128)
+        self.assertEqual(variant.image_url, 'https://bucket.s3.amazonaws.com/photo_128.webp')
+        self.assertEqual(variant.extension, 'webp')
+
+    def test_serializer_returns_requested_variant(self, upload_fileobj):
+        create_image_variants(self.image.pk, 'bucket', 'photo.jpg', self.make_content(1024, 768))
+        image = ImageUrl.objects.prefetch_related('variants').get(pk=self.image.pk)
+
+        self.assertTrue(ImageUrlSerializer(image, variant_size=100).data['image_url'].endswith('photo_128.webp'))
+        self.assertTrue(ImageUrlSerializer(image, variant_size=300).data['image_url'].endswith('photo_512.webp'))
+        self.assertEqual(ImageUrlSerializer(image).data['image_url'], self.image.image_url)
+
+    def test_serializer_falls_back_to_original_for_larger_size(self, upload_fileobj):
+        create_image_variants(self.image.pk, 'bucket', 'photo.jpg', self.make_content(1024, 768))
+        image = ImageUrl.objects.prefetch_related('variants').get(pk=self.image.pk)
+
+        self.assertIsNone(image.get_variant(1024))
+        self.assertEqual(ImageUrlSerializer(image, variant_size=1024).data['image_url'], self.image.image_url)
@@ -3,6 +3,7 @@ from rest_framework.response import Response
 from rest_framework import status
 from .serializers import ImageUploadSerializer
 from .utils import S3ImageUploader
+from .tasks import schedule_image_variants
 
 
 
@@ -20,7 +21,11 @@ class ImageUploadView(APIView):
                 file_url, extension, size = uploader.upload_file(image_file)
                 
                 # S3로부터 받은 URL, 확장자, 파일 크기 정보 업데이트
-                serializer.save(image_url=file_url, extension=extension, size=size)
+                image = serializer.save(image_url=file_url, extension=extension, size=size)
+
+                # 리사이즈 이미지(썸네일)는 업로드 응답을 늦추지 않도록 백그라운드에서 생성
+                image_file.seek(0)
+                schedule_image_variants(image, uploader.bucket_name, image_file.read())
                 return Response(serializer.data, status=status.HTTP_201_CREATED)
             return Response({"error": "No image file provided"}, status=status.HTTP_400_BAD_REQUEST)
         return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
\ No newline at end of file
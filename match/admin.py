@@ -0,0 +1,5 @@
+from django.contrib import admin
+from core.admin import SoftDeleteAdmin
+from .models import Match
+
+admin.site.register(Match, SoftDeleteAdmin)
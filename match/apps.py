@@ -0,0 +1,9 @@
+from django.apps import AppConfig
+
+
+class MatchConfig(AppConfig):
+    default_auto_field = 'django.db.models.BigAutoField'
+    name = 'match'
+
+    def ready(self):
+        from . import signals # noqa: F401 (세트 / 게임 저장 시 경기 결과 갱신 시그널 등록)
@@ -0,0 +1,90 @@
+from django.db import transaction
+from django.db.models import Q, Sum
+from competition.models import CompetitionPlayer, CompetitionPlayerInfo
+from .models import Match
+
+
+def bracket_order(size):
+    """
+    size(2의 거듭제곱) 칸 대진표의 위에서부터 시드 배치 순서
+    1 / 2 번 시드가 결승에서, 1 ~ 4 번 시드가 준결승에서 처음 만나도록 배치된다.
+        bracket_order(8) == [1, 8, 4, 5, 2, 7, 3, 6]
+    """
+    order = [1]
+    while len(order) < size:
+        total = len(order) * 2 + 1
+        order = [seed for top in order for seed in (top, total - top)]
+    return order
+
+
+def seed_entries(competition, match_type=None):
+    """
+    대회 엔트리를 시드 순(선수 포인트 합계 내림차순)으로 반환 (동점이면 먼저 신청한 엔트리가 높은 시드)
+    match_type 을 주면 해당 종목 포인트만, 없으면 전체 종목 포인트 합계로 정렬
+    """
+    entries = list(
+        CompetitionPlayerInfo.objects.filter(competition=competition).order_by('registration_date', 'id')
+    )
+    points_filter = Q(user__pointranking__match_type=match_type) if match_type else Q()
+    points = dict(
+        CompetitionPlayer.objects.filter(
+            competition_player_info__competition=competition, competition_player_info__is_deleted=False,
+        )
+        .values('competition_player_info')
+        .annotate(points=Sum('user__pointranking__total_points', filter=points_filter))
+        .values_list('competition_player_info', 'points')
+    )
+    registered = {entry.id: i for i, entry in enumerate(entries)}
+    entries.sort(key=lambda entry: (-(points.get(entry.id) or 0), registered[entry.id]))
+    return entries
+
+
+def build_matches(competition, entries):
+    """
+    시드 순 entries 로 대진표의 경기 목록을 만든다 (저장하지 않음, 라운드 / 번호 순)
+    """
+    rounds = (len(entries) - 1).bit_length()
+    size = 1 << rounds
+    order = bracket_order(size)
+    matches = {
+        (match_round, number): Match(competition=competition, match_round=match_round, match_number=number)
+        for match_round in range(1, rounds + 1)
+        for number in range(1, (size >> match_round) + 1)
+    }
+
+    for number in range(1, size // 2 + 1):
+        # 시드 번호가 엔트리 수보다 크면 부전승 자리 (상위 시드 쪽에만 생김)
+        a_seed, b_seed = order[number * 2 - 2], order[number * 2 - 1]
+        if b_seed <= len(entries):
+            matches[1, number].a_team = entries[a_seed - 1]
+            matches[1, number].b_team = entries[b_seed - 1]
+            continue
+        del matches[1, number]
+        next_match = matches[2, (number + 1) // 2]
+        if number % 2:
+            next_match.a_team = entries[a_seed - 1]
+        else:
+            next_match.b_team = entries[a_seed - 1]
+    return list(matches.values())
+
+
+def generate_bracket(competition, match_type=None):
+    """
+    대회 엔트리로 싱글 엘리미네이션 대진표의 모든 경기를 한 트랜잭션에서 bulk_create
+
+    시드는 따로 저장하지 않고 대진표 위치(match_round, match_number)로 남는다.
+    엔트리 수가 2의 거듭제곱이 아니면 상위 시드부터 1라운드 부전승으로 2라운드에 바로 배정한다.
+    경기 수는 항상 엔트리 수 - 1 이고, 대회의 round 에 전체 라운드 수를 저장한다.
+    """
+    with transaction.atomic():
+        if Match.objects.filter(competition=competition).exists():
+            raise ValueError('이미 대진표가 생성된 대회입니다.')
+        entries = seed_entries(competition, match_type)
+        if len(entries) < 2:
+            raise ValueError('참가 엔트리가 2팀 이상이어야 대진표를 만들 수 있습니다.')
+
+        matches = build_matches(competition, entries)
+        created = Match.objects.bulk_create(matches, batch_size=1000)
+        competition.round = matches[-1].match_round
+        competition.save(update_fields=['round', 'updated_at'])
+    return created
@@ -0,0 +1,61 @@
+import math
+import time
+from datetime import datetime, timedelta
+
+from django.core.management.base import BaseCommand
+from competition.models import Competition, CompetitionPlayerInfo
+from match.bracket import build_matches
+from match.scheduler import MATCH_DURATION, MIN_REST, plan_matches, replan_matches
+
+
+class Command(BaseCommand):
+    """
+    경기 N개 / 코트 M개 대회의 일정 배정 시간, 전체 대회 소요 시간(하한 대비),
+    결과가 늦게 들어왔을 때 다시 배정하는 시간과 바뀐 경기 수를 측정 (DB 를 사용하지 않음)
+        python manage.py benchmark_schedule --matches 1000 --courts 20
+    """
+    help = '경기 일정 배정 벤치마크'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--matches', type=int, default=1000)
+        parser.add_argument('--courts', type=int, default=20)
+        parser.add_argument('--delay', type=int, default=45, help='늦게 끝난 경기의 지연 시간(분)')
+
+    def handle(self, *args, **options):
+        courts = options['courts']
+        competition = Competition(id=0)
+        entries = [CompetitionPlayerInfo(id=i + 1) for i in range(options['matches'] + 1)]
+        matches = build_matches(competition, entries)
+        for i, match in enumerate(matches, start=1):
+            match.id = i
+        start = datetime(2024, 1, 1, 9, 0)
+
+        elapsed = self.timed(lambda: plan_matches(matches, courts, start))
+        end = max(match.start_time for match in matches) + MATCH_DURATION
+        rounds = matches[-1].match_round
+        # 코트를 쉬지 않고 쓰는 경우 / 결승까지 라운드를 연달아 치르는 경우 중 긴 쪽이 하한
+        lower_bound = max(
+            math.ceil(len(matches) / courts) * MATCH_DURATION,
+            rounds * MATCH_DURATION + (rounds - 1) * MIN_REST,
+        )
+        self.stdout.write(f'경기 {len(matches)}개 / 코트 {courts}개 / {rounds}라운드')
+        self.stdout.write(f'[전체 배정] {elapsed * 1000:.2f}ms, 대회 소요 {end - start} (하한 {lower_bound})')
+
+        # 전체 일정의 가운데쯤 시작하는 경기가 예정 종료 시간에 delay 분 더 걸린다고 알려진 상황
+        late = sorted(matches, key=lambda match: match.start_time)[len(matches) // 2]
+        now = late.start_time + MATCH_DURATION
+        finished = {(late.match_round, late.match_number): now + timedelta(minutes=options['delay'])}
+        changed = []
+        elapsed = self.timed(lambda: changed.extend(replan_matches(matches, now, finished)))
+        end = max(match.start_time for match in matches) + MATCH_DURATION
+        self.stdout.write(
+            f'[{options["delay"]}분 지연 후 재배정] {elapsed * 1000:.2f}ms, '
+            f'다시 저장할 경기 {len(changed)}개, 대회 소요 {end - start}'
+        )
+        elapsed = self.timed(lambda: plan_matches(matches, courts, start))
+        self.stdout.write(f'[비교: 전체 다시 배정] {elapsed * 1000:.2f}ms (모든 경기를 다시 저장)')
+
+    def timed(self, func):
+        start = time.perf_counter()
+        func()
+        return time.perf_counter() - start
@@ -0,0 +1,35 @@
+# Generated by Django 5.0.14 on 2026-10-18 20:15
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        ('competition', '0008_competitionplayerinfo_competitionplayer_and_more'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Match',
+            fields=[
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('is_deleted', models.BooleanField(default=False)),
+                ('id', models.AutoField(primary_key=True, serialize=False)),
+                ('match_round', models.IntegerField(db_column='matchRound')),
+                ('match_number', models.IntegerField(db_column='matchNumber')),
+                ('court_number', models.IntegerField(blank=True, db_column='courtNumber', null=True)),
+                ('a_team', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.DO_NOTHING, related_name='match_a_team_set', to='competition.competitionplayerinfo')),
+                ('b_team', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.DO_NOTHING, related_name='match_b_team_set', to='competition.competitionplayerinfo')),
+                ('competition', models.ForeignKey(on_delete=django.db.models.deletion.DO_NOTHING, to='competition.competition')),
+            ],
+            options={
+                'db_table': 'match',
+                'indexes': [models.Index(fields=['competition', 'is_deleted', 'match_round', 'match_number'], name='match_bracket_idx')],
+            },
+        ),
+    ]
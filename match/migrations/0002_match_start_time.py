@@ -0,0 +1,18 @@
+# Generated by Django 5.0.14 on 2026-10-18 20:16
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('match', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='match',
+            name='start_time',
+            field=models.DateTimeField(blank=True, db_column='startTime', null=True),
+        ),
+    ]
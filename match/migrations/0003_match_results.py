@@ -0,0 +1,75 @@
+# Generated by Django 5.0.14 on 2026-10-18 20:18
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('competition', '0008_competitionplayerinfo_competitionplayer_and_more'),
+        ('match', '0002_match_start_time'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='match',
+            name='completed_at',
+            field=models.DateTimeField(blank=True, db_column='completedAt', null=True),
+        ),
+        migrations.AddField(
+            model_name='match',
+            name='game_score_a',
+            field=models.IntegerField(db_column='gameScoreA', default=0),
+        ),
+        migrations.AddField(
+            model_name='match',
+            name='game_score_b',
+            field=models.IntegerField(db_column='gameScoreB', default=0),
+        ),
+        migrations.AddField(
+            model_name='match',
+            name='set_score_a',
+            field=models.IntegerField(db_column='setScoreA', default=0),
+        ),
+        migrations.AddField(
+            model_name='match',
+            name='set_score_b',
+            field=models.IntegerField(db_column='setScoreB', default=0),
+        ),
+        migrations.AddField(
+            model_name='match',
+            name='winner',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.DO_NOTHING, related_name='match_winner_set', to='competition.competitionplayerinfo'),
+        ),
+        migrations.CreateModel(
+            name='Set',
+            fields=[
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('id', models.AutoField(primary_key=True, serialize=False)),
+                ('set_number', models.IntegerField(db_column='setNumber')),
+                ('score_a', models.IntegerField(db_column='scoreA', default=0)),
+                ('score_b', models.IntegerField(db_column='scoreB', default=0)),
+                ('match', models.ForeignKey(on_delete=django.db.models.deletion.DO_NOTHING, related_name='sets', to='match.match')),
+            ],
+            options={
+                'db_table': 'set',
+            },
+        ),
+        migrations.CreateModel(
+            name='Game',
+            fields=[
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('id', models.AutoField(primary_key=True, serialize=False)),
+                ('game_number', models.IntegerField(db_column='gameNumber')),
+                ('score_a', models.IntegerField(db_column='scoreA', default=0)),
+                ('score_b', models.IntegerField(db_column='scoreB', default=0)),
+                ('set', models.ForeignKey(on_delete=django.db.models.deletion.DO_NOTHING, related_name='games', to='match.set')),
+            ],
+            options={
+                'db_table': 'game',
+            },
+        ),
+    ]
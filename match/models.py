@@ -0,0 +1,54 @@
+from django.db import models
+from competition.models import Competition, CompetitionPlayerInfo
+from core.models import TimeStampedModel, SoftDeleteModel
+
+
+# 대진표의 경기 1개
+# (match_round, match_number) 가 대진표 위치: round 의 k 번 경기 승자는 round + 1 의 (k + 1) // 2 번 경기로 올라감
+# (k 가 홀수면 a_team, 짝수면 b_team 자리, 부전승 자리는 경기를 만들지 않고 다음 라운드에 바로 배정)
+class Match(TimeStampedModel, SoftDeleteModel):
+    id = models.AutoField(primary_key=True)
+    match_round = models.IntegerField(db_column='matchRound')
+    match_number = models.IntegerField(db_column='matchNumber')
+    court_number = models.IntegerField(db_column='courtNumber', blank=True, null=True)
+    start_time = models.DateTimeField(db_column='startTime', blank=True, null=True) # 스케줄러가 배정한 시작 시간
+    competition = models.ForeignKey(Competition, models.DO_NOTHING)
+    a_team = models.ForeignKey(CompetitionPlayerInfo, models.DO_NOTHING, blank=True, null=True, related_name='match_a_team_set') # 이전 경기 결과 대기 중이면 null
+    b_team = models.ForeignKey(CompetitionPlayerInfo, models.DO_NOTHING, blank=True, null=True, related_name='match_b_team_set')
+    # 세트 / 게임 점수를 집계해서 저장해둔 경기 결과 (match.results.refresh_match_results 로만 갱신)
+    set_score_a = models.IntegerField(db_column='setScoreA', default=0)
+    set_score_b = models.IntegerField(db_column='setScoreB', default=0)
+    game_score_a = models.IntegerField(db_column='gameScoreA', default=0)
+    game_score_b = models.IntegerField(db_column='gameScoreB', default=0)
+    winner = models.ForeignKey(CompetitionPlayerInfo, models.DO_NOTHING, blank=True, null=True, related_name='match_winner_set')
+    completed_at = models.DateTimeField(db_column='completedAt', blank=True, null=True)
+
+    class Meta:
+        db_table = 'match'
+        indexes = [
+            models.Index(fields=['competition', 'is_deleted', 'match_round', 'match_number'], name='match_bracket_idx'), # 대회 대진표 조회
+        ]
+
+
+# 경기의 세트 (score_a / score_b 는 세트에서 딴 게임 수, 게임 기록이 있으면 게임 저장 때 다시 계산됨)
+class Set(TimeStampedModel):
+    id = models.AutoField(primary_key=True)
+    set_number = models.IntegerField(db_column='setNumber')
+    score_a = models.IntegerField(db_column='scoreA', default=0)
+    score_b = models.IntegerField(db_column='scoreB', default=0)
+    match = models.ForeignKey(Match, models.DO_NOTHING, related_name='sets')
+
+    class Meta:
+        db_table = 'set'
+
+
+# 세트의 게임 (score_a / score_b 는 게임 포인트)
+class Game(TimeStampedModel):
+    id = models.AutoField(primary_key=True)
+    game_number = models.IntegerField(db_column='gameNumber')
+    score_a = models.IntegerField(db_column='scoreA', default=0)
+    score_b = models.IntegerField(db_column='scoreB', default=0)
+    set = models.ForeignKey(Set, models.DO_NOTHING, related_name='games')
+
+    class Meta:
+        db_table = 'game'
@@ -0,0 +1,106 @@
+from django.db import transaction
+from django.db.models import Count, F, Max, Q, Sum
+from django.db.models.functions import Coalesce
+from django.utils import timezone
+from .models import Match, Set
+
+
+SETS_TO_WIN = 2 # 3세트 2선승
+POINTS_TO_WIN_GAME = 4 # 4포인트 이상 + 2포인트 차 (듀스)
+GAMES_TO_WIN_SET = 6 # 6게임 이상 + 2게임 차, 또는 7-6 (타이브레이크)
+TIEBREAK_GAME = GAMES_TO_WIN_SET * 2 + 1 # 6-6 다음 13번째 게임이 타이브레이크
+POINTS_TO_WIN_TIEBREAK = 7 # 타이브레이크는 7포인트 이상 + 2포인트 차
+RESULT_FIELDS = ['set_score_a', 'set_score_b', 'game_score_a', 'game_score_b', 'winner', 'completed_at']
+
+
+def _won(prefix, side, other, minimum, tiebreak=None):
+    # 끝난 게임 / 세트 중 side 가 이긴 것 (한쪽이 앞서기만 한 진행 중인 게임 / 세트는 제외)
+    score, opponent = f'{prefix}score_{side}', f'{prefix}score_{other}'
+    won = Q(**{f'{score}__gte': minimum}) & Q(**{f'{score}__gte': F(opponent) + 2})
+    if tiebreak:
+        won |= Q(**{score: tiebreak[0], opponent: tiebreak[1]})
+    return won
+
+
+def game_won(side, other, prefix='games__'):
+    tiebreak = Q(**{f'{prefix}game_number': TIEBREAK_GAME})
+    normal = Q(**{f'{prefix}game_number__lt': TIEBREAK_GAME}) | Q(**{f'{prefix}game_number__gt': TIEBREAK_GAME})
+    return (
+        (normal & _won(prefix, side, other, POINTS_TO_WIN_GAME))
+        | (tiebreak & _won(prefix, side, other, POINTS_TO_WIN_TIEBREAK))
+    )
+
+
+def set_won(side, other, prefix='sets__'):
+    return _won(prefix, side, other, GAMES_TO_WIN_SET, tiebreak=(GAMES_TO_WIN_SET + 1, GAMES_TO_WIN_SET))
+
+
+def refresh_set_scores(set_ids):
+    """
+    게임 기록이 있는 세트의 score_a / score_b 를 끝난 게임의 승수로 다시 계산하고, 해당 경기 결과도 갱신
+    """
+    with transaction.atomic():
+        sets = list(
+            Set.objects.filter(id__in=set_ids).annotate(
+                game_count=Count('games'),
+                games_a=Count('games', filter=game_won('a', 'b')),
+                games_b=Count('games', filter=game_won('b', 'a')),
+            )
+        )
+        changed = []
+        for set_ in sets:
+            if set_.game_count and (set_.score_a, set_.score_b) != (set_.games_a, set_.games_b):
+                set_.score_a, set_.score_b = set_.games_a, set_.games_b
+                set_.updated_at = timezone.now()
+                changed.append(set_)
+        Set.objects.bulk_update(changed, ['score_a', 'score_b', 'updated_at'])
+        refresh_match_results({set_.match_id for set_ in sets})
+
+
+def refresh_match_results(match_ids, batch_size=500):
+    """
+    경기 batch_size 개마다 세트 점수 집계 쿼리 1번으로 세트 / 게임 스코어, 승자, 종료 시간을 계산해서 경기에 저장
+    세트 스코어 / 승자 / 종료 시간은 끝난 세트만으로 계산한다. (게임 스코어는 진행 중인 세트의 게임도 포함)
+
+    같은 경기의 세트가 동시에 저장되어도 결과가 어긋나지 않도록 경기 행을 먼저 잠근 뒤 집계한다.
+    결과가 바뀐 경기 수를 반환
+    """
+    match_ids = sorted(match_ids)
+    updated = 0
+    with transaction.atomic():
+        for i in range(0, len(match_ids), batch_size):
+            batch = match_ids[i:i + batch_size]
+            list(Match.all_objects.select_for_update().filter(id__in=batch).values_list('id', flat=True))
+            matches = Match.all_objects.filter(id__in=batch).annotate(
+                sets_a=Count('sets', filter=set_won('a', 'b')),
+                sets_b=Count('sets', filter=set_won('b', 'a')),
+                games_a=Coalesce(Sum('sets__score_a'), 0),
+                games_b=Coalesce(Sum('sets__score_b'), 0),
+                last_set_at=Max('sets__updated_at', filter=set_won('a', 'b') | set_won('b', 'a')),
+            )
+            changed = [match for match in matches if _apply_result(match)]
+            Match.all_objects.bulk_update(changed, RESULT_FIELDS + ['updated_at'])
+            updated += len(changed)
+    return updated
+
+
+def _apply_result(match):
+    winner_id = None
+    if match.sets_a >= SETS_TO_WIN:
+        winner_id = match.a_team_id
+    elif match.sets_b >= SETS_TO_WIN:
+        winner_id = match.b_team_id
+    result = (
+        match.sets_a, match.sets_b, match.games_a, match.games_b, winner_id,
+        match.last_set_at if winner_id else None,
+    )
+    current = (
+        match.set_score_a, match.set_score_b, match.game_score_a, match.game_score_b, match.winner_id,
+        match.completed_at,
+    )
+    if result == current:
+        return False
+    (match.set_score_a, match.set_score_b, match.game_score_a, match.game_score_b,
+     match.winner_id, match.completed_at) = result
+    match.updated_at = timezone.now()
+    return True
@@ -0,0 +1,136 @@
+import heapq
+from datetime import timedelta
+
+from django.db import transaction
+from django.utils import timezone
+from .models import Match
+
+
+MATCH_DURATION = timedelta(minutes=60) # 경기 1개에 배정하는 시간
+MIN_REST = timedelta(minutes=30) # 선수가 다음 경기 전에 쉬어야 하는 최소 시간
+
+
+def feeder_keys(match_round, match_number):
+    """
+    (match_round, match_number) 경기의 양쪽 자리를 채우는 이전 라운드 경기 위치
+    """
+    return (match_round - 1, match_number * 2 - 1), (match_round - 1, match_number * 2)
+
+
+def plan_matches(matches, courts, start, duration=MATCH_DURATION, rest=MIN_REST, court_free_at=None, finished_at=None):
+    """
+    matches 의 court_number / start_time 을 배정 (DB 저장은 하지 않음)
+
+    코트는 비는 시간 순 힙, 경기는 준비되는 시간 순 힙으로 관리하는 리스트 스케줄링으로
+    코트가 비는 순간 준비된 경기 중 가장 앞 라운드(결승까지 남은 경기가 가장 많은) 경기를 배정한다.
+    이전 라운드 경기가 끝나고 rest 가 지나야 다음 라운드 경기가 준비되므로 선수 휴식 시간이 보장된다.
+    O(경기 수 x log 경기 수)
+
+    court_free_at: {코트 번호: 비는 시간} (기본: 모두 start)
+    finished_at: {(match_round, match_number): 끝나는 시간} 이미 진행 / 종료되어 다시 배정하지 않는 경기
+    """
+    finished_at = finished_at or {}
+    by_key = {(match.match_round, match.match_number): match for match in matches}
+    ready_at = {}
+    waiting = {}
+    pending = [] # (준비 시간, 라운드, 번호)
+    for key in by_key:
+        feeders = [feeder for feeder in feeder_keys(*key) if feeder in by_key]
+        ready = max([start] + [finished_at[feeder] + rest for feeder in feeder_keys(*key) if feeder in finished_at])
+        if feeders:
+            waiting[key] = len(feeders)
+            ready_at[key] = ready
+        else:
+            heapq.heappush(pending, (ready, *key))
+
+    court_heap = [((court_free_at or {}).get(court, start), court) for court in range(1, courts + 1)]
+    heapq.heapify(court_heap)
+    ready_heap = [] # (라운드, 번호)
+    while pending or ready_heap:
+        free_at, court = heapq.heappop(court_heap)
+        if not ready_heap and pending[0][0] > free_at:
+            free_at = pending[0][0]
+        while pending and pending[0][0] <= free_at:
+            _, match_round, match_number = heapq.heappop(pending)
+            heapq.heappush(ready_heap, (match_round, match_number))
+
+        key = heapq.heappop(ready_heap)
+        match = by_key[key]
+        match.court_number = court
+        match.start_time = free_at
+        end = free_at + duration
+        heapq.heappush(court_heap, (end, court))
+
+        parent = (key[0] + 1, (key[1] + 1) // 2)
+        if parent in waiting:
+            ready_at[parent] = max(ready_at[parent], end + rest)
+            waiting[parent] -= 1
+            if not waiting[parent]:
+                heapq.heappush(pending, (ready_at.pop(parent), *parent))
+                del waiting[parent]
+    return matches
+
+
+def replan_matches(matches, now, finished=None, duration=MATCH_DURATION, rest=MIN_REST):
+    """
+    now 시점에 일부 경기의 종료 시간이 바뀌었을 때(finished) 영향을 받는 경기만 뒤로 미루고, 바뀐 경기 목록을 반환
+
+    시작 시간 순으로 한번 훑으면서 이전 라운드 경기 종료 + 휴식 또는 같은 코트 앞 경기 종료보다
+    먼저 시작하게 되어 있는 경기만 같은 코트에서 가능한 시간으로 미룬다. (나머지 경기는 그대로)
+    예정 시간이 지났어도 앞 경기가 끝나지 않아 시작할 수 없었던 경기도 함께 미뤄진다.
+    finished: {(match_round, match_number): 실제 종료 시간 (예상 포함)} (결과가 늦게 들어온 경기)
+    """
+    finished = finished or {}
+    keys = {(match.match_round, match.match_number) for match in matches}
+    end_at = {}
+    court_free_at = {}
+    changed = []
+    for match in sorted((match for match in matches if match.start_time is not None), key=lambda match: match.start_time):
+        key = (match.match_round, match.match_number)
+        ready = max(
+            [court_free_at.get(match.court_number, match.start_time)]
+            + [end_at[feeder] + rest for feeder in feeder_keys(*key) if feeder in keys]
+        )
+        if ready > match.start_time:
+            match.start_time = max(ready, now)
+            changed.append(match)
+        end_at[key] = finished.get(key, match.start_time + duration)
+        court_free_at[match.court_number] = end_at[key]
+    return changed
+
+
+def schedule_competition(competition, courts, start=None, duration=MATCH_DURATION, rest=MIN_REST):
+    """
+    대회의 모든 경기에 코트와 시작 시간을 배정해서 저장 (기본 시작 시간은 대회 start_date)
+    """
+    start = start or competition.start_date
+    if start is None:
+        raise ValueError('대회 시작 시간이 없어 경기 일정을 만들 수 없습니다.')
+    with transaction.atomic():
+        matches = list(Match.objects.select_for_update().filter(competition=competition))
+        plan_matches(matches, courts, start, duration, rest)
+        _save_schedule(matches)
+    return matches
+
+
+def replan_competition(competition, late_match, finished_at, now=None, duration=MATCH_DURATION, rest=MIN_REST):
+    """
+    late_match 가 예정보다 늦게 finished_at 에 끝날 때 영향을 받는 경기만 미뤄서 저장하고 반환
+    """
+    now = now or timezone.now()
+    with transaction.atomic():
+        matches = list(Match.objects.select_for_update().filter(competition=competition))
+        changed = replan_matches(
+            matches, now,
+            finished={(late_match.match_round, late_match.match_number): finished_at},
+            duration=duration, rest=rest,
+        )
+        _save_schedule(changed)
+    return changed
+
+
+def _save_schedule(matches):
+    now = timezone.now()
+    for match in matches:
+        match.updated_at = now
+    Match.objects.bulk_update(matches, ['court_number', 'start_time', 'updated_at'], batch_size=500)
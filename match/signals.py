@@ -0,0 +1,18 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from .models import Game, Set
+from .results import refresh_match_results, refresh_set_scores
+
+
+# 세트 / 게임이 저장되면 경기 결과를 다시 집계 (대진표 / 순위 조회는 Match 만 읽음)
+# 저장하는 쪽이 transaction.atomic 안이면 같은 트랜잭션에서 함께 커밋되지만,
+# autocommit 이면 세트 / 게임 행이 먼저 커밋된 뒤 별도 트랜잭션으로 집계된다. (점수 입력과 결과를 함께 커밋하려면 atomic 으로 감쌀 것)
+# (bulk_create / update 로 저장한 경우에는 refresh_match_results / refresh_set_scores 를 직접 호출)
+@receiver([post_save, post_delete], sender=Set)
+def refresh_result_on_set_change(sender, instance, **kwargs):
+    refresh_match_results([instance.match_id])
+
+
+@receiver([post_save, post_delete], sender=Game)
+def refresh_result_on_game_change(sender, instance, **kwargs):
+    refresh_set_scores([instance.set_id])
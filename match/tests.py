@@ -0,0 +1,281 @@
+from datetime import timedelta
+from unittest import mock
+
+from django.contrib import admin
+from django.test import TestCase
+from django.utils import timezone
+from competition.admin import CompetitionAdmin
+from competition.models import Competition, CompetitionPlayer, CompetitionPlayerInfo
+from matchtype.models import MatchType
+from point.models import PointRanking
+from users.models import CustomUser
+from .bracket import bracket_order, generate_bracket, seed_entries
+from .models import Game, Match, Set
+from .results import refresh_match_results, refresh_set_scores
+from .scheduler import MATCH_DURATION, MIN_REST, feeder_keys, replan_competition, schedule_competition
+
+
+def create_entries(competition, count):
+    entries = CompetitionPlayerInfo.objects.bulk_create([
+        CompetitionPlayerInfo(competition=competition) for _ in range(count)
+    ])
+    if not entries[0].id: # id 를 돌려주지 않는 DB 대비
+        entries = list(CompetitionPlayerInfo.objects.filter(competition=competition).order_by('id'))
+    return entries
+
+
+class BracketGenerationTest(TestCase):
+    """
+    시드 배정 / 부전승 / 경기 생성 테스트
+    """
+    def setUp(self):
+        self.competition = Competition.objects.create(name='테스트대회')
+
+    def test_bracket_order_keeps_top_seeds_apart(self):
+        self.assertEqual(bracket_order(8), [1, 8, 4, 5, 2, 7, 3, 6])
+
+    def test_entries_are_seeded_by_points_and_top_seeds_get_byes(self):
+        match_type = MatchType.objects.create(gender='male', type='single')
+        entries = create_entries(self.competition, 5)
+        users = CustomUser.objects.bulk_create([
+            CustomUser(phone=f'bracket-{i}', username=f'유저{i}', birth=1990, gender='male') for i in range(5)
+        ])
+        CompetitionPlayer.objects.bulk_create([
+            CompetitionPlayer(user=user, competition_player_info=entry) for user, entry in zip(users, entries)
+        ])
+        # 늦게 신청한 엔트리일수록 포인트가 높음 (마지막 두 엔트리는 동점)
+        PointRanking.objects.bulk_create([
+            PointRanking(user=user, match_type=match_type, total_points=points)
+            for user, points in zip(users, [10, 20, 30, 40, 40])
+        ])
+
+        seeded = seed_entries(self.competition, match_type)
+        seeds = {entry.id: seed for seed, entry in enumerate(seeded, start=1)}
+        self.assertEqual([seeds[entry.id] for entry in entries], [5, 4, 3, 1, 2])
+
+        matches = generate_bracket(self.competition, match_type)
+        self.assertEqual(len(matches), 4)
+        self.competition.refresh_from_db()
+        self.assertEqual(self.competition.round, 3)
+
+        bracket = {
+            (match.match_round, match.match_number): (
+                match.a_team and seeds[match.a_team_id], match.b_team and seeds[match.b_team_id],
+            )
+            for match in Match.objects.all()
+        }
+        # 1 ~ 3 번 시드는 부전승으로 2라운드에 바로 배정되고, 4 / 5 번 시드만 1라운드 경기
+        self.assertEqual(bracket, {
+            (1, 2): (4, 5),
+            (2, 1): (1, None),
+            (2, 2): (2, 3),
+            (3, 1): (None, None),
+        })
+
+    def test_admin_action_seeds_by_competition_match_type(self):
+        single = MatchType.objects.create(gender='male', type='single')
+        double = MatchType.objects.create(gender='male', type='double')
+        self.competition.match_type = single
+        self.competition.save()
+        entries = create_entries(self.competition, 2)
+        users = CustomUser.objects.bulk_create([
+            CustomUser(phone=f'admin-{i}', username=f'유저{i}', birth=1990, gender='male') for i in range(2)
+        ])
+        CompetitionPlayer.objects.bulk_create([
+            CompetitionPlayer(user=user, competition_player_info=entry) for user, entry in zip(users, entries)
+        ])
+        # 두번째 엔트리는 다른 종목 포인트가 높아 합산하면 1번 시드가 됨
+        PointRanking.objects.bulk_create([
+            PointRanking(user=users[0], match_type=single, total_points=30),
+            PointRanking(user=users[1], match_type=single, total_points=20),
+            PointRanking(user=users[1], match_type=double, total_points=100),
+        ])
+
+        with mock.patch.object(CompetitionAdmin, 'message_user'):
+            admin.site._registry[Competition].generate_brackets(None, Competition.objects.filter(pk=self.competition.pk))
+
+        final = Match.objects.get(competition=self.competition)
+        self.assertEqual((final.a_team_id, final.b_team_id), (entries[0].id, entries[1].id))
+
+    def test_large_field(self):
+        create_entries(self.competition, 4096)
+
+        matches = generate_bracket(self.competition)
+
+        self.assertEqual(len(matches), 4095)
+        self.assertEqual(Match.objects.filter(competition=self.competition, match_round=12).count(), 1)
+
+    def test_bracket_cannot_be_generated_twice_or_for_single_entry(self):
+        create_entries(self.competition, 1)
+        with self.assertRaises(ValueError):
+            generate_bracket(self.competition)
+
+        create_entries(self.competition, 1)
+        generate_bracket(self.competition)
+        with self.assertRaises(ValueError):
+            generate_bracket(self.competition)
+
+
+class MatchSchedulerTest(TestCase):
+    """
+    코트 / 시간 배정이 라운드 순서와 휴식 시간을 지키는지, 늦은 결과에 영향을 받는 경기만 미뤄지는지 확인하는 테스트
+    """
+    def setUp(self):
+        self.start = timezone.now().replace(hour=9, minute=0, second=0, microsecond=0)
+        self.competition = Competition.objects.create(name='테스트대회', start_date=self.start)
+        create_entries(self.competition, 13)
+        generate_bracket(self.competition)
+
+    def assert_valid_schedule(self, matches):
+        by_key = {(match.match_round, match.match_number): match for match in matches}
+        for key, match in by_key.items():
+            for feeder in feeder_keys(*key):
+                if feeder in by_key:
+                    self.assertGreaterEqual(match.start_time, by_key[feeder].start_time + MATCH_DURATION + MIN_REST)
+        by_court = {}
+        for match in sorted(matches, key=lambda match: match.start_time):
+            previous = by_court.get(match.court_number)
+            if previous:
+                self.assertGreaterEqual(match.start_time, previous.start_time + MATCH_DURATION)
+            by_court[match.court_number] = match
+
+    def test_schedule_respects_rounds_rest_and_courts(self):
+        schedule_competition(self.competition, courts=3)
+
+        matches = list(Match.objects.filter(competition=self.competition))
+        self.assert_valid_schedule(matches)
+        self.assertTrue(all(1 <= match.court_number <= 3 for match in matches))
+        # 1라운드 5경기는 코트 3개로 2타임, 이후 2 / 3 / 4 라운드는 휴식 시간 뒤에 1타임씩
+        final = max(matches, key=lambda match: match.match_round)
+        self.assertEqual(final.start_time, self.start + timedelta(minutes=60 * 2 + 90 * 2 + 30))
+
+    def test_late_result_only_moves_affected_matches(self):
+        schedule_competition(self.competition, courts=3)
+        late = Match.objects.get(competition=self.competition, match_round=1, match_number=2)
+        planned_end = late.start_time + MATCH_DURATION
+
+        changed = replan_competition(self.competition, late, planned_end + timedelta(minutes=45), now=planned_end)
+
+        matches = list(Match.objects.filter(competition=self.competition))
+        self.assert_valid_schedule(matches)
+        # 늦은 경기의 다음 라운드 경기와 그 뒤 경기들만 미뤄짐
+        self.assertIn((2, 1), {(match.match_round, match.match_number) for match in changed})
+        self.assertLess(len(changed), len(matches) - 1)
+        untouched = Match.objects.get(competition=self.competition, match_round=1, match_number=3)
+        self.assertNotIn(untouched.id, {match.id for match in changed})
+
+    def test_competition_without_start_time_cannot_be_scheduled(self):
+        self.competition.start_date = None
+
+        with self.assertRaises(ValueError):
+            schedule_competition(self.competition, courts=3)
+
+
+class MatchResultTest(TestCase):
+    """
+    세트 / 게임 저장 시 경기 결과가 집계되어 경기에 저장되는지 확인하는 테스트
+    """
+    def setUp(self):
+        self.competition = Competition.objects.create(name='테스트대회')
+        create_entries(self.competition, 4)
+        generate_bracket(self.competition)
+        self.match = Match.objects.get(match_round=1, match_number=1)
+
+    def test_set_scores_decide_winner(self):
+        Set.objects.create(match=self.match, set_number=1, score_a=6, score_b=4)
+        Set.objects.create(match=self.match, set_number=2, score_a=3, score_b=6)
+        self.match.refresh_from_db()
+        self.assertEqual((self.match.set_score_a, self.match.set_score_b), (1, 1))
+        self.assertIsNone(self.match.winner)
+
+        last = Set.objects.create(match=self.match, set_number=3, score_a=7, score_b=5)
+
+        self.match.refresh_from_db()
+        self.assertEqual((self.match.set_score_a, self.match.set_score_b), (2, 1))
+        self.assertEqual((self.match.game_score_a, self.match.game_score_b), (16, 15))
+        self.assertEqual(self.match.winner_id, self.match.a_team_id)
+        self.assertEqual(self.match.completed_at, last.updated_at)
+
+        last.delete()
+        self.match.refresh_from_db()
+        self.assertIsNone(self.match.winner)
+        self.assertIsNone(self.match.completed_at)
+
+    def test_games_update_set_and_match(self):
+        set_ = Set.objects.create(match=self.match, set_number=1)
+
+        for number, (a, b) in enumerate([(4, 1), (2, 4), (6, 4), (3, 2)], start=1): # 마지막 게임은 진행 중
+            Game.objects.create(set=set_, game_number=number, score_a=a, score_b=b)
+
+        set_.refresh_from_db()
+        self.match.refresh_from_db()
+        self.assertEqual((set_.score_a, set_.score_b), (2, 1))
+        self.assertEqual((self.match.game_score_a, self.match.game_score_b), (2, 1))
+
+    def test_unfinished_set_and_game_do_not_count(self):
+        Set.objects.create(match=self.match, set_number=1, score_a=6, score_b=4)
+        second = Set.objects.create(match=self.match, set_number=2)
+        Game.objects.create(set=second, game_number=1, score_a=1, score_b=0) # 2세트 첫 게임 진행 중
+
+        self.match.refresh_from_db()
+        second.refresh_from_db()
+        self.assertEqual((second.score_a, second.score_b), (0, 0))
+        self.assertEqual((self.match.set_score_a, self.match.set_score_b), (1, 0))
+        self.assertIsNone(self.match.winner)
+        self.assertIsNone(self.match.completed_at)
+
+        # 앞서고 있지만 끝나지 않은 세트 (5-4 / 6-5) 도 세트 스코어에 들어가지 않음
+        second.games.all().delete()
+        second.delete()
+        for score_b in (4, 5):
+            Set.objects.update_or_create(match=self.match, set_number=2, defaults={'score_a': score_b + 1, 'score_b': score_b})
+            self.match.refresh_from_db()
+            self.assertEqual((self.match.set_score_a, self.match.set_score_b), (1, 0))
+            self.assertIsNone(self.match.winner)
+
+        Set.objects.filter(match=self.match, set_number=2).get().delete()
+        Set.objects.create(match=self.match, set_number=2, score_a=7, score_b=6) # 타이브레이크
+        self.match.refresh_from_db()
+        self.assertEqual((self.match.set_score_a, self.match.set_score_b), (2, 0))
+        self.assertEqual(self.match.winner_id, self.match.a_team_id)
+        self.assertIsNotNone(self.match.completed_at)
+
+    def test_tiebreak_game_needs_seven_points(self):
+        Set.objects.create(match=self.match, set_number=1, score_a=6, score_b=4)
+        second = Set.objects.create(match=self.match, set_number=2)
+        Game.objects.bulk_create([
+            Game(set=second, game_number=number, score_a=4, score_b=0) if number % 2
+            else Game(set=second, game_number=number, score_a=0, score_b=4)
+            for number in range(1, 13)
+        ])
+        refresh_set_scores([second.id]) # bulk_create 는 시그널이 없으므로 직접 갱신
+        tiebreak = Game.objects.create(set=second, game_number=13, score_a=4, score_b=2) # 타이브레이크 진행 중 (4-2)
+
+        second.refresh_from_db()
+        self.match.refresh_from_db()
+        self.assertEqual((second.score_a, second.score_b), (6, 6))
+        self.assertIsNone(self.match.winner)
+
+        tiebreak.score_a, tiebreak.score_b = 7, 5
+        tiebreak.save()
+
+        second.refresh_from_db()
+        self.match.refresh_from_db()
+        self.assertEqual((second.score_a, second.score_b), (7, 6))
+        self.assertEqual(self.match.winner_id, self.match.a_team_id)
+
+    def test_batch_refresh_uses_one_aggregate_query_per_batch(self):
+        matches = list(Match.objects.filter(match_round=1))
+        Set.objects.bulk_create([
+            Set(match=match, set_number=number, score_a=6, score_b=2) for match in matches for number in (1, 2)
+        ])
+
+        # 저장점 / 경기 잠금 / 집계 / 결과 저장 / 저장점 해제
+        with self.assertNumQueries(5):
+            updated = refresh_match_results([match.id for match in matches])
+
+        self.assertEqual(updated, 2)
+        self.assertEqual(
+            set(Match.objects.filter(match_round=1).values_list('winner', flat=True)),
+            {match.a_team_id for match in matches},
+        )
@@ -4,3 +4,8 @@ from django.apps import AppConfig
 class MatchTypeConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'matchtype'
+
+    def ready(self):
+        from . import signals # noqa: F401 (종목 캐시 무효화 시그널 등록)
+        from .cache import match_types
+        match_types.warm_on_first_request()
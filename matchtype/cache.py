@@ -0,0 +1,6 @@
+from core.reference_cache import ReferenceCache
+from .models import MatchType
+
+
+# 종목 id -> MatchType (프로세스 메모리 캐시)
+match_types = ReferenceCache(lambda: MatchType.objects.all(), 'matchtype:reference:version')
@@ -0,0 +1,12 @@
+from django.db import transaction
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+from .models import MatchType
+from .cache import match_types
+
+
+# 트랜잭션이 커밋된 후에 버전을 올려야 커밋 전 데이터를 다시 불러오지 않는다
+@receiver(post_save, sender=MatchType)
+@receiver(post_delete, sender=MatchType)
+def invalidate_match_type_cache(sender, **kwargs):
+    transaction.on_commit(match_types.bump_version)
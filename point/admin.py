@@ -0,0 +1,4 @@
+from django.contrib import admin
+
+# Register your models here.
+# (포인트는 랭킹 테이블과 함께 갱신되어야 하므로 admin 에서 직접 수정하지 않고 point.ranking.award_points 로 지급)
@@ -0,0 +1,62 @@
+import time
+
+from django.db import transaction
+from django.utils import timezone
+from .models import Point
+from .ranking import apply_point_changes
+
+
+class ExpiryResult:
+    """
+    expire_due_points 결과
+    changes: {(user_id, match_type_id): (만료 전 합계, 만료 후 합계)} (합계가 바뀐 유저만)
+    """
+    def __init__(self):
+        self.expired = 0
+        self.batches = 0
+        self.changes = {}
+
+    def merge(self, changed):
+        for match_type_id, rows in changed.items():
+            for user_id, old, new in rows:
+                key = (user_id, match_type_id)
+                # 여러 배치에 걸친 유저는 처음 배치의 이전 합계를 유지
+                self.changes[key] = (self.changes.get(key, (old, new))[0], new)
+
+    @property
+    def user_ids(self):
+        return {user_id for user_id, _ in self.changes}
+
+
+def expire_due_points(now=None, batch_size=1000, max_batches=None, sleep=0):
+    """
+    만료일이 지난 포인트를 만료일 순으로 batch_size 개씩 만료 처리하고 랭킹 합계에서 뺀다
+
+    (is_expired, expired_date) 인덱스의 만료되지 않은 구간 앞부분만 읽으므로
+    전체 포인트 테이블을 다시 읽지 않고, 배치마다 커밋해서 락을 오래 잡지 않는다. (스케줄러 / cron 에서 호출)
+    """
+    now = now or timezone.now()
+    result = ExpiryResult()
+    while max_batches is None or result.batches < max_batches:
+        with transaction.atomic():
+            # 동시에 실행된 다른 스위퍼가 잡은 행은 건너뛴다
+            points = list(
+                Point.objects.select_for_update(skip_locked=True)
+                .filter(is_expired=False, expired_date__lte=now)
+                .order_by('expired_date', 'id')
+                .values_list('id', 'user_id', 'match_type_id', 'points')[:batch_size]
+            )
+            if not points:
+                break
+            Point.objects.filter(id__in=[point[0] for point in points]).update(is_expired=True, updated_at=timezone.now())
+
+            deltas = {}
+            for _, user_id, match_type_id, points_value in points:
+                key = (user_id, match_type_id)
+                deltas[key] = deltas.get(key, 0) - (points_value or 0)
+            result.merge(apply_point_changes(deltas))
+        result.expired += len(points)
+        result.batches += 1
+        if sleep:
+            time.sleep(sleep)
+    return result
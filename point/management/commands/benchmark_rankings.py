@@ -0,0 +1,97 @@
+import random
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+from matchtype.models import MatchType
+from point.models import PointRanking
+from point.ranking import _publish_changes, apply_point_changes, rankings
+
+
+class Rollback(Exception):
+    pass
+
+
+class Command(BaseCommand):
+    """
+    유저 N명의 랭킹 테이블에서 순위 조회 / 랭킹 페이지 / 포인트 지급 시간을
+    전체 정렬(COUNT / OFFSET) 방식과 비교하는 벤치마크
+    벤치마크 데이터는 트랜잭션 안에서 만들고 끝나면 롤백한다. (유저 행은 만들지 않음)
+        python manage.py benchmark_rankings --users 1000000
+    """
+    help = '포인트 랭킹 벤치마크'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--users', type=int, default=1000000, help='랭킹에 올라간 유저 수')
+        parser.add_argument('--max-points', type=int, default=20000)
+        parser.add_argument('--repeat', type=int, default=50, help='조회 반복 횟수')
+
+    def handle(self, *args, **options):
+        try:
+            with transaction.atomic():
+                self.run(options)
+                raise Rollback()
+        except Rollback:
+            pass
+
+    def run(self, options):
+        rng = random.Random(0)
+        match_type = MatchType.objects.create(gender='bench', type='bench')
+        user_count, repeat = options['users'], options['repeat']
+
+        start = time.perf_counter()
+        # 상위권으로 갈수록 인원이 적은 분포
+        PointRanking.objects.bulk_create((
+            PointRanking(
+                user_id=i + 1, match_type=match_type,
+                total_points=min(int(rng.expovariate(1 / (options['max_points'] / 8))) + 1, options['max_points']),
+            )
+            for i in range(user_count)
+        ), batch_size=10000)
+        with connection.cursor() as cursor:
+            cursor.execute(f'ANALYZE {PointRanking._meta.db_table}')
+        self.stdout.write(f'랭킹 유저 {user_count}명 생성 {time.perf_counter() - start:.1f}s')
+
+        index = rankings.get(match_type.id)
+        self.measure('점수 분포 불러오기 (프로세스당 / 다른 프로세스 변경 후 1번)', [None], lambda _: index.get_scores())
+
+        user_ids = [rng.randint(1, user_count) for _ in range(repeat)]
+        queryset = PointRanking.objects.filter(match_type=match_type)
+
+        def rank_with_tree(user_id):
+            return index.rank_of(queryset.get(user_id=user_id).total_points)
+
+        def rank_with_count(user_id):
+            return queryset.filter(total_points__gt=queryset.get(user_id=user_id).total_points).count() + 1
+
+        self.measure('유저 순위 조회 (트리)', user_ids, rank_with_tree)
+        self.measure('유저 순위 조회 (COUNT)', user_ids, rank_with_count)
+
+        offsets = [rng.randint(0, user_count - 50) for _ in range(repeat)]
+        self.measure('1위부터 50명 (트리 + 인덱스)', [0] * repeat, lambda offset: index.page(offset, 50, queryset))
+        self.measure(
+            '1위부터 50명 (ORDER BY OFFSET)', [0] * repeat,
+            lambda offset: list(queryset.order_by('-total_points', 'user_id')[offset:offset + 50]),
+        )
+        self.measure('임의 위치 50명 (트리 + 인덱스)', offsets, lambda offset: index.page(offset, 50, queryset))
+        self.measure(
+            '임의 위치 50명 (ORDER BY OFFSET)', offsets,
+            lambda offset: list(queryset.order_by('-total_points', 'user_id')[offset:offset + 50]),
+        )
+
+        def award(user_id):
+            # 실제 서비스와 같이 커밋 후 인덱스에 반영 (롤백되는 벤치마크라 on_commit 대신 직접 호출)
+            with transaction.atomic():
+                changed = apply_point_changes({(user_id, match_type.id): rng.randint(1, 100)})
+            _publish_changes(changed)
+
+        version = index.version
+        self.measure('포인트 지급 (랭킹 테이블 + 인덱스 갱신)', user_ids, award)
+        self.stdout.write(f'지급 후 인덱스 버전 {version} -> {index.version} (다시 불러오지 않고 증분 반영)')
+
+    def measure(self, label, args, func):
+        start = time.perf_counter()
+        for arg in args:
+            func(arg)
+        elapsed = (time.perf_counter() - start) / len(args)
+        self.stdout.write(f'[{label}] 평균 {elapsed * 1000:.2f}ms')
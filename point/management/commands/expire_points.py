@@ -0,0 +1,26 @@
+from django.core.management.base import BaseCommand
+from point.expiry import expire_due_points
+
+
+class Command(BaseCommand):
+    """
+    만료일이 지난 포인트를 배치 단위로 만료 처리하고 랭킹 합계에 반영
+    cron 등으로 주기적으로 실행
+        python manage.py expire_points --batch-size 1000 --sleep 0.1
+    """
+    help = '만료된 포인트 정리'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=1000, help='한번에 만료 처리할 포인트 수')
+        parser.add_argument('--max-batches', type=int, default=None, help='최대 배치 수 (기본: 만료 대상을 모두 처리할 때까지)')
+        parser.add_argument('--sleep', type=float, default=0, help='배치 사이 대기 시간(초)')
+
+    def handle(self, *args, **options):
+        result = expire_due_points(
+            batch_size=options['batch_size'],
+            max_batches=options['max_batches'],
+            sleep=options['sleep'],
+        )
+        self.stdout.write(f'포인트 {result.expired}개 만료, 합계가 바뀐 유저 {len(result.user_ids)}명')
+        for (user_id, match_type_id), (old, new) in sorted(result.changes.items()):
+            self.stdout.write(f'user={user_id} match_type={match_type_id} {old} -> {new}')
@@ -0,0 +1,54 @@
+# Generated by Django 5.0.14 on 2026-10-18 20:06
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        ('matchtype', '0002_alter_matchtype_id'),
+        ('tier', '0004_tier_tier_type_live_level_idx'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Point',
+            fields=[
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('id', models.AutoField(primary_key=True, serialize=False)),
+                ('points', models.IntegerField(default=0)),
+                ('expired_date', models.DateTimeField(blank=True, db_column='expiredDate', null=True)),
+                ('match_type', models.ForeignKey(on_delete=django.db.models.deletion.DO_NOTHING, to='matchtype.matchtype')),
+                ('tier', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.DO_NOTHING, to='tier.tier')),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.DO_NOTHING, to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'db_table': 'point',
+            },
+        ),
+        migrations.CreateModel(
+            name='PointRanking',
+            fields=[
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('id', models.AutoField(primary_key=True, serialize=False)),
+                ('total_points', models.IntegerField(db_column='totalPoints', default=0)),
+                ('match_type', models.ForeignKey(on_delete=django.db.models.deletion.DO_NOTHING, to='matchtype.matchtype')),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.DO_NOTHING, to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'db_table': 'point_ranking',
+                'indexes': [models.Index(fields=['match_type', '-total_points', 'user'], name='point_ranking_order_idx')],
+            },
+        ),
+        migrations.AddConstraint(
+            model_name='pointranking',
+            constraint=models.UniqueConstraint(fields=('match_type', 'user'), name='point_ranking_unique_user'),
+        ),
+    ]
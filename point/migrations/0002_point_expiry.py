@@ -0,0 +1,26 @@
+# Generated by Django 5.0.14 on 2026-10-18 20:12
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('matchtype', '0002_alter_matchtype_id'),
+        ('point', '0001_initial'),
+        ('tier', '0004_tier_tier_type_live_level_idx'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='point',
+            name='is_expired',
+            field=models.BooleanField(db_column='isExpired', default=False),
+        ),
+        migrations.AddIndex(
+            model_name='point',
+            index=models.Index(fields=['is_expired', 'expired_date'], name='point_expiry_idx'),
+        ),
+    ]
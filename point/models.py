@@ -0,0 +1,41 @@
+from django.db import models
+from users.models import CustomUser
+from tier.models import Tier
+from matchtype.models import MatchType
+from core.models import TimeStampedModel
+
+
+# 대회 / 경기 결과로 지급된 포인트 (지급 1건당 1행, 만료일이 지나면 랭킹 합계에서 빠짐)
+class Point(TimeStampedModel):
+    id = models.AutoField(primary_key=True)
+    points = models.IntegerField(default=0)
+    expired_date = models.DateTimeField(db_column='expiredDate', blank=True, null=True)
+    is_expired = models.BooleanField(db_column='isExpired', default=False) # 만료 처리되어 랭킹 합계에서 빠졌는지
+    tier = models.ForeignKey(Tier, models.DO_NOTHING, blank=True, null=True)
+    user = models.ForeignKey(CustomUser, models.DO_NOTHING)
+    match_type = models.ForeignKey(MatchType, models.DO_NOTHING)
+
+    class Meta:
+        db_table = 'point'
+        indexes = [
+            # 만료 처리 대상 조회 (만료되지 않은 포인트를 만료일 순으로 앞에서부터 읽음)
+            models.Index(fields=['is_expired', 'expired_date'], name='point_expiry_idx'),
+        ]
+
+
+# 종목별 유저 포인트 합계 (포인트 지급 / 만료 때 증분으로 갱신되는 랭킹 테이블)
+class PointRanking(TimeStampedModel):
+    id = models.AutoField(primary_key=True)
+    user = models.ForeignKey(CustomUser, models.DO_NOTHING)
+    match_type = models.ForeignKey(MatchType, models.DO_NOTHING)
+    total_points = models.IntegerField(db_column='totalPoints', default=0)
+
+    class Meta:
+        db_table = 'point_ranking'
+        constraints = [
+            models.UniqueConstraint(fields=['match_type', 'user'], name='point_ranking_unique_user'),
+        ]
+        indexes = [
+            # 랭킹 페이지 조회 (포인트 내림차순, 동점은 유저 id 순)
+            models.Index(fields=['match_type', '-total_points', 'user'], name='point_ranking_order_idx'),
+        ]
@@ -0,0 +1,272 @@
+import threading
+import time
+from collections import defaultdict
+
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import Count
+from django.utils import timezone
+from .models import Point, PointRanking
+
+
+RANKING_VERSION_KEY = 'point:ranking:{match_type_id}:version'
+
+
+class ScoreTree:
+    """
+    포인트 점수별 유저 수를 담는 펜윅 트리 (Binary Indexed Tree)
+
+    '나보다 점수가 높은 유저 수' 와 '위에서 k 번째 유저의 점수' 를
+    전체 유저 수와 상관없이 O(log 최대점수) 로 구한다. (점수 0 이하는 랭킹에 포함하지 않음)
+    """
+    def __init__(self, size=1024):
+        self.size = size
+        self.tree = [0] * (size + 1)
+        self.total = 0
+
+    @classmethod
+    def from_counts(cls, counts, size=1024):
+        """
+        {점수: 유저 수} 로 트리를 O(최대점수) 에 만든다
+        """
+        max_score = max(counts, default=0)
+        while size < max_score:
+            size *= 2
+        score_tree = cls(size)
+        tree = score_tree.tree
+        for score, count in counts.items():
+            if score > 0:
+                tree[score] += count
+                score_tree.total += count
+        for i in range(1, size + 1):
+            parent = i + (i & -i)
+            if parent <= size:
+                tree[parent] += tree[i]
+        return score_tree
+
+    def _grow(self, score):
+        size = self.size * 2
+        while size < score:
+            size *= 2
+        grown = ScoreTree.from_counts({s: self.count_at(s) for s in range(1, self.size + 1)}, size=size)
+        self.size, self.tree, self.total = grown.size, grown.tree, grown.total
+
+    def add(self, score, count):
+        if score <= 0 or not count:
+            return
+        if score > self.size:
+            self._grow(score)
+        self.total += count
+        while score <= self.size:
+            self.tree[score] += count
+            score += score & -score
+
+    def count_le(self, score):
+        """
+        점수가 score 이하인 유저 수
+        """
+        score = min(score, self.size)
+        result = 0
+        while score > 0:
+            result += self.tree[score]
+            score -= score & -score
+        return result
+
+    def count_at(self, score):
+        return self.count_le(score) - self.count_le(score - 1)
+
+    def count_above(self, score):
+        """
+        점수가 score 보다 높은 유저 수 (score 점인 유저의 순위는 이 값 + 1)
+        """
+        return self.total - self.count_le(max(score, 0))
+
+    def score_at(self, offset):
+        """
+        위에서 offset 번째(0부터) 유저의 점수 (offset 이 유저 수 이상이면 None)
+        """
+        if offset < 0 or offset >= self.total:
+            return None
+        # 아래에서 k 번째 유저가 처음 포함되는 점수를 트리를 내려가며 찾는다
+        k = self.total - offset
+        position = 0
+        step = self.size # size 는 항상 2의 거듭제곱
+        while step:
+            next_position = position + step
+            if next_position <= self.size and self.tree[next_position] < k:
+                position = next_position
+                k -= self.tree[next_position]
+            step >>= 1
+        return position + 1
+
+
+def bump_ranking_version(match_type_id):
+    """
+    랭킹이 바뀐 뒤(커밋 후) 호출, 새 버전을 반환
+    """
+    key = RANKING_VERSION_KEY.format(match_type_id=match_type_id)
+    if cache.add(key, 1, None):
+        return 1
+    try:
+        return cache.incr(key)
+    except ValueError:
+        cache.set(key, 1, None)
+        return 1
+
+
+def get_ranking_version(match_type_id):
+    key = RANKING_VERSION_KEY.format(match_type_id=match_type_id)
+    version = cache.get(key)
+    if version is None:
+        # 캐시에서 사라졌으면 새 버전으로 시작해서 모든 프로세스가 다시 불러오도록 함
+        cache.add(key, int(time.time() * 1000), None)
+        version = cache.get(key)
+    return version
+
+
+class RankingIndex:
+    """
+    종목 1개의 점수 분포(ScoreTree) 를 프로세스 메모리에 들고 순위를 계산하는 인덱스
+
+    공유 캐시의 버전이 바뀌었을 때만 DB 에서 점수별 유저 수를 다시 불러오고,
+    이 프로세스에서 지급한 포인트는 버전이 이어지는 경우 트리에 바로 반영한다.
+    """
+    def __init__(self, match_type_id):
+        self.match_type_id = match_type_id
+        self.scores = ScoreTree()
+        self.version = None
+        self._lock = threading.Lock()
+
+    def get_scores(self):
+        version = get_ranking_version(self.match_type_id)
+        if version != self.version:
+            self.load(version)
+        return self.scores
+
+    def load(self, version):
+        with self._lock:
+            if version == self.version:
+                return
+            counts = dict(
+                PointRanking.objects.filter(match_type_id=self.match_type_id, total_points__gt=0)
+                .values_list('total_points')
+                .annotate(count=Count('id'))
+                .order_by()
+            )
+            self.scores = ScoreTree.from_counts(counts)
+            self.version = version
+
+    def apply(self, changes, version):
+        """
+        changes: [(이전 점수, 새 점수), ...] / version: 이 변경으로 올라간 버전
+        다른 프로세스의 변경이 사이에 끼었으면 반영하지 않고 다음 조회 때 다시 불러온다.
+        """
+        with self._lock:
+            if self.version != version - 1:
+                return
+            for old, new in changes:
+                self.scores.add(old, -1)
+                self.scores.add(new, 1)
+            self.version = version
+
+    def rank_of(self, total_points):
+        if total_points <= 0:
+            return None
+        return self.get_scores().count_above(total_points) + 1
+
+    def page(self, offset, limit, queryset=None):
+        """
+        위에서 offset 번째부터 limit 명의 [(순위, PointRanking), ...]
+        전체를 정렬하지 않고 트리로 시작 점수를 찾은 뒤 (종목, 포인트, 유저) 인덱스로 바로 조회한다.
+        """
+        if queryset is None:
+            queryset = PointRanking.objects.select_related('user')
+        scores = self.get_scores()
+        start_score = scores.score_at(offset)
+        if start_score is None:
+            return []
+        # 시작 점수의 동점자 중 앞 페이지에 나온 인원만 건너뛴다
+        skip = offset - scores.count_above(start_score)
+        rows = (
+            queryset.filter(match_type_id=self.match_type_id, total_points__gt=0, total_points__lte=start_score)
+            .order_by('-total_points', 'user_id')[skip:skip + limit]
+        )
+        return [(scores.count_above(row.total_points) + 1, row) for row in rows]
+
+
+class RankingRegistry:
+    def __init__(self):
+        self.indexes = {}
+        self._lock = threading.Lock()
+
+    def get(self, match_type_id):
+        index = self.indexes.get(match_type_id)
+        if index is None:
+            with self._lock:
+                index = self.indexes.setdefault(match_type_id, RankingIndex(match_type_id))
+        return index
+
+    def clear(self):
+        with self._lock:
+            self.indexes = {}
+
+
+rankings = RankingRegistry()
+
+
+def apply_point_changes(deltas):
+    """
+    deltas: {(user_id, match_type_id): 포인트 증감} 을 랭킹 테이블에 반영
+    해당 유저들의 행만 잠그고 갱신하며, 커밋 후 종목별 랭킹 버전을 올린다.
+    반환값: {match_type_id: [(user_id, 이전 합계, 새 합계), ...]}
+    """
+    deltas = {key: delta for key, delta in deltas.items() if delta}
+    if not deltas:
+        return {}
+
+    by_match_type = defaultdict(dict)
+    for (user_id, match_type_id), delta in deltas.items():
+        by_match_type[match_type_id][user_id] = delta
+
+    changed = {}
+    now = timezone.now()
+    with transaction.atomic():
+        for match_type_id, user_deltas in sorted(by_match_type.items()):
+            # 처음 포인트를 받는 유저의 행을 먼저 만든다 (동시에 만들어져도 충돌 무시)
+            PointRanking.objects.bulk_create(
+                [PointRanking(user_id=user_id, match_type_id=match_type_id) for user_id in user_deltas],
+                ignore_conflicts=True,
+            )
+            rows = list(
+                PointRanking.objects.select_for_update()
+                .filter(match_type_id=match_type_id, user_id__in=user_deltas)
+                .order_by('id')
+            )
+            changed[match_type_id] = []
+            for row in rows:
+                old = row.total_points
+                row.total_points = old + user_deltas[row.user_id]
+                row.updated_at = now
+                changed[match_type_id].append((row.user_id, old, row.total_points))
+            PointRanking.objects.bulk_update(rows, ['total_points', 'updated_at'])
+
+        transaction.on_commit(lambda: _publish_changes(changed))
+    return changed
+
+
+def _publish_changes(changed):
+    for match_type_id, rows in changed.items():
+        version = bump_ranking_version(match_type_id)
+        rankings.get(match_type_id).apply([(old, new) for _, old, new in rows], version)
+
+
+def award_points(user, match_type, points, expired_date=None, tier=None):
+    """
+    포인트를 지급하고 종목 랭킹에 반영
+    """
+    with transaction.atomic():
+        point = Point.objects.create(
+            user=user, match_type=match_type, points=points, expired_date=expired_date, tier=tier,
+        )
+        apply_point_changes({(user.id, match_type.id): points})
+    return point
@@ -0,0 +1,12 @@
+from rest_framework import serializers
+from .models import PointRanking
+
+
+class PointRankingSerializer(serializers.ModelSerializer):
+    rank = serializers.IntegerField(read_only=True) # RankingIndex 로 계산해서 넣어줌
+    username = serializers.CharField(source='user.username', read_only=True)
+    points = serializers.IntegerField(source='total_points', read_only=True)
+
+    class Meta:
+        model = PointRanking
+        fields = ['rank', 'user', 'username', 'points']
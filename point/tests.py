@@ -0,0 +1,173 @@
+import random
+from datetime import timedelta
+
+from django.core.cache import cache
+from django.test import TestCase
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.test import APIClient
+from matchtype.models import MatchType
+from users.models import CustomUser
+from .expiry import expire_due_points
+from .models import PointRanking
+from .ranking import ScoreTree, apply_point_changes, award_points, bump_ranking_version, rankings
+
+
+class ScoreTreeTest(TestCase):
+    """
+    펜윅 트리 순위 계산을 정렬 결과와 비교하는 테스트
+    """
+    def test_matches_sorted_scores(self):
+        rng = random.Random(0)
+        scores = [rng.randint(1, 5000) for _ in range(2000)]
+        tree = ScoreTree() # 최대 점수가 초기 크기보다 커서 중간에 트리가 늘어남
+        for score in scores:
+            tree.add(score, 1)
+
+        ordered = sorted(scores, reverse=True)
+        self.assertEqual(tree.total, len(scores))
+        for offset in (0, 1, 500, 1999):
+            self.assertEqual(tree.score_at(offset), ordered[offset])
+        for score in (1, 2500, 5000, 6000):
+            self.assertEqual(tree.count_above(score), sum(1 for s in scores if s > score))
+        self.assertIsNone(tree.score_at(2000))
+
+    def test_zero_scores_are_not_ranked(self):
+        tree = ScoreTree.from_counts({0: 5, 10: 2})
+
+        self.assertEqual(tree.total, 2)
+
+
+class PointRankingTest(TestCase):
+    """
+    포인트 지급 시 랭킹 테이블 / 인덱스 증분 갱신과 랭킹 API 테스트
+    """
+    def setUp(self):
+        cache.clear()
+        rankings.clear()
+        self.client = APIClient()
+        self.url = reverse('point-rankings')
+        self.match_type = MatchType.objects.create(gender='male', type='single')
+        self.users = CustomUser.objects.bulk_create([
+            CustomUser(phone=f'rank-{i}', username=f'유저{i}', birth=1990, gender='male') for i in range(6)
+        ])
+
+    def award(self, user, points):
+        with self.captureOnCommitCallbacks(execute=True):
+            award_points(user, self.match_type, points)
+
+    def get_page(self, **params):
+        response = self.client.get(self.url, {'match_type': self.match_type.id, **params})
+        self.assertEqual(response.status_code, 200)
+        return response.data
+
+    def test_ranking_page_orders_by_points_with_shared_rank_for_ties(self):
+        for user, points in zip(self.users, [100, 300, 200, 300, 50, 0]):
+            self.award(user, points)
+
+        data = self.get_page()
+
+        self.assertEqual(data['count'], 5) # 0점 유저는 랭킹에서 제외
+        ranks = [(row['rank'], row['user'], row['points']) for row in data['results']]
+        self.assertEqual(ranks, [
+            (1, self.users[1].id, 300), (1, self.users[3].id, 300),
+            (3, self.users[2].id, 200), (4, self.users[0].id, 100), (5, self.users[4].id, 50),
+        ])
+
+        # 동점자 중간에서 시작하는 페이지
+        data = self.get_page(page=2, page_size=1)
+        self.assertEqual([(row['rank'], row['user']) for row in data['results']], [(1, self.users[3].id)])
+
+    def test_points_are_accumulated_and_rank_is_updated_incrementally(self):
+        self.award(self.users[0], 100)
+        self.award(self.users[1], 200)
+        self.assertEqual(self.get_page(user=self.users[0].id)['rank'], 2)
+
+        self.award(self.users[0], 150)
+
+        # 이 프로세스에서 반영한 변경은 점수 분포를 다시 불러오지 않는다
+        with self.assertNumQueries(1):
+            data = self.get_page(user=self.users[0].id)
+        self.assertEqual((data['rank'], data['points']), (1, 250))
+        self.assertEqual(PointRanking.objects.get(user=self.users[0]).total_points, 250)
+
+    def test_changes_from_other_process_reload_scores(self):
+        self.award(self.users[0], 100)
+        self.get_page()
+
+        # 다른 프로세스의 변경 (이 프로세스의 인덱스에는 반영되지 않고 버전만 올라감)
+        PointRanking.objects.create(user=self.users[1], match_type=self.match_type, total_points=500)
+        bump_ranking_version(self.match_type.id)
+
+        with self.assertNumQueries(2):
+            data = self.get_page()
+        self.assertEqual(data['count'], 2)
+        self.assertEqual(data['results'][0]['user'], self.users[1].id)
+
+    def test_negative_changes_remove_user_from_ranking(self):
+        self.award(self.users[0], 100)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            apply_point_changes({(self.users[0].id, self.match_type.id): -100})
+
+        self.assertEqual(self.get_page()['count'], 0)
+        response = self.client.get(self.url, {'match_type': self.match_type.id, 'user': self.users[0].id})
+        self.assertEqual(response.status_code, 404)
+
+    def test_match_type_is_required(self):
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, 400)
+
+
+class PointExpiryTest(TestCase):
+    """
+    만료일이 지난 포인트만 배치로 만료 처리되고 합계가 바뀐 유저가 정확히 보고되는지 확인하는 테스트
+    """
+    def setUp(self):
+        cache.clear()
+        rankings.clear()
+        self.now = timezone.now()
+        self.match_type = MatchType.objects.create(gender='male', type='single')
+        self.users = CustomUser.objects.bulk_create([
+            CustomUser(phone=f'expiry-{i}', username=f'유저{i}', birth=1990, gender='male') for i in range(3)
+        ])
+
+    def award(self, user, points, days):
+        with self.captureOnCommitCallbacks(execute=True):
+            award_points(user, self.match_type, points, expired_date=self.now + timedelta(days=days))
+
+    def total(self, user):
+        return PointRanking.objects.get(user=user, match_type=self.match_type).total_points
+
+    def test_only_due_points_are_expired_in_batches(self):
+        for days in (-3, -2, -1):
+            self.award(self.users[0], 10, days)
+        self.award(self.users[0], 100, 30)
+        self.award(self.users[1], 50, -1)
+        self.award(self.users[2], 70, 30)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            result = expire_due_points(now=self.now, batch_size=2)
+
+        self.assertEqual((result.expired, result.batches), (4, 2))
+        self.assertEqual(result.changes, {
+            (self.users[0].id, self.match_type.id): (130, 100),
+            (self.users[1].id, self.match_type.id): (50, 0),
+        })
+        self.assertEqual(result.user_ids, {self.users[0].id, self.users[1].id})
+        self.assertEqual(self.total(self.users[0]), 100)
+        self.assertEqual(self.total(self.users[2]), 70)
+        self.assertEqual(rankings.get(self.match_type.id).get_scores().total, 2)
+
+        # 이미 만료 처리된 포인트는 다시 처리하지 않는다
+        self.assertEqual(expire_due_points(now=self.now).expired, 0)
+
+    def test_max_batches_limits_work_per_run(self):
+        for days in (-3, -2, -1):
+            self.award(self.users[0], 10, days)
+
+        result = expire_due_points(now=self.now, batch_size=1, max_batches=2)
+
+        self.assertEqual(result.expired, 2)
+        self.assertEqual(result.changes, {(self.users[0].id, self.match_type.id): (30, 10)})
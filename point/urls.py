@@ -0,0 +1,7 @@
+from django.urls import path
+from .views import PointRankingView
+
+
+urlpatterns = [
+    path('points/rankings/', PointRankingView.as_view(), name='point-rankings'), # 종목별 포인트 랭킹 API
+]
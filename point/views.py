@@ -0,0 +1,60 @@
+from rest_framework.views import APIView
+from rest_framework.response import Response
+from .models import PointRanking
+from .ranking import rankings
+from .serializers import PointRankingSerializer
+
+
+def _int_param(request, name, default=None):
+    value = request.query_params.get(name)
+    if value in (None, ''):
+        return default
+    try:
+        return int(value)
+    except ValueError:
+        return None
+
+
+class PointRankingView(APIView):
+    """
+    종목별 포인트 랭킹 조회 API
+    ?match_type= 종목 id (필수), ?page= / ?page_size= 로 랭킹 페이지 (최대 100명),
+    ?user= 유저 id 를 주면 해당 유저의 순위만 조회
+    """
+    authentication_classes = ()
+    query_budget = 2 # (점수 분포를 다시 불러올 때 1) + 랭킹 페이지 / 유저 조회 1
+
+    MAX_PAGE_SIZE = 100
+
+    def get(self, request):
+        match_type_id = _int_param(request, 'match_type')
+        if match_type_id is None:
+            return Response({'error': 'match_type 파라미터가 필요합니다.'}, status=400)
+        index = rankings.get(match_type_id)
+
+        if 'user' in request.query_params:
+            user_id = _int_param(request, 'user')
+            row = user_id is not None and (
+                PointRanking.objects.select_related('user')
+                .filter(match_type_id=match_type_id, user_id=user_id, total_points__gt=0).first()
+            )
+            if not row:
+                return Response({'error': '랭킹에 없는 유저입니다.'}, status=404)
+            row.rank = index.rank_of(row.total_points)
+            return Response(PointRankingSerializer(row).data)
+
+        page = _int_param(request, 'page', 1)
+        page_size = _int_param(request, 'page_size', 50)
+        if not page or page < 1 or not page_size or page_size < 1:
+            return Response({'error': 'page / page_size 는 1 이상의 숫자여야 합니다.'}, status=400)
+        page_size = min(page_size, self.MAX_PAGE_SIZE)
+
+        rows = []
+        for rank, row in index.page((page - 1) * page_size, page_size):
+            row.rank = rank
+            rows.append(row)
+        return Response({
+            'count': index.get_scores().total,
+            'page': page,
+            'results': PointRankingSerializer(rows, many=True).data,
+        })
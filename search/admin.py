@@ -0,0 +1,4 @@
+from django.contrib import admin
+
+# Register your models here.
+# (검색 문서는 대회 / 유저 저장 시그널로 갱신되므로 admin 에서 직접 수정하지 않고 rebuild_search_index 로 다시 만든다)
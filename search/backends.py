@@ -0,0 +1,155 @@
+import functools
+import re
+
+from django.conf import settings
+from django.db import connection
+from django.utils.module_loading import import_string
+from .models import SearchDocument
+
+
+MAX_TERMS = 8
+_TERM_RE = re.compile(r'\w+')
+
+
+def split_terms(query):
+    """
+    검색어를 단어(글자 / 숫자)로 나눈다. 인덱스 쿼리 문법 문자(따옴표 / 연산자)는 버려지므로 그대로 쿼리에 넣어도 안전하다.
+    """
+    return _TERM_RE.findall(query.lower())[:MAX_TERMS]
+
+
+class SearchBackend:
+    """
+    검색 인덱스 백엔드 기본 클래스
+    install / uninstall 은 search 앱 마이그레이션에서 search_document 테이블 위에 DB 별 인덱스를 만들고 지울 때 호출된다.
+    """
+    def install(self, schema_editor):
+        pass
+
+    def uninstall(self, schema_editor):
+        pass
+
+    def optimize(self):
+        # 대량으로 다시 만든 뒤 호출 (인덱스 정리)
+        pass
+
+    def search(self, kind, terms, offset, limit):
+        """
+        terms 를 모두 (앞부분이) 포함하는 kind 문서의 원본 id 목록을 관련도 순으로 반환
+        """
+        raise NotImplementedError
+
+
+class SimpleSearchBackend(SearchBackend):
+    """
+    전용 인덱스가 없는 DB 용 (icontains 전체 스캔, 제목 일치를 먼저)
+    """
+    def search(self, kind, terms, offset, limit):
+        queryset = SearchDocument.objects.filter(kind=kind)
+        for term in terms:
+            queryset = queryset.filter(title__icontains=term) | queryset.filter(body__icontains=term)
+        return list(queryset.order_by('title', 'object_id').values_list('object_id', flat=True)[offset:offset + limit])
+
+
+class SQLiteFTS5Backend(SearchBackend):
+    """
+    SQLite FTS5 전문 검색 인덱스 (개발 / 단일 서버)
+    search_document 를 내용 테이블로 쓰는 external content FTS 테이블을 만들고,
+    트리거로 search_document 의 추가 / 수정 / 삭제를 FTS 인덱스에 반영한다. 단어 앞부분 일치, bm25 순위 (제목 가중치 10배)
+    """
+    TABLE = 'search_document_fts'
+    TOKENIZER = 'unicode61 remove_diacritics 2'
+
+    def install(self, schema_editor):
+        table, source = self.TABLE, SearchDocument._meta.db_table
+        for sql in (
+            f"CREATE VIRTUAL TABLE {table} USING fts5(kind, title, body, content='{source}', content_rowid='id', tokenize='{self.TOKENIZER}')",
+            f"CREATE TRIGGER {table}_insert AFTER INSERT ON {source} BEGIN "
+            f"INSERT INTO {table}(rowid, kind, title, body) VALUES (new.id, new.kind, new.title, new.body); END",
+            f"CREATE TRIGGER {table}_delete AFTER DELETE ON {source} BEGIN "
+            f"INSERT INTO {table}({table}, rowid, kind, title, body) VALUES ('delete', old.id, old.kind, old.title, old.body); END",
+            f"CREATE TRIGGER {table}_update AFTER UPDATE ON {source} BEGIN "
+            f"INSERT INTO {table}({table}, rowid, kind, title, body) VALUES ('delete', old.id, old.kind, old.title, old.body); "
+            f"INSERT INTO {table}(rowid, kind, title, body) VALUES (new.id, new.kind, new.title, new.body); END",
+            f"INSERT INTO {table}({table}) VALUES ('rebuild')",
+        ):
+            schema_editor.execute(sql)
+
+    def uninstall(self, schema_editor):
+        for sql in (
+            f'DROP TRIGGER IF EXISTS {self.TABLE}_insert',
+            f'DROP TRIGGER IF EXISTS {self.TABLE}_delete',
+            f'DROP TRIGGER IF EXISTS {self.TABLE}_update',
+            f'DROP TABLE IF EXISTS {self.TABLE}',
+        ):
+            schema_editor.execute(sql)
+
+    def optimize(self):
+        with connection.cursor() as cursor:
+            cursor.execute(f"INSERT INTO {self.TABLE}({self.TABLE}) VALUES ('optimize')")
+
+    def search(self, kind, terms, offset, limit):
+        # kind : "competition" AND {title body} : ("서울"* "오픈"*)
+        words = ' '.join(f'"{term}"*' for term in terms)
+        match = f'kind : "{kind}" AND {{title body}} : ({words})'
+        with connection.cursor() as cursor:
+            # 순위 계산 / LIMIT 를 FTS 테이블 안에서 먼저 하고, 페이지에 들어간 행만 원본 id 를 조회
+            cursor.execute(
+                f'SELECT d."objectId" FROM ('
+                f'SELECT rowid, bm25({self.TABLE}, 0.0, 10.0, 1.0) AS score FROM {self.TABLE} '
+                f'WHERE {self.TABLE} MATCH %s ORDER BY score, rowid LIMIT %s OFFSET %s'
+                f') f JOIN {SearchDocument._meta.db_table} d ON d.id = f.rowid ORDER BY f.score, f.rowid',
+                [match, limit, offset],
+            )
+            return [row[0] for row in cursor.fetchall()]
+
+
+class PostgresSearchBackend(SearchBackend):
+    """
+    PostgreSQL tsvector(단어 앞부분 일치) + pg_trgm(오타 / 부분 일치) GIN 인덱스
+    순위는 ts_rank (제목 가중치 A / 본문 B) + 제목 trigram 유사도
+    """
+    DOCUMENT = "(setweight(to_tsvector('simple', title), 'A') || setweight(to_tsvector('simple', body), 'B'))"
+    TEXT = "(title || ' ' || body)"
+
+    def install(self, schema_editor):
+        table = SearchDocument._meta.db_table
+        for sql in (
+            'CREATE EXTENSION IF NOT EXISTS pg_trgm',
+            f'CREATE INDEX search_document_tsv_idx ON {table} USING gin ({self.DOCUMENT})',
+            f'CREATE INDEX search_document_trgm_idx ON {table} USING gin ({self.TEXT} gin_trgm_ops)',
+        ):
+            schema_editor.execute(sql)
+
+    def uninstall(self, schema_editor):
+        schema_editor.execute('DROP INDEX IF EXISTS search_document_tsv_idx')
+        schema_editor.execute('DROP INDEX IF EXISTS search_document_trgm_idx')
+
+    def search(self, kind, terms, offset, limit):
+        tsquery = ' & '.join(f'{term}:*' for term in terms)
+        text = ' '.join(terms)
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f'SELECT "objectId" FROM {SearchDocument._meta.db_table} '
+                f"WHERE kind = %s AND ({self.DOCUMENT} @@ to_tsquery('simple', %s) OR {self.TEXT} %% %s) "
+                f"ORDER BY ts_rank({self.DOCUMENT}, to_tsquery('simple', %s)) + similarity(title, %s) DESC, \"objectId\" "
+                f"LIMIT %s OFFSET %s",
+                [kind, tsquery, text, tsquery, text, limit, offset],
+            )
+            return [row[0] for row in cursor.fetchall()]
+
+
+BACKENDS = {
+    'sqlite': SQLiteFTS5Backend,
+    'postgresql': PostgresSearchBackend,
+}
+
+
+@functools.cache
+def get_backend():
+    """
+    settings.SEARCH_BACKEND (클래스 경로) 가 있으면 사용하고, 없으면 DB 종류에 맞는 백엔드를 사용
+    """
+    path = getattr(settings, 'SEARCH_BACKEND', None)
+    backend_class = import_string(path) if path else BACKENDS.get(connection.vendor, SimpleSearchBackend)
+    return backend_class()
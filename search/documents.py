@@ -0,0 +1,82 @@
+from django.apps import apps
+from .models import SearchDocument
+
+
+class SearchKind:
+    """
+    검색 대상 모델 1개에 대한 설정 (제목 필드 1개 + 본문 필드 여러 개)
+    """
+    def __init__(self, key, model_label, title, body=()):
+        self.key = key
+        self.model_label = model_label
+        self.title = title
+        self.body = tuple(body)
+
+    @property
+    def model(self):
+        return apps.get_model(self.model_label)
+
+    @property
+    def watched_fields(self):
+        # 이 필드가 바뀌지 않은 save(update_fields=...) 는 문서를 다시 만들 필요가 없다 (예: 로그인 시 last_login 갱신)
+        return {self.title, *self.body, 'is_deleted'}
+
+    def make_document(self, instance):
+        return SearchDocument(
+            kind=self.key,
+            object_id=instance.pk,
+            title=getattr(instance, self.title) or '',
+            body=' '.join(filter(None, (getattr(instance, field) for field in self.body))),
+        )
+
+
+SEARCH_KINDS = {
+    kind.key: kind for kind in (
+        SearchKind('competition', 'competition.Competition', title='name', body=('description', 'address')),
+        SearchKind('player', 'users.CustomUser', title='username'),
+    )
+}
+
+
+def kind_for_model(model):
+    for kind in SEARCH_KINDS.values():
+        if kind.model is model:
+            return kind
+    return None
+
+
+def update_documents(kind, instances):
+    """
+    원본 레코드들의 검색 문서를 한번에 갱신 (없으면 추가, soft delete 된 레코드는 삭제)
+    """
+    live = [instance for instance in instances if not instance.is_deleted]
+    if live:
+        SearchDocument.objects.bulk_create(
+            [kind.make_document(instance) for instance in live],
+            update_conflicts=True, unique_fields=['kind', 'object_id'], update_fields=['title', 'body'],
+        )
+    remove_documents(kind, [instance.pk for instance in instances if instance.is_deleted])
+
+
+def remove_documents(kind, pks):
+    if pks:
+        SearchDocument.objects.filter(kind=kind.key, object_id__in=pks).delete()
+
+
+def rebuild_documents(kind, batch_size=1000):
+    """
+    kind 의 검색 문서를 모두 지우고 삭제되지 않은 원본 레코드로 다시 만든다 (bulk_create 등 시그널 없이 추가된 데이터 반영용)
+    만든 문서 수를 반환
+    """
+    SearchDocument.objects.filter(kind=kind.key).delete()
+    fields = ('pk', kind.title, *kind.body)
+    queryset = kind.model.objects.only(*fields).order_by('pk')
+    created = 0
+    last_pk = 0
+    while True:
+        batch = list(queryset.filter(pk__gt=last_pk)[:batch_size])
+        if not batch:
+            return created
+        SearchDocument.objects.bulk_create([kind.make_document(instance) for instance in batch])
+        created += len(batch)
+        last_pk = batch[-1].pk
@@ -0,0 +1,23 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from search.backends import get_backend
+from search.documents import SEARCH_KINDS, rebuild_documents
+
+
+class Command(BaseCommand):
+    """
+    검색 문서를 원본 테이블에서 다시 만든다 (시그널 없이 bulk_create / update 로 바뀐 데이터 반영, 최초 배포 시)
+        python manage.py rebuild_search_index --kind competition
+    """
+    help = '검색 인덱스 다시 만들기'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--kind', choices=sorted(SEARCH_KINDS), action='append', help='다시 만들 검색 대상 (기본: 전체)')
+        parser.add_argument('--batch-size', type=int, default=1000, help='한번에 만들 문서 수')
+
+    def handle(self, *args, **options):
+        for key in options['kind'] or sorted(SEARCH_KINDS):
+            with transaction.atomic():
+                created = rebuild_documents(SEARCH_KINDS[key], batch_size=options['batch_size'])
+            self.stdout.write(f'{key} 검색 문서 {created}개 생성')
+        get_backend().optimize()
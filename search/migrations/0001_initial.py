@@ -0,0 +1,44 @@
+# Generated by Django 5.0.14 on 2026-10-18 20:57
+
+from django.db import migrations, models
+
+
+# DB 종류에 맞는 검색 인덱스(SQLite FTS5 테이블 + 트리거 / PostgreSQL GIN 인덱스)를 search_document 위에 만든다
+# 기존 대회 / 유저의 검색 문서는 배포 후 rebuild_search_index 로 만든다
+def install_search_index(apps, schema_editor):
+    from search.backends import get_backend
+    get_backend().install(schema_editor)
+
+
+def uninstall_search_index(apps, schema_editor):
+    from search.backends import get_backend
+    get_backend().uninstall(schema_editor)
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SearchDocument',
+            fields=[
+                ('id', models.AutoField(primary_key=True, serialize=False)),
+                ('kind', models.CharField(max_length=20)),
+                ('object_id', models.IntegerField(db_column='objectId')),
+                ('title', models.CharField(max_length=255)),
+                ('body', models.TextField(blank=True, default='')),
+            ],
+            options={
+                'db_table': 'search_document',
+            },
+        ),
+        migrations.AddConstraint(
+            model_name='searchdocument',
+            constraint=models.UniqueConstraint(fields=('kind', 'object_id'), name='search_document_object_uniq'),
+        ),
+        migrations.RunPython(install_search_index, uninstall_search_index),
+    ]
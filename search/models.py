@@ -0,0 +1,17 @@
+from django.db import models
+
+
+# 검색 대상(대회 / 선수) 1건당 1행, 원본 모델이 저장될 때 시그널로 갱신된다
+# 실제 검색 인덱스(SQLite FTS5 / PostgreSQL GIN)는 DB 마다 search.backends 에서 이 테이블 위에 만든다
+class SearchDocument(models.Model):
+    id = models.AutoField(primary_key=True)
+    kind = models.CharField(max_length=20) # search.documents.SEARCH_KINDS 의 키
+    object_id = models.IntegerField(db_column='objectId')
+    title = models.CharField(max_length=255) # 대회명 / 유저명 (순위 계산 시 가중치가 높음)
+    body = models.TextField(blank=True, default='') # 대회 설명 / 주소
+
+    class Meta:
+        db_table = 'search_document'
+        constraints = [
+            models.UniqueConstraint(fields=['kind', 'object_id'], name='search_document_object_uniq'),
+        ]
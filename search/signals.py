@@ -0,0 +1,29 @@
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+from competition.models import Competition
+from core.signals import soft_deleted
+from users.models import CustomUser
+from .documents import kind_for_model, remove_documents, update_documents
+
+
+# 검색 문서는 원본과 같은 트랜잭션에서 갱신한다 (롤백되면 문서 변경도 함께 롤백)
+@receiver(post_save, sender=Competition)
+@receiver(post_save, sender=CustomUser)
+def update_search_document(sender, instance, update_fields=None, **kwargs):
+    kind = kind_for_model(sender)
+    if update_fields is not None and not kind.watched_fields.intersection(update_fields):
+        return
+    update_documents(kind, [instance])
+
+
+@receiver(post_delete, sender=Competition)
+@receiver(post_delete, sender=CustomUser)
+def remove_search_document(sender, instance, **kwargs):
+    remove_documents(kind_for_model(sender), [instance.pk])
+
+
+# 어드민 일괄 soft delete (instance 없이 pks 로 전달)
+@receiver(soft_deleted, sender=Competition)
+@receiver(soft_deleted, sender=CustomUser)
+def remove_search_documents_on_soft_delete(sender, pks, **kwargs):
+    remove_documents(kind_for_model(sender), pks)
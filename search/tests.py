@@ -0,0 +1,110 @@
+from django.core.management import call_command
+from django.test import TestCase
+from django.urls import reverse
+from rest_framework.test import APIClient
+from competition.models import Competition
+from users.models import CustomUser
+from .backends import get_backend, split_terms
+from .documents import SEARCH_KINDS
+from .models import SearchDocument
+
+
+def create_user(phone, username):
+    return CustomUser.objects.create(phone=phone, username=username, birth=1990, gender='male')
+
+
+class SearchIndexTest(TestCase):
+    """
+    저장 시그널로 검색 문서 / 인덱스가 갱신되는지 확인하는 테스트
+    """
+    def search(self, kind, query):
+        return get_backend().search(kind, split_terms(query), 0, 20)
+
+    def test_saved_competition_is_searchable_by_word_prefix(self):
+        competition = Competition.objects.create(name='서울 오픈 테니스', description='동호인 대회', address='서울시 송파구')
+
+        self.assertEqual(self.search('competition', '서울'), [competition.id])
+        self.assertEqual(self.search('competition', '송파 동호'), [competition.id])
+        self.assertEqual(self.search('competition', '부산'), [])
+        self.assertEqual(self.search('player', '서울'), []) # 다른 검색 대상은 섞이지 않음
+
+    def test_update_and_soft_delete_are_reflected(self):
+        competition = Competition.objects.create(name='서울 오픈')
+
+        competition.name = '부산 오픈'
+        competition.save()
+        self.assertEqual(self.search('competition', '서울'), [])
+        self.assertEqual(self.search('competition', '부산'), [competition.id])
+
+        competition.delete()
+        self.assertEqual(self.search('competition', '부산'), [])
+        self.assertFalse(SearchDocument.objects.filter(kind='competition').exists())
+
+    def test_bulk_soft_delete_removes_documents(self):
+        user = create_user('010-1', 'Federer')
+
+        CustomUser.objects.filter(pk=user.pk).soft_delete()
+
+        self.assertEqual(self.search('player', 'fed'), [])
+
+    def test_unrelated_update_fields_do_not_touch_index(self):
+        user = create_user('010-1', 'Nadal')
+
+        with self.assertNumQueries(1): # 유저 UPDATE 만 실행
+            user.save(update_fields=['last_login'])
+
+    def test_title_match_ranks_above_body_match(self):
+        in_body = Competition.objects.create(name='봄 대회', description='잠실 코트에서 열리는 대회')
+        in_title = Competition.objects.create(name='잠실 오픈', description='봄 대회')
+
+        self.assertEqual(self.search('competition', '잠실'), [in_title.id, in_body.id])
+
+    def test_rebuild_indexes_rows_created_without_signals(self):
+        Competition.objects.bulk_create([Competition(name=f'대회 {i}') for i in range(5)])
+        self.assertEqual(self.search('competition', '대회'), [])
+
+        call_command('rebuild_search_index', kind=['competition'], stdout=open('/dev/null', 'w'))
+
+        self.assertEqual(len(self.search('competition', '대회')), 5)
+        self.assertEqual(SearchDocument.objects.count(), 5)
+        self.assertEqual(SEARCH_KINDS['competition'].model, Competition)
+
+
+class SearchViewTest(TestCase):
+    """
+    대회 / 선수 검색 API 테스트
+    """
+    def setUp(self):
+        self.client = APIClient()
+
+    def test_competition_results_are_paginated(self):
+        competitions = [Competition.objects.create(name=f'테니스 대회 {i}') for i in range(5)]
+        url = reverse('search-competitions')
+
+        first = self.client.get(url, {'q': '테니스', 'page_size': 3})
+        second = self.client.get(url, {'q': '테니스', 'page_size': 3, 'page': first.data['next']})
+
+        self.assertEqual(first.status_code, 200)
+        self.assertEqual(first.data['next'], 2)
+        self.assertIsNone(second.data['next'])
+        ids = [row['id'] for row in first.data['results'] + second.data['results']]
+        self.assertEqual(sorted(ids), [competition.id for competition in competitions])
+
+    def test_player_search_by_username_prefix(self):
+        create_user('010-1', '김테니스')
+        create_user('010-2', '이테니스')
+
+        response = self.client.get(reverse('search-players'), {'q': '김테'})
+        self.assertEqual([row['username'] for row in response.data['results']], ['김테니스'])
+
+    def test_empty_query_returns_400(self):
+        response = self.client.get(reverse('search-competitions'), {'q': '  "*'})
+
+        self.assertEqual(response.status_code, 400)
+
+    def test_invalid_page_returns_400(self):
+        url = reverse('search-competitions')
+        for page in ('abc', '0', '1001', '99999999999999999999'):
+            response = self.client.get(url, {'q': '테니스', 'page': page})
+
+            self.assertEqual(response.status_code, 400, page)
@@ -0,0 +1,8 @@
+from django.urls import path
+from .views import CompetitionSearchView, PlayerSearchView
+
+
+urlpatterns = [
+    path('search/competitions/', CompetitionSearchView.as_view(), name='search-competitions'), # 대회 검색 API
+    path('search/players/', PlayerSearchView.as_view(), name='search-players'), # 선수 검색 API
+]
@@ -0,0 +1,80 @@
+from rest_framework.views import APIView
+from rest_framework.response import Response
+from club.serializers import UserWithTeamInfoSerializer
+from competition.models import Competition
+from competition.serializers import CompetitionListSerializer
+from users.models import CustomUser
+from .backends import get_backend, split_terms
+
+
+def _int_param(request, name, default):
+    value = request.query_params.get(name)
+    if value in (None, ''):
+        return default
+    try:
+        return int(value)
+    except ValueError:
+        return None
+
+
+class SearchView(APIView):
+    """
+    검색 API 기본 클래스
+    ?q= 검색어 (단어마다 앞부분 일치, 모두 포함), ?page= / ?page_size= 로 관련도 순 페이지 (최대 50개, 1000 페이지까지)
+    검색 인덱스에서 id 만 관련도 순으로 가져온 뒤 원본 레코드를 한번에 조회한다.
+    """
+    kind = None
+    serializer_class = None
+    MAX_PAGE_SIZE = 50
+    MAX_PAGE = 1000 # OFFSET 이 DB 정수 범위를 넘지 않도록 제한 (깊은 페이지는 관련도가 낮아 의미도 없음)
+
+    def get_queryset(self):
+        raise NotImplementedError
+
+    def get(self, request):
+        terms = split_terms(request.query_params.get('q', ''))
+        if not terms:
+            return Response({'error': 'q 파라미터에 검색어가 필요합니다.'}, status=400)
+        page = _int_param(request, 'page', 1)
+        page_size = _int_param(request, 'page_size', 20)
+        if not page or page < 1 or not page_size or page_size < 1:
+            return Response({'error': 'page / page_size 는 1 이상의 숫자여야 합니다.'}, status=400)
+        if page > self.MAX_PAGE:
+            return Response({'error': f'page 는 {self.MAX_PAGE} 이하여야 합니다.'}, status=400)
+        page_size = min(page_size, self.MAX_PAGE_SIZE)
+
+        # 다음 페이지가 있는지 알기 위해 1개 더 가져옴 (전체 개수는 세지 않음)
+        ids = get_backend().search(self.kind, terms, (page - 1) * page_size, page_size + 1)
+        has_next = len(ids) > page_size
+        ids = ids[:page_size]
+        objects = self.get_queryset().in_bulk(ids)
+        return Response({
+            'page': page,
+            'next': page + 1 if has_next else None,
+            'results': self.serializer_class([objects[pk] for pk in ids if pk in objects], many=True).data,
+        })
+
+
+class CompetitionSearchView(SearchView):
+    """
+    대회 검색 API (대회명 / 설명 / 주소)
+    """
+    authentication_classes = ()
+    query_budget = 5 # 검색 / 대회 (이미지 JOIN) / 리사이즈 이미지 3 + (참조 캐시를 다시 불러올 때 종목 / 티어 2)
+    kind = 'competition'
+    serializer_class = CompetitionListSerializer
+
+    def get_queryset(self):
+        return Competition.objects.select_related('image_url').prefetch_related('image_url__variants')
+
+
+class PlayerSearchView(SearchView):
+    """
+    선수 검색 API (유저명)
+    """
+    query_budget = 4 # 인증 1 + 검색 / 유저 (팀 / 이미지 JOIN) / 리사이즈 이미지 3
+    kind = 'player'
+    serializer_class = UserWithTeamInfoSerializer
+
+    def get_queryset(self):
+        return CustomUser.objects.select_related('team', 'image_url').prefetch_related('image_url__variants')
@@ -1,4 +1,5 @@
 from django.contrib import admin
+from core.admin import SoftDeleteAdmin
 from .models import Team
 
-admin.site.register(Team)
+admin.site.register(Team, SoftDeleteAdmin)
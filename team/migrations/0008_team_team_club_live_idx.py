@@ -0,0 +1,19 @@
+# Generated by Django 5.0.14 on 2026-10-18 19:57
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('club', '0009_club_club_live_name_idx'),
+        ('image_url', '0015_imageurl_original_imageurl_variant_size'),
+        ('team', '0007_alter_team_id'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='team',
+            index=models.Index(fields=['club', 'is_deleted'], name='team_club_live_idx'),
+        ),
+    ]
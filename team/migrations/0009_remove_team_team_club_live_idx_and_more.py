@@ -0,0 +1,23 @@
+# Generated by Django 5.0.14 on 2026-10-18 20:01
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('club', '0009_club_club_live_name_idx'),
+        ('image_url', '0015_imageurl_original_imageurl_variant_size'),
+        ('team', '0008_team_team_club_live_idx'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='team',
+            name='team_club_live_idx',
+        ),
+        migrations.AddIndex(
+            model_name='team',
+            index=models.Index(fields=['club', 'is_deleted', 'id'], name='team_club_live_idx'),
+        ),
+    ]
@@ -12,4 +12,7 @@ class Team(TimeStampedModel, SoftDeleteModel):
         return self.name
 
     class Meta:
-        db_table = 'team'
\ No newline at end of file
+        db_table = 'team'
+        indexes = [
+            models.Index(fields=['club', 'is_deleted', 'id'], name='team_club_live_idx'), # 클럽 소속 팀 조회 (id 순 커서 페이지네이션 포함)
+        ]
\ No newline at end of file
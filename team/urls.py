@@ -1,7 +1,8 @@
 from django.urls import path
-from .views import TeamDetailView
+from .views import TeamDetailView, TeamMemberListView
 
 
 urlpatterns = [# 클럽 목록 조회 API
     path('team/<int:pk>/', TeamDetailView.as_view(), name='team-detail'), # 팀 상세 정보 API
+    path('team/<int:pk>/members/', TeamMemberListView.as_view(), name='team-members'), # 팀 소속 유저 목록 API
 ]
\ No newline at end of file
@@ -4,18 +4,21 @@ from .models import Team
 from users.models import CustomUser
 from .serializers import TeamDetailSerializer
 from club.serializers import UserWithTeamInfoSerializer
+from core.views import SubResourceListView
 
 class TeamDetailView(APIView):
     """
     팀 상세 정보 조회하는 API
     """
+    query_budget = 4 # 인증 1 + 팀 / 유저 / 유저 리사이즈 이미지 3
+
     def get(self, request, pk):
         try:
-            team = Team.objects.get(pk=pk)
+            team = Team.objects.select_related('image_url').get(pk=pk)
             team_serializer = TeamDetailSerializer(team)
 
             # 팀에 속한 유저 정보 가져오기 (코치로 등록된 유저 제외)
-            users = CustomUser.objects.filter(team=team)
+            users = CustomUser.objects.filter(team=team).select_related('image_url', 'team').prefetch_related('image_url__variants')
             user_serializer = UserWithTeamInfoSerializer(users, many=True)
 
             # 클럽 정보와 함께 코치, 팀, 유저 정보 포함하여 응답
@@ -26,4 +29,17 @@ class TeamDetailView(APIView):
             
             return Response(response_data)
         except Team.DoesNotExist:
-            return Response({'error': '해당팀이 존재하지 않습니다.'}, status=404)
\ No newline at end of file
+            return Response({'error': '해당팀이 존재하지 않습니다.'}, status=404)
+
+class TeamMemberListView(SubResourceListView):
+    """
+    팀 소속 유저 목록 API (커서 페이지네이션, ?stream=1 이면 전체 명단 스트리밍 내보내기)
+    """
+    parent_model = Team
+    not_found_message = '해당팀이 존재하지 않습니다.'
+    serializer_class = UserWithTeamInfoSerializer
+    query_budget = 4 # 인증 1 + 팀 확인 / 목록 페이지 / 리사이즈 이미지 3
+
+    def get_queryset(self, parent_id):
+        return (CustomUser.objects.filter(team_id=parent_id)
+                .select_related('image_url', 'team').prefetch_related('image_url__variants'))
@@ -4,3 +4,8 @@ from django.apps import AppConfig
 class TierConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'tier'
+
+    def ready(self):
+        from . import signals # noqa: F401 (티어 캐시 무효화 시그널 등록)
+        from .cache import tiers
+        tiers.warm_on_first_request()
@@ -0,0 +1,6 @@
+from core.reference_cache import ReferenceCache
+from .models import Tier
+
+
+# 티어 id -> Tier (삭제되지 않은 티어만, match_type 포함 / 프로세스 메모리 캐시)
+tiers = ReferenceCache(lambda: Tier.objects.select_related('match_type'), 'tier:reference:version')
@@ -0,0 +1,25 @@
+import time
+
+from django.core.management.base import BaseCommand
+from tier.recompute import recompute_tiers
+
+
+class Command(BaseCommand):
+    """
+    종목 포인트 합계로 모든 유저의 티어를 다시 계산해서 바뀐 유저만 저장
+    cron 등으로 주기적으로 실행
+        python manage.py recompute_tiers --match-type 1 --chunk-size 50000
+    """
+    help = '유저 티어 일괄 재계산'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--match-type', type=int, required=True, help='티어 기준 종목 id')
+        parser.add_argument('--chunk-size', type=int, default=50000, help='한번에 메모리에 올릴 유저 수')
+        parser.add_argument('--batch-size', type=int, default=1000, help='bulk_update 1번에 저장할 유저 수')
+
+    def handle(self, *args, **options):
+        start = time.perf_counter()
+        checked, changed = recompute_tiers(
+            options['match_type'], chunk_size=options['chunk_size'], batch_size=options['batch_size'],
+        )
+        self.stdout.write(f'유저 {checked}명 확인, 티어 변경 {changed}명 ({time.perf_counter() - start:.1f}s)')
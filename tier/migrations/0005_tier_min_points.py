@@ -0,0 +1,18 @@
+# Generated by Django 5.0.14 on 2026-10-18 20:21
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tier', '0004_tier_tier_type_live_level_idx'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='tier',
+            name='min_points',
+            field=models.IntegerField(db_column='minPoints', default=0),
+        ),
+    ]
@@ -5,7 +5,11 @@ class Tier(TimeStampedModel, SoftDeleteModel):
     id = models.AutoField(primary_key=True)
     name = models.CharField(max_length=6, blank=True, null=True)
     level = models.IntegerField(blank=True, null=True)
+    min_points = models.IntegerField(db_column='minPoints', default=0) # 이 티어가 되기 위한 종목 포인트 합계 최소값 (recompute_tiers 에서 사용)
     match_type = models.ForeignKey(MatchType, models.DO_NOTHING)
 
     class Meta:
         db_table = 'tier'
+        indexes = [
+            models.Index(fields=['match_type', 'is_deleted', 'level'], name='tier_type_live_level_idx'), # 종목별 티어 조회
+        ]
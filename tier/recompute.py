@@ -0,0 +1,77 @@
+import numpy as np
+from django.db import transaction
+from django.db.models import Value
+from django.db.models.functions import Coalesce
+from django.utils import timezone
+from point.models import PointRanking
+from users.models import CustomUser
+from .models import Tier
+
+
+NO_TIER = -1 # 배열에서 티어 없음(null) 표시
+
+
+def recompute_tiers(match_type_id, chunk_size=50000, batch_size=1000):
+    """
+    유저의 종목 포인트 합계로 티어를 다시 계산해서 바뀐 유저만 저장 (티어별로 batch_size 명씩 UPDATE)
+
+    유저 id 순으로 chunk_size 명씩 (유저 id, 현재 티어) / (유저 id, 포인트) 를 배열로 읽어
+    티어의 min_points 경계에 searchsorted 로 한번에 배정하므로 메모리는 chunk 크기만큼만 쓴다.
+    (포인트가 가장 낮은 티어의 min_points 보다 작으면 티어 없음)
+    다른 종목의 티어를 가진 유저는 이 종목 포인트가 있을 때만 바꾼다. (포인트가 없다고 다른 종목 티어를 지우지 않음)
+    반환값: (확인한 유저 수, 티어가 바뀐 유저 수)
+    """
+    tiers = list(
+        Tier.objects.filter(match_type_id=match_type_id).order_by('min_points', 'level').values_list('min_points', 'id')
+    )
+    thresholds = np.array([min_points for min_points, _ in tiers], dtype=np.int64)
+    # 0번 자리는 가장 낮은 티어보다 포인트가 적은 경우 (티어 없음)
+    tier_ids = np.array([NO_TIER] + [tier_id for _, tier_id in tiers], dtype=np.int64)
+    # 이 종목의 티어 (삭제된 티어 포함) 를 가진 유저 / 티어가 없는 유저는 포인트가 없어도 다시 계산한다
+    own_tier_ids = np.array(
+        [NO_TIER] + list(Tier.all_objects.filter(match_type_id=match_type_id).values_list('id', flat=True)),
+        dtype=np.int64,
+    )
+
+    checked = changed = 0
+    last_id = 0
+    while True:
+        users = np.array(
+            CustomUser.objects.filter(id__gt=last_id).order_by('id')
+            .values_list('id', Coalesce('tier_id', Value(NO_TIER)))[:chunk_size],
+            dtype=np.int64,
+        ).reshape(-1, 2)
+        if not len(users):
+            break
+        user_ids, current = users[:, 0], users[:, 1]
+        last_id = int(user_ids[-1])
+
+        points = np.zeros(len(user_ids), dtype=np.int64)
+        has_points = np.zeros(len(user_ids), dtype=bool)
+        ranked = np.array(
+            PointRanking.objects.filter(
+                match_type_id=match_type_id, user_id__gte=int(user_ids[0]), user_id__lte=last_id,
+            ).values_list('user_id', 'total_points'),
+            dtype=np.int64,
+        ).reshape(-1, 2)
+        if len(ranked):
+            # 유저 id 가 정렬되어 있으므로 searchsorted 로 포인트 위치를 찾는다 (탈퇴 유저의 포인트는 버림)
+            positions = np.searchsorted(user_ids, ranked[:, 0])
+            found = (positions < len(user_ids)) & (user_ids[np.minimum(positions, len(user_ids) - 1)] == ranked[:, 0])
+            points[positions[found]] = ranked[found, 1]
+            has_points[positions[found]] = True
+
+        new = tier_ids[np.searchsorted(thresholds, points, side='right')]
+
+        diff = (new != current) & (has_points | np.isin(current, own_tier_ids))
+        with transaction.atomic():
+            # 새 티어별로 묶어서 batch_size 명씩 UPDATE 1번 (행마다 CASE 를 만드는 bulk_update 보다 빠름)
+            for tier_id in np.unique(new[diff]):
+                ids = user_ids[diff & (new == tier_id)].tolist()
+                for i in range(0, len(ids), batch_size):
+                    CustomUser.objects.filter(id__in=ids[i:i + batch_size]).update(
+                        tier_id=None if tier_id == NO_TIER else int(tier_id), updated_at=timezone.now(),
+                    )
+        checked += len(user_ids)
+        changed += int(diff.sum())
+    return checked, changed
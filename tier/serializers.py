@@ -0,0 +1,11 @@
+from rest_framework import serializers
+from matchtype.serializers import MatchTypeSerializer
+from .models import Tier
+
+
+class TierSerializer(serializers.ModelSerializer):
+    match_type = MatchTypeSerializer(read_only=True)
+
+    class Meta:
+        model = Tier
+        fields = ['id', 'name', 'level', 'match_type']
@@ -0,0 +1,18 @@
+from django.db import transaction
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+from core.signals import soft_deleted
+from matchtype.models import MatchType
+from .models import Tier
+from .cache import tiers
+
+
+# 트랜잭션이 커밋된 후에 버전을 올려야 커밋 전 데이터를 다시 불러오지 않는다
+# (티어 캐시는 종목 정보도 함께 들고 있으므로 종목이 바뀌어도 다시 불러옴)
+@receiver(post_save, sender=Tier)
+@receiver(post_delete, sender=Tier)
+@receiver(soft_deleted, sender=Tier)
+@receiver(post_save, sender=MatchType)
+@receiver(post_delete, sender=MatchType)
+def invalidate_tier_cache(sender, **kwargs):
+    transaction.on_commit(tiers.bump_version)
@@ -1,3 +1,111 @@
+from django.core.cache import cache
 from django.test import TestCase
+from django.urls import reverse
+from rest_framework.test import APIClient
+from matchtype.cache import match_types
+from matchtype.models import MatchType
+from point.models import PointRanking
+from users.models import CustomUser
+from .cache import tiers
+from .models import Tier
+from .recompute import recompute_tiers
 
-# Create your tests here.
+
+class ReferenceCacheTest(TestCase):
+    """
+    티어 / 종목 프로세스 메모리 캐시 테스트
+    """
+    def setUp(self):
+        cache.clear()
+        tiers.clear()
+        match_types.clear()
+        self.match_type = MatchType.objects.create(gender='male', type='single')
+        self.tier = Tier.objects.create(name='골드', level=3, match_type=self.match_type)
+
+    def test_lookups_after_warm_do_not_query(self):
+        tiers.warm()
+
+        with self.assertNumQueries(0):
+            for _ in range(100):
+                tier = tiers.get(self.tier.id)
+            self.assertEqual(tier.match_type.type, 'single')
+            self.assertIsNone(tiers.get(9999))
+
+    def test_save_in_other_process_is_picked_up_after_version_bump(self):
+        tiers.warm()
+
+        with self.captureOnCommitCallbacks(execute=True):
+            Tier.objects.filter(pk=self.tier.pk).update(name='플래티넘')
+            self.tier.refresh_from_db()
+            self.tier.save()
+
+        # check_interval 이 지나기 전에는 버전을 확인하지 않는다
+        self.assertEqual(tiers.get(self.tier.id).name, '골드')
+        tiers.checked_at = 0
+        self.assertEqual(tiers.get(self.tier.id).name, '플래티넘')
+
+    def test_soft_deleted_tier_is_dropped(self):
+        tiers.warm()
+
+        with self.captureOnCommitCallbacks(execute=True):
+            Tier.objects.filter(pk=self.tier.pk).soft_delete()
+        tiers.checked_at = 0
+
+        self.assertIsNone(tiers.get(self.tier.id))
+
+    def test_user_detail_reads_tier_from_cache(self):
+        user = CustomUser.objects.create(
+            phone='tier-user', username='유저', birth=1990, gender='male', tier=self.tier,
+        )
+        tiers.warm()
+
+        with self.assertNumQueries(1): # 유저 (이미지 / 클럽 / 팀 JOIN)
+            response = APIClient().get(reverse('user-detail', kwargs={'pk': user.pk}))
+
+        self.assertEqual(response.data['tier']['name'], '골드')
+        self.assertEqual(response.data['tier']['match_type']['gender'], 'male')
+
+
+class RecomputeTiersTest(TestCase):
+    """
+    포인트 합계로 티어를 다시 계산하고 바뀐 유저만 저장하는지 확인하는 테스트
+    """
+    def setUp(self):
+        self.match_type = MatchType.objects.create(gender='male', type='single')
+        self.bronze = Tier.objects.create(name='브론즈', level=1, min_points=100, match_type=self.match_type)
+        self.silver = Tier.objects.create(name='실버', level=2, min_points=500, match_type=self.match_type)
+        self.gold = Tier.objects.create(name='골드', level=3, min_points=1000, match_type=self.match_type)
+        self.users = CustomUser.objects.bulk_create([
+            CustomUser(phone=f'recompute-{i}', username=f'유저{i}', birth=1990, gender='male') for i in range(6)
+        ])
+        PointRanking.objects.bulk_create([
+            PointRanking(user=user, match_type=self.match_type, total_points=points)
+            for user, points in zip(self.users, [50, 100, 499, 500, 5000])
+        ])
+        # 포인트 기록이 없는 유저 / 이미 맞는 티어인 유저
+        CustomUser.objects.filter(pk=self.users[5].pk).update(tier=self.gold)
+        CustomUser.objects.filter(pk=self.users[3].pk).update(tier=self.silver)
+
+    def test_tiers_follow_point_thresholds_across_chunks(self):
+        checked, changed = recompute_tiers(self.match_type.id, chunk_size=4)
+
+        tiers_by_user = dict(CustomUser.objects.values_list('id', 'tier'))
+        self.assertEqual([tiers_by_user[user.id] for user in self.users], [
+            None, self.bronze.id, self.bronze.id, self.silver.id, self.gold.id, None,
+        ])
+        self.assertEqual((checked, changed), (6, 4))
+
+        # 다시 실행하면 바뀐 유저가 없다
+        self.assertEqual(recompute_tiers(self.match_type.id), (6, 0))
+
+    def test_other_match_type_tier_is_kept_without_points(self):
+        double = MatchType.objects.create(gender='male', type='double')
+        double_tier = Tier.objects.create(name='복식골드', level=3, min_points=1000, match_type=double)
+        CustomUser.objects.filter(pk__in=[self.users[0].pk, self.users[5].pk]).update(tier=double_tier)
+
+        recompute_tiers(self.match_type.id)
+
+        tiers_by_user = dict(CustomUser.objects.values_list('id', 'tier'))
+        # 포인트 기록이 없는 유저는 복식 티어를 유지, 이 종목 포인트가 있는 유저는 다시 계산
+        self.assertEqual(tiers_by_user[self.users[5].id], double_tier.id)
+        self.assertIsNone(tiers_by_user[self.users[0].id])
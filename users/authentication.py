@@ -0,0 +1,83 @@
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import AuthenticationFailed, InvalidToken
+from rest_framework_simplejwt.settings import api_settings
+
+
+AUTH_USER_CACHE_TIMEOUT = getattr(settings, 'AUTH_USER_CACHE_TIMEOUT', 60)
+
+# 토큰 발급 시점의 비밀번호로 만든 버전 (비밀번호가 바뀌면 이전에 발급된 토큰은 거부됨)
+AUTH_VERSION_CLAIM = 'auth_version'
+
+# 인증 / 권한 확인에 필요한 필드만 캐시 (비밀번호 해시 등 나머지 필드는 캐시에 넣지 않고, 접근하면 DB 에서 지연 로딩)
+AUTH_USER_FIELDS = ('id', 'phone', 'is_active', 'is_staff', 'is_superuser', 'is_deleted')
+
+
+def get_auth_version(user):
+    # 비밀번호 해시의 HMAC (세션 무효화에 쓰는 get_session_auth_hash 와 같은 값, 토큰 크기를 줄이기 위해 앞부분만 사용)
+    return user.get_session_auth_hash()[:16]
+
+
+def _cache_key(user_id, version):
+    return f'users:auth:{user_id}:{version}'
+
+
+def invalidate_auth_users(users):
+    """
+    유저 캐시 무효화 (CustomUser 저장 / soft delete / 비활성화 시그널에서 호출)
+    현재 비밀번호의 버전 키, 비밀번호가 바뀐 경우 이전 비밀번호의 버전 키, 버전 클레임이 없는 이전 토큰의 키를 지운다.
+    """
+    keys = []
+    for user in users:
+        keys += [_cache_key(user.pk, get_auth_version(user)), _cache_key(user.pk, '')]
+        previous = getattr(user, '_previous_auth_version', None)
+        if previous:
+            keys.append(_cache_key(user.pk, previous))
+    cache.delete_many(keys)
+
+
+class CachedJWTAuthentication(JWTAuthentication):
+    """
+    JWT 인증 시 유저를 매 요청마다 DB 에서 조회하지 않고 짧은 TTL 캐시에서 가져오는 인증 클래스
+    캐시 키는 유저 id + 토큰의 버전 클레임이며, 유저가 변경되면 시그널에서 키를 지워서 바로 새로 조회된다.
+    """
+    def get_user(self, validated_token):
+        try:
+            user_id = validated_token[api_settings.USER_ID_CLAIM]
+        except KeyError:
+            raise InvalidToken('Token contained no recognizable user identification')
+
+        # 버전 클레임이 추가되기 전에 발급된 토큰은 비밀번호 확인 없이 유저 id 로만 캐시
+        version = validated_token.get(AUTH_VERSION_CLAIM, '')
+        key = _cache_key(user_id, version)
+        fields = cache.get(key)
+        if fields is None:
+            user = self.load_user(user_id)
+            if version and version != get_auth_version(user):
+                raise AuthenticationFailed('Token is no longer valid', code='token_not_valid')
+            fields = {field: getattr(user, field) for field in AUTH_USER_FIELDS}
+            cache.set(key, fields, AUTH_USER_CACHE_TIMEOUT)
+
+        if not fields['is_active']:
+            raise AuthenticationFailed('User is inactive', code='user_inactive')
+        # 탈퇴(soft delete)한 유저의 토큰도 거부
+        if fields['is_deleted']:
+            raise AuthenticationFailed('User not found', code='user_not_found')
+        return self.build_user(fields)
+
+    def build_user(self, fields):
+        # from_db 는 값을 이름이 아니라 concrete_fields 순서대로 배정하므로 모델 필드 순서로 맞춰서 넘긴다
+        # (캐시하지 않은 필드는 지연 로딩)
+        model = get_user_model()
+        names = [field.attname for field in model._meta.concrete_fields if field.attname in fields]
+        return model.from_db('default', names, [fields[name] for name in names])
+
+    def load_user(self, user_id):
+        try:
+            return get_user_model().objects.only(*AUTH_USER_FIELDS, 'password').get(
+                **{api_settings.USER_ID_FIELD: user_id}
+            )
+        except get_user_model().DoesNotExist:
+            raise AuthenticationFailed('User not found', code='user_not_found')
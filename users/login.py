@@ -0,0 +1,62 @@
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from django.conf import settings
+from django.contrib.auth import authenticate
+from django.db import close_old_connections
+
+
+# 로그인 인증(authenticate - 유저 조회 + PBKDF2 해시) 전용 스레드 풀
+# 동시에 계산하는 해시 수를 워커 수로 제한하고, 대기열이 가득 차면 429 로 바로 돌려보낸다
+# (hashlib 의 pbkdf2 는 GIL 을 풀고 계산하므로 스레드로 병렬 처리됨)
+_executor = None
+_executor_lock = threading.Lock()
+
+# 해시 대기열 최대 길이 (넘으면 바로 429 응답)
+_pending = threading.BoundedSemaphore(getattr(settings, 'LOGIN_MAX_PENDING', 64))
+
+
+class LoginOverloaded(Exception):
+    """
+    로그인 해시 대기열이 가득 찼을 때 발생
+    """
+
+
+def get_login_executor():
+    global _executor
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(
+                    max_workers=getattr(settings, 'LOGIN_HASH_WORKERS', 2),
+                    thread_name_prefix='login-hash',
+                )
+    return _executor
+
+
+async def run_in_login_executor(func, *args):
+    if not _pending.acquire(blocking=False):
+        raise LoginOverloaded()
+    try:
+        return await asyncio.get_running_loop().run_in_executor(get_login_executor(), func, *args)
+    finally:
+        _pending.release()
+
+
+def _authenticate(request, phone, password):
+    # 로그인 스레드는 요청 시작 / 종료 시그널을 받지 않으므로 DB 연결 정리를 직접 한다
+    close_old_connections()
+    try:
+        return authenticate(request, phone=phone, password=password)
+    finally:
+        close_old_connections()
+
+
+async def authenticate_user(request, phone, password):
+    """
+    django.contrib.auth.authenticate 를 로그인 전용 스레드 풀에서 실행
+    AUTHENTICATION_BACKENDS / user_login_failed 시그널 / 해시 갱신 / 비활성 유저 거부 / 유저가 없을 때의 해시 계산은
+    authenticate 의 동작을 그대로 따른다.
+    """
+    return await run_in_login_executor(_authenticate, request, phone, password)
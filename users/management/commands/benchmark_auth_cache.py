@@ -0,0 +1,46 @@
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.test import RequestFactory
+from django.test.utils import CaptureQueriesContext
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from users.authentication import CachedJWTAuthentication
+from users.models import CustomUser
+from users.serializers import CustomTokenObtainPairSerializer
+
+
+class Command(BaseCommand):
+    """
+    기본 JWTAuthentication 과 CachedJWTAuthentication 의 요청당 DB 쿼리 수 / 인증 시간 비교
+        python manage.py benchmark_auth_cache --requests 10000 --users 100
+    """
+    help = 'JWT 인증 유저 캐시 벤치마크'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--requests', type=int, default=10000, help='인증 요청 수')
+        parser.add_argument('--users', type=int, default=100, help='요청을 나눠 보낼 유저 수')
+
+    def handle(self, *args, **options):
+        users = list(CustomUser.objects.filter(is_active=True, is_deleted=False)[:options['users']])
+        if not users:
+            raise CommandError('벤치마크에 사용할 유저가 없습니다.')
+
+        factory = RequestFactory()
+        requests = [
+            factory.get('/', HTTP_AUTHORIZATION=f'Bearer {CustomTokenObtainPairSerializer.get_token(user).access_token}')
+            for user in users
+        ]
+        total = options['requests']
+
+        for label, authenticator in (('JWTAuthentication', JWTAuthentication()),
+                                     ('CachedJWTAuthentication', CachedJWTAuthentication())):
+            with CaptureQueriesContext(connection) as queries:
+                start = time.perf_counter()
+                for i in range(total):
+                    authenticator.authenticate(requests[i % len(requests)])
+                elapsed = time.perf_counter() - start
+            self.stdout.write(
+                f'{label:>24}: {total}회 {elapsed:.2f}s, '
+                f'쿼리 {len(queries)}회 (요청당 {len(queries) / total:.3f}회)'
+            )
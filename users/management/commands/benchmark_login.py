@@ -0,0 +1,77 @@
+import json
+import statistics
+import time
+import urllib.error
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+
+from django.core.management.base import BaseCommand
+
+
+class Command(BaseCommand):
+    """
+    로그인 폭주 상황에서 로그인 / 일반 조회 요청의 응답 시간을 측정하는 부하 벤치마크
+    실행 중인 서버에 요청을 보내므로 변경 전 / 후 서버에 각각 실행해서 비교
+        uvicorn config.asgi:application --workers 1
+        python manage.py benchmark_login --base-url http://localhost:8000 --phone 01000000000 --password ...
+    """
+    help = '로그인 / 혼합 트래픽 응답 시간 벤치마크'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--base-url', default='http://localhost:8000')
+        parser.add_argument('--phone', required=True, help='로그인에 사용할 전화번호')
+        parser.add_argument('--password', required=True)
+        parser.add_argument('--logins', type=int, default=200, help='로그인 요청 수')
+        parser.add_argument('--reads', type=int, default=400, help='함께 보낼 조회 요청 수 (클럽 목록)')
+        parser.add_argument('--concurrency', type=int, default=50)
+
+    def handle(self, *args, **options):
+        base_url = options['base_url'].rstrip('/')
+        body = json.dumps({'phone': options['phone'], 'password': options['password']}).encode()
+
+        def login():
+            request = urllib.request.Request(
+                f'{base_url}/api/v1/auth/signin/', data=body, headers={'Content-Type': 'application/json'},
+            )
+            return 'login', self.timed(request)
+
+        def read():
+            return 'read', self.timed(urllib.request.Request(f'{base_url}/api/v1/club/list/'))
+
+        # 로그인과 조회 요청을 섞어서 동시에 보냄
+        jobs = [login] * options['logins'] + [read] * options['reads']
+        jobs = [job for pair in zip(jobs[::2], jobs[1::2]) for job in pair] + jobs[len(jobs) // 2 * 2:]
+
+        results = {'login': [], 'read': []}
+        errors = 0
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=options['concurrency']) as executor:
+            for kind, (elapsed, ok) in executor.map(lambda job: job(), jobs):
+                results[kind].append(elapsed)
+                errors += not ok
+        total = time.perf_counter() - start
+
+        self.stdout.write(f'전체 {len(jobs)}건 {total:.2f}s, 실패 {errors}건')
+        for kind, latencies in results.items():
+            if not latencies:
+                continue
+            latencies.sort()
+            self.stdout.write(
+                f'{kind:>6}: p50 {statistics.median(latencies) * 1000:.0f}ms, '
+                f'p95 {self.percentile(latencies, 95) * 1000:.0f}ms, '
+                f'p99 {self.percentile(latencies, 99) * 1000:.0f}ms'
+            )
+
+    def timed(self, request):
+        start = time.perf_counter()
+        try:
+            with urllib.request.urlopen(request, timeout=60) as response:
+                response.read()
+                ok = response.status < 400
+        except (urllib.error.URLError, TimeoutError):
+            ok = False
+        return time.perf_counter() - start, ok
+
+    def percentile(self, values, percent):
+        index = min(len(values) - 1, int(len(values) * percent / 100))
+        return values[index]
@@ -0,0 +1,141 @@
+import csv
+import os
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+
+import django
+from django.contrib.auth.hashers import make_password
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from club.models import Club
+from search.documents import SEARCH_KINDS, update_documents
+from team.models import Team
+from users.models import CustomUser
+
+
+GENDERS = {value for value, _ in CustomUser.GENDER_CHOICES}
+
+
+def _init_worker():
+    # spawn 방식으로 만들어진 워커에서도 장고 설정(PASSWORD_HASHERS)을 사용할 수 있도록 초기화
+    os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'config.settings')
+    django.setup()
+
+
+class Command(BaseCommand):
+    """
+    클럽 선수 명단 CSV 를 스트리밍으로 읽어서 유저를 일괄 생성
+    비밀번호 해시는 프로세스 풀에서 병렬로 처리하고, 배치 단위로 bulk_create 한다. (선수 검색 문서도 배치마다 추가)
+    잘못된 행은 행 번호와 함께 오류를 출력하고 나머지 행은 계속 처리한다.
+
+    CSV 헤더: phone,password,username,birth,gender,club_id,team_id (club_id, team_id 는 생략 가능)
+        python manage.py import_roster roster.csv --batch-size 1000 --workers 8
+    """
+    help = '선수 명단 CSV 일괄 가입'
+
+    def add_arguments(self, parser):
+        parser.add_argument('csv_path')
+        parser.add_argument('--batch-size', type=int, default=1000, help='한번에 생성할 유저 수')
+        parser.add_argument('--workers', type=int, default=os.cpu_count() or 1, help='비밀번호 해시 프로세스 수')
+        parser.add_argument('--encoding', default='utf-8-sig')
+
+    def handle(self, *args, **options):
+        batch_size = options['batch_size']
+        created = 0
+        errors = 0
+
+        try:
+            csv_file = open(options['csv_path'], newline='', encoding=options['encoding'])
+        except OSError as e:
+            raise CommandError(f'CSV 파일을 열 수 없습니다: {e}')
+
+        with csv_file, ProcessPoolExecutor(max_workers=options['workers'], initializer=_init_worker) as executor:
+            # 헤더가 1번째 줄이므로 데이터는 2번째 줄부터
+            rows = enumerate(csv.DictReader(csv_file), start=2)
+            seen_phones = set()
+            while True:
+                batch = list(islice(rows, batch_size))
+                if not batch:
+                    break
+                batch_created, batch_errors = self.import_batch(batch, seen_phones, executor, options['workers'])
+                created += batch_created
+                for line, message in batch_errors:
+                    self.stderr.write(f'{line}번째 줄: {message}')
+                errors += len(batch_errors)
+
+        self.stdout.write(f'유저 {created}명 생성, 오류 {errors}건')
+
+    def import_batch(self, batch, seen_phones, executor, workers):
+        errors = []
+        club_ids = self.existing_ids(Club, batch, 'club_id')
+        team_ids = self.existing_ids(Team, batch, 'team_id')
+        phones = [(row.get('phone') or '').strip() for _, row in batch]
+        # 탈퇴한 유저의 전화번호도 unique 이므로 all_objects 로 확인
+        existing_phones = set(CustomUser.all_objects.filter(phone__in=phones).values_list('phone', flat=True))
+
+        valid = []
+        for line, row in batch:
+            try:
+                user = self.build_user(row, club_ids, team_ids)
+            except ValueError as e:
+                errors.append((line, str(e)))
+                continue
+            if user.phone in existing_phones or user.phone in seen_phones:
+                errors.append((line, f'이미 가입된 전화번호입니다 ({user.phone})'))
+                continue
+            seen_phones.add(user.phone)
+            valid.append((user, row.get('password') or None))
+
+        # PBKDF2 해시는 CPU 작업이라 프로세스 풀에서 병렬로 처리
+        chunksize = max(1, len(valid) // (workers * 4))
+        hashes = executor.map(make_password, [password for _, password in valid], chunksize=chunksize)
+        users = []
+        for (user, _), password in zip(valid, hashes):
+            user.password = password
+            users.append(user)
+
+        with transaction.atomic():
+            CustomUser.objects.bulk_create(users)
+            # bulk_create 는 post_save 시그널이 없으므로 선수 검색 문서를 직접 추가
+            # (MySQL 처럼 bulk_create 후 pk 가 채워지지 않는 DB 는 전화번호로 다시 조회)
+            if users and users[0].pk is None:
+                users = list(CustomUser.objects.filter(phone__in=[user.phone for user in users]))
+            update_documents(SEARCH_KINDS['player'], users)
+        return len(users), errors
+
+    def existing_ids(self, model, batch, column):
+        ids = set()
+        for _, row in batch:
+            value = (row.get(column) or '').strip()
+            if value.isdigit():
+                ids.add(int(value))
+        return set(model.objects.filter(id__in=ids).values_list('id', flat=True))
+
+    def build_user(self, row, club_ids, team_ids):
+        phone = (row.get('phone') or '').strip()
+        username = (row.get('username') or '').strip()
+        gender = (row.get('gender') or '').strip()
+        if not phone:
+            raise ValueError('전화번호가 없습니다')
+        if not username:
+            raise ValueError('이름이 없습니다')
+        if gender not in GENDERS:
+            raise ValueError(f'성별은 {", ".join(sorted(GENDERS))} 중 하나여야 합니다 ({gender})')
+        try:
+            birth = int(row.get('birth') or '')
+        except ValueError:
+            raise ValueError(f'출생연도가 올바르지 않습니다 ({row.get("birth")})')
+        if not 1900 <= birth <= 2050:
+            raise ValueError(f'출생연도는 1900 ~ 2050 사이여야 합니다 ({birth})')
+
+        club_id = self.parse_fk(row, 'club_id', club_ids, '클럽')
+        team_id = self.parse_fk(row, 'team_id', team_ids, '팀')
+        return CustomUser(phone=phone, username=username, gender=gender, birth=birth, club_id=club_id, team_id=team_id)
+
+    def parse_fk(self, row, column, valid_ids, label):
+        value = (row.get(column) or '').strip()
+        if not value:
+            return None
+        if not value.isdigit() or int(value) not in valid_ids:
+            raise ValueError(f'존재하지 않는 {label}입니다 ({value})')
+        return int(value)
@@ -0,0 +1,24 @@
+from django.core.management.base import BaseCommand
+from users.tokens import prune_expired_tokens
+
+
+class Command(BaseCommand):
+    """
+    만료된 리프레시 토큰(OutstandingToken / BlacklistedToken)을 배치 단위로 정리
+    cron 등으로 주기적으로 실행
+        python manage.py prune_token_blacklist --batch-size 1000 --sleep 0.1
+    """
+    help = '만료된 토큰 블랙리스트 정리'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=1000, help='한번에 삭제할 토큰 수')
+        parser.add_argument('--max-batches', type=int, default=None, help='최대 배치 수 (기본: 만료 토큰을 모두 삭제할 때까지)')
+        parser.add_argument('--sleep', type=float, default=0, help='배치 사이 대기 시간(초)')
+
+    def handle(self, *args, **options):
+        deleted = prune_expired_tokens(
+            batch_size=options['batch_size'],
+            max_batches=options['max_batches'],
+            sleep=options['sleep'],
+        )
+        self.stdout.write(f'만료된 토큰 {deleted}개 삭제')
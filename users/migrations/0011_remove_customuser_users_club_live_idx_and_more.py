@@ -0,0 +1,34 @@
+# Generated by Django 5.0.14 on 2026-10-18 20:01
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('auth', '0012_alter_user_first_name_max_length'),
+        ('club', '0009_club_club_live_name_idx'),
+        ('image_url', '0015_imageurl_original_imageurl_variant_size'),
+        ('team', '0009_remove_team_team_club_live_idx_and_more'),
+        ('tier', '0004_tier_tier_type_live_level_idx'),
+        ('users', '0010_customuser_users_club_live_idx_and_more'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='customuser',
+            name='users_club_live_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='customuser',
+            name='users_team_live_idx',
+        ),
+        migrations.AddIndex(
+            model_name='customuser',
+            index=models.Index(fields=['club', 'is_deleted', 'id'], name='users_club_live_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='customuser',
+            index=models.Index(fields=['team', 'is_deleted', 'id'], name='users_team_live_idx'),
+        ),
+    ]
@@ -5,10 +5,12 @@ from team.models import Team
 from tier.models import Tier
 from image_url.models import ImageUrl
 from core.models import SoftDeleteModel , TimeStampedModel
+from core.manager import SoftDeleteManager
 from django.core.validators import MinValueValidator, MaxValueValidator
 
 # CustomUserManager 정의 (CustomUser모델을 사용하려면 필수적으로 필요한 매니저)
-class CustomUserManager(BaseUserManager):
+# 탈퇴(soft delete)한 유저는 조회되지 않음 (로그인 / 인증 포함), 전체 조회는 CustomUser.all_objects
+class CustomUserManager(SoftDeleteManager, BaseUserManager):
     def create_user(self, phone, password=None, **extra_fields):
         if not phone:
             raise ValueError('The Phone number must be set')
@@ -54,6 +56,8 @@ class CustomUser(AbstractBaseUser, PermissionsMixin, SoftDeleteModel, TimeStampe
     is_active = models.BooleanField(default=True) # is_active 활용하여, 계정을 비활성화 가능 (유저 삭제 대신 False)
     image_url = models.ForeignKey(ImageUrl, on_delete=models.DO_NOTHING, blank=True, null=True)
     objects = CustomUserManager()
+
+    SOFT_DELETE_CASCADE = (('coach.Coach', 'user'),) # 유저 탈퇴 시 코치 등록도 삭제
     
     
     USERNAME_FIELD = 'phone' # USERNAME_FIELD 로 지정된 값을 흔히 말하는 로그인 ID로 사용됨.
@@ -65,4 +69,9 @@ class CustomUser(AbstractBaseUser, PermissionsMixin, SoftDeleteModel, TimeStampe
     
 
     class Meta:
-        db_table = 'users'
\ No newline at end of file
+        db_table = 'users'
+        indexes = [
+            # 클럽 / 팀 소속 유저 조회 시 삭제되지 않은 유저만 인덱스로 조회 (id 순 커서 페이지네이션 포함)
+            models.Index(fields=['club', 'is_deleted', 'id'], name='users_club_live_idx'),
+            models.Index(fields=['team', 'is_deleted', 'id'], name='users_team_live_idx'),
+        ]
\ No newline at end of file
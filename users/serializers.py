@@ -1,18 +1,24 @@
 from rest_framework_simplejwt.serializers import TokenObtainPairSerializer
 from django.contrib.auth import get_user_model , authenticate
+from django.db import transaction
 from rest_framework import serializers
+from rest_framework.validators import UniqueValidator
 from .models import CustomUser, Club
-from image_url.models import ImageUrl
-from image_url.utils import S3ImageUploader
+from .authentication import AUTH_VERSION_CLAIM, get_auth_version
+from image_url.tasks import upload_image_in_background
 from image_url.serializers import ImageUrlSerializer
 from club.serializers import ClubDetailSerializer
 from team.serializers import TeamDetailSerializer
+from tier.serializers import TierSerializer
+from tier.cache import tiers
 
 
 User = get_user_model()
 
 # 회원가입 부분
 class CreateUserSerializer(serializers.ModelSerializer):
+    # 탈퇴한 유저의 전화번호로는 다시 가입할 수 없으므로(phone unique) 삭제된 유저까지 포함해서 중복 확인
+    phone = serializers.CharField(max_length=255, validators=[UniqueValidator(queryset=User.all_objects.all())])
     password = serializers.CharField(write_only=True)
     club = serializers.PrimaryKeyRelatedField(queryset=Club.objects.all(), required=False)
     image_file = serializers.ImageField(write_only=True, required=False)  # 이미지 필드 추가
@@ -23,33 +29,27 @@ class CreateUserSerializer(serializers.ModelSerializer):
         fields = ('phone', 'password', 'username', 'birth', 'gender', 'club', 'image_file', 'image_url')
         
     def get_image_url(self, obj):
-        if hasattr(obj, 'image_url'):
+        if obj.image_url:
             return obj.image_url.image_url
         return None
 
     def create(self, validated_data):
         image_data = validated_data.pop('image_file', None)
-        user = User.objects.create_user(
-            phone=validated_data['phone'],
-            password=validated_data['password'],
-            username=validated_data['username'],
-            birth=validated_data.get('birth'),
-            gender=validated_data.get('gender'),
-            club=validated_data.get('club', None)
-        )
-        
-        if image_data:
-            uploader = S3ImageUploader()
-            file_url, extension, size = uploader.upload_file(image_data)
-            
-            # 업로드된 이미지 정보를 ImageUrl 인스턴스로 저장
-            image_instance = ImageUrl.objects.create(
-                image_url=file_url,
-                extension=extension,
-                size=size
+
+        # 유저 생성까지 커밋된 후에 백그라운드 업로드가 시작되도록 한 트랜잭션으로 묶는다
+        with transaction.atomic():
+            # s3 업로드는 백그라운드에서 진행하고, pending 상태의 이미지를 바로 연결해서 유저를 한번에 저장
+            image_instance = upload_image_in_background(image_data) if image_data else None
+
+            user = User.objects.create_user(
+                phone=validated_data['phone'],
+                password=validated_data['password'],
+                username=validated_data['username'],
+                birth=validated_data.get('birth'),
+                gender=validated_data.get('gender'),
+                club=validated_data.get('club', None),
+                image_url=image_instance,
             )
-            user.image_url = image_instance  # 사용자 인스턴스에 이미지 인스턴스 할당
-            user.save()  # 변경 사항 저장
             
         return user
 
@@ -65,6 +65,7 @@ class CustomTokenObtainPairSerializer(TokenObtainPairSerializer):
 
         # Add custom claims
         token['phone'] = user.phone
+        token[AUTH_VERSION_CLAIM] = get_auth_version(user) # 인증 캐시 키 / 비밀번호 변경 시 토큰 무효화에 사용
         
         return token
 
@@ -95,7 +96,13 @@ class UserInfoSerializer(serializers.ModelSerializer):
     image_url = ImageUrlSerializer(read_only=True)  # ImageUrl 모델에 대한 시리얼라이저를 사용
     club = ClubDetailSerializer(read_only=True)
     team = TeamDetailSerializer(read_only=True)
-    
+    tier = serializers.SerializerMethodField()
+
     class Meta:
         model = CustomUser
-        fields = ['id', 'username', 'phone', 'gender', 'birth', 'image_url', 'club', 'team'] # 티어 추가해야함
\ No newline at end of file
+        fields = ['id', 'username', 'phone', 'gender', 'birth', 'image_url', 'club', 'team', 'tier']
+
+    def get_tier(self, obj):
+        # 티어는 DB 조인 없이 프로세스 메모리의 참조 캐시에서 조회
+        tier = tiers.get(obj.tier_id)
+        return TierSerializer(tier).data if tier else None
\ No newline at end of file
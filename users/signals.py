@@ -0,0 +1,43 @@
+from django.db import transaction
+from django.db.models.signals import post_save, post_delete, pre_save
+from django.dispatch import receiver
+from rest_framework_simplejwt.token_blacklist.models import BlacklistedToken
+from core.signals import soft_deleted
+from .models import CustomUser
+from .authentication import get_auth_version, invalidate_auth_users
+from .tokens import bump_blacklist_version
+
+
+# 비밀번호를 바꾸는 저장(set_password 후 save)이면 이전 비밀번호 버전의 인증 캐시도 지울 수 있도록 기억
+@receiver(pre_save, sender=CustomUser)
+def remember_previous_auth_version(sender, instance, **kwargs):
+    if instance._password is None or instance.pk is None:
+        return
+    previous = CustomUser.all_objects.filter(pk=instance.pk).values_list('password', flat=True).first()
+    if previous:
+        instance._previous_auth_version = get_auth_version(CustomUser(pk=instance.pk, password=previous))
+
+
+# 저장 / soft delete(is_deleted) / 비활성화(is_active) 모두 save 를 거치므로 post_save 로 인증 캐시를 무효화
+@receiver(post_save, sender=CustomUser)
+@receiver(post_delete, sender=CustomUser)
+def invalidate_auth_user_cache(sender, instance, **kwargs):
+    invalidate_auth_users([instance])
+    # 커밋 전에 다른 요청이 이전 값을 다시 캐시했을 수 있으므로 커밋 후 한번 더 무효화
+    transaction.on_commit(lambda: invalidate_auth_users([instance]))
+
+
+# 어드민 일괄 탈퇴 처리(UPDATE)는 post_save 가 없으므로 배치 시그널로 인증 캐시를 무효화
+@receiver(soft_deleted, sender=CustomUser)
+def invalidate_auth_user_cache_on_soft_delete(sender, pks, **kwargs):
+    # 캐시 키에 비밀번호 버전이 들어가므로 비밀번호 해시만 조회
+    users = list(CustomUser.all_objects.filter(pk__in=pks).only('password'))
+    invalidate_auth_users(users)
+    transaction.on_commit(lambda: invalidate_auth_users(users))
+
+
+# 블랙리스트가 추가되면 각 프로세스의 RevokedTokenSet 이 새 항목을 불러오도록 버전을 올림
+@receiver(post_save, sender=BlacklistedToken)
+def invalidate_revoked_tokens(sender, instance, created, **kwargs):
+    if created:
+        transaction.on_commit(bump_blacklist_version)
@@ -1,3 +1,347 @@
-from django.test import TestCase
+import asyncio
+import io
+import os
+import tempfile
+import threading
+from datetime import datetime
+from unittest import mock
 
-# Create your tests here.
+from asgiref.sync import async_to_sync
+from django.conf import settings
+from django.core.cache import cache
+from django.core.management import call_command
+from django.contrib.auth.signals import user_login_failed
+from django.test import RequestFactory, TestCase, TransactionTestCase
+from django.urls import reverse
+from django.utils.module_loading import import_string
+from PIL import Image
+from rest_framework.test import APIClient
+from rest_framework_simplejwt.exceptions import AuthenticationFailed
+from rest_framework_simplejwt.token_blacklist.models import BlacklistedToken, OutstandingToken
+from rest_framework_simplejwt.tokens import RefreshToken
+from club.models import Club
+from image_url.models import ImageUrl
+from search.models import SearchDocument
+from .authentication import CachedJWTAuthentication, get_auth_version
+from .models import CustomUser
+from .serializers import CustomTokenObtainPairSerializer
+from .tokens import prune_expired_tokens, revoked_tokens
+
+
+class SignupAvatarUploadTest(TestCase):
+    """
+    회원가입 시 프로필 이미지가 백그라운드에서 업로드 되는지 확인하는 테스트
+    """
+    def setUp(self):
+        self.client = APIClient()
+        # 테스트에서는 백그라운드 스레드 대신 바로 실행
+        patcher = mock.patch('image_url.tasks.get_upload_executor')
+        self.executor = patcher.start().return_value
+        self.executor.submit.side_effect = lambda fn, *args: fn(*args)
+        self.addCleanup(patcher.stop)
+
+    def make_image(self):
+        buffer = io.BytesIO()
+        Image.new('RGB', (10, 10)).save(buffer, format='PNG')
+        buffer.name = 'avatar.png'
+        buffer.seek(0)
+        return buffer
+
+    def signup(self):
+        return self.client.post(reverse('signup'), {
+            'phone': '01012345678',
+            'password': 'password1234!',
+            'username': '테스트',
+            'birth': 1990,
+            'gender': 'male',
+            'image_file': self.make_image(),
+        }, format='multipart')
+
+    @mock.patch('image_url.utils.S3ImageUploader.upload_fileobj')
+    def test_signup_returns_before_upload(self, upload_fileobj):
+        with self.captureOnCommitCallbacks() as callbacks:
+            response = self.signup()
+
+        self.assertEqual(response.status_code, 201)
+        upload_fileobj.assert_not_called()
+        user = CustomUser.objects.select_related('image_url').get(phone='01012345678')
+        self.assertEqual(user.image_url.upload_status, 'pending')
+        self.assertEqual(user.image_url.extension, 'png')
+
+        for callback in callbacks:
+            callback()
+
+        upload_fileobj.assert_called_once()
+        user.image_url.refresh_from_db()
+        self.assertEqual(user.image_url.upload_status, 'ready')
+
+    @mock.patch('image_url.utils.S3ImageUploader.upload_fileobj', side_effect=Exception('s3 error'))
+    def test_failed_upload_is_marked_failed(self, upload_fileobj):
+        with self.assertLogs('image_url.tasks', level='ERROR'):
+            with self.captureOnCommitCallbacks(execute=True):
+                response = self.signup()
+
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(ImageUrl.objects.get().upload_status, 'failed')
+
+
+class CachedJWTAuthenticationTest(TestCase):
+    """
+    인증 유저 캐시 / 무효화 테스트
+    """
+    def setUp(self):
+        cache.clear()
+        self.user = CustomUser.objects.create_user(
+            phone='01000000000', password='password1234!', username='테스트', birth=1990, gender='male',
+        )
+        token = CustomTokenObtainPairSerializer.get_token(self.user).access_token
+        self.request = RequestFactory().get('/', HTTP_AUTHORIZATION=f'Bearer {token}')
+        self.authenticator = CachedJWTAuthentication()
+
+    def authenticate(self):
+        return self.authenticator.authenticate(self.request)[0]
+
+    def test_user_is_served_from_cache(self):
+        with self.assertNumQueries(1):
+            self.authenticate()
+        with self.assertNumQueries(0):
+            user = self.authenticate()
+
+        self.assertEqual(user.pk, self.user.pk)
+
+    def test_cached_user_keeps_field_values(self):
+        CustomUser.objects.filter(pk=self.user.pk).update(is_staff=True)
+        self.authenticate()
+
+        with self.assertNumQueries(0):
+            user = self.authenticate()
+            self.assertEqual(user.phone, '01000000000')
+            self.assertIs(user.is_superuser, False)
+            self.assertIs(user.is_staff, True)
+            self.assertIs(user.is_active, True)
+            self.assertIs(user.is_deleted, False)
+        self.assertFalse(user.has_perm('users.delete_customuser'))
+
+    def test_password_hash_is_not_cached(self):
+        self.authenticate()
+
+        cached = cache.get(f'users:auth:{self.user.pk}:{get_auth_version(self.user)}')
+        self.assertNotIn('password', cached)
+        self.assertNotIn(self.user.password, cached.values())
+
+    def test_password_change_rejects_previous_tokens(self):
+        self.authenticate()
+        self.user.set_password('new-password1234!')
+        self.user.save()
+
+        with self.assertRaises(AuthenticationFailed):
+            self.authenticate()
+
+    def test_user_change_invalidates_cache(self):
+        self.authenticate()
+        self.user.username = '변경'
+        self.user.save()
+
+        with self.assertNumQueries(1):
+            user = self.authenticate()
+        self.assertEqual(user.username, '변경')
+
+    def test_deactivated_and_deleted_users_are_rejected(self):
+        self.authenticate()
+        self.user.is_active = False
+        self.user.save()
+        with self.assertRaises(AuthenticationFailed):
+            self.authenticate()
+
+        self.user.is_active = True
+        self.user.delete()
+        with self.assertRaises(AuthenticationFailed):
+            self.authenticate()
+
+
+class TokenBlacklistTest(TestCase):
+    """
+    리프레시 토큰 revoke 확인 / 만료 토큰 정리 테스트
+    """
+    def setUp(self):
+        cache.clear()
+        revoked_tokens.clear()
+        self.client = APIClient()
+        self.user = CustomUser.objects.create_user(
+            phone='01000000000', password='password1234!', username='테스트', birth=1990, gender='male',
+        )
+
+    def refresh(self, token):
+        self.client.cookies['refresh'] = str(token)
+        return self.client.post(reverse('token_refresh'))
+
+    @mock.patch('users.tokens.shared_cache_configured', return_value=True)
+    def test_unrevoked_token_is_checked_without_queries(self, shared_cache_configured):
+        token = RefreshToken.for_user(self.user)
+        self.refresh(token)
+
+        with self.assertNumQueries(0):
+            response = self.refresh(token)
+        self.assertEqual(response.status_code, 200)
+
+    @mock.patch('users.tokens.shared_cache_configured', return_value=True)
+    def test_blacklisted_token_is_rejected(self, shared_cache_configured):
+        token = RefreshToken.for_user(self.user)
+        self.refresh(token)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            token.blacklist()
+        response = self.refresh(token)
+
+        self.assertEqual(response.status_code, 400)
+
+    def test_local_cache_checks_blacklist_in_db(self):
+        token = RefreshToken.for_user(self.user)
+        self.assertEqual(self.refresh(token).status_code, 200)
+
+        # 다른 프로세스에서 revoke 된 경우 (이 프로세스의 캐시 버전은 올라가지 않음)
+        BlacklistedToken.objects.create(token=OutstandingToken.objects.get(jti=token['jti']))
+        response = self.refresh(token)
+
+        self.assertEqual(response.status_code, 400)
+
+    def test_prune_deletes_expired_tokens_in_batches(self):
+        for _ in range(5):
+            RefreshToken.for_user(self.user).blacklist()
+        live = RefreshToken.for_user(self.user)
+        OutstandingToken.objects.exclude(jti=live['jti']).update(expires_at=datetime(2000, 1, 1))
+
+        deleted = prune_expired_tokens(batch_size=2, max_batches=2)
+        self.assertEqual(deleted, 4)
+
+        deleted = prune_expired_tokens(batch_size=2)
+        self.assertEqual(deleted, 1)
+        self.assertEqual(list(OutstandingToken.objects.values_list('jti', flat=True)), [live['jti']])
+        self.assertFalse(BlacklistedToken.objects.exists())
+
+
+class ImportRosterCommandTest(TestCase):
+    """
+    manage.py import_roster 테스트
+    """
+    def test_imports_valid_rows_and_reports_errors(self):
+        club = Club.objects.create(name='테스트클럽')
+        CustomUser.objects.create_user(phone='01000000000', username='기존', birth=1990, gender='male')
+        with tempfile.NamedTemporaryFile('w', suffix='.csv', delete=False, encoding='utf-8') as f:
+            f.write('phone,password,username,birth,gender,club_id,team_id\n')
+            f.write(f'01011111111,password1!,선수1,1995,male,{club.id},\n')
+            f.write('01022222222,password2!,선수2,1998,female,,\n')
+            f.write('01000000000,password3!,중복,1990,male,,\n')
+            f.write('01033333333,password4!,선수4,1990,male,9999,\n')
+            f.write('01044444444,password5!,선수5,abc,male,,\n')
+        self.addCleanup(os.remove, f.name)
+
+        out, err = io.StringIO(), io.StringIO()
+        call_command('import_roster', f.name, '--batch-size', '2', '--workers', '2', stdout=out, stderr=err)
+
+        self.assertIn('유저 2명 생성, 오류 3건', out.getvalue())
+        self.assertIn('4번째 줄', err.getvalue())
+        self.assertIn('5번째 줄', err.getvalue())
+        self.assertIn('6번째 줄', err.getvalue())
+        user = CustomUser.objects.get(phone='01011111111')
+        self.assertEqual(user.club, club)
+        self.assertTrue(user.check_password('password1!'))
+        self.assertTrue(CustomUser.objects.get(phone='01022222222').check_password('password2!'))
+        # bulk_create 로 추가된 선수도 검색 문서가 만들어진다
+        self.assertEqual(
+            set(SearchDocument.objects.filter(kind='player').values_list('title', flat=True)), {'기존', '선수1', '선수2'},
+        )
+
+
+class AsyncLoginViewTest(TransactionTestCase):
+    """
+    비동기 로그인 API 테스트
+    (authenticate 가 로그인 스레드의 별도 DB 연결에서 실행되므로 데이터를 커밋하는 TransactionTestCase 사용)
+    """
+    def setUp(self):
+        self.client = APIClient()
+        CustomUser.objects.create_user(
+            phone='01000000000', password='password1234!', username='테스트', birth=1990, gender='male',
+        )
+
+    def login(self, password):
+        return self.client.post(reverse('login'), {'phone': '01000000000', 'password': password}, format='json')
+
+    def test_login_issues_tokens(self):
+        response = self.login('password1234!')
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()['message'], '로그인 완료')
+        self.assertTrue(response.json()['access'])
+        self.assertTrue(response.cookies['refresh'].value)
+
+    def test_wrong_password_is_rejected(self):
+        response = self.login('wrong-password')
+
+        self.assertEqual(response.status_code, 400)
+        self.assertIn('nonFieldErrors', response.json())
+
+    def test_failed_login_sends_user_login_failed(self):
+        received = []
+        handler = lambda sender, credentials, **kwargs: received.append(credentials)
+        user_login_failed.connect(handler)
+        try:
+            self.login('wrong-password')
+        finally:
+            user_login_failed.disconnect(handler)
+
+        self.assertEqual(len(received), 1)
+        self.assertEqual(received[0]['phone'], '01000000000')
+
+    def test_inactive_user_is_rejected(self):
+        CustomUser.objects.filter(phone='01000000000').update(is_active=False)
+
+        response = self.login('password1234!')
+
+        self.assertEqual(response.status_code, 400)
+
+    def test_missing_fields_are_rejected(self):
+        response = self.client.post(reverse('login'), {'phone': '01000000000'}, format='json')
+
+        self.assertEqual(response.status_code, 400)
+        self.assertIn('password', response.json())
+
+    def test_other_requests_are_served_while_hash_pool_is_busy(self):
+        # ASGI (AsyncClient) 에서는 로그인이 해시를 기다리는 동안에도 다른 요청이 처리된다
+        # sync 전용 미들웨어가 있으면 체인 전체가 sync 로 실행되어 아래 요청이 멈추므로 먼저 확인
+        sync_only = [path for path in settings.MIDDLEWARE if not getattr(import_string(path), 'async_capable', False)]
+        self.assertEqual(sync_only, [])
+        release = threading.Event()
+
+        def blocked_authenticate(request, phone, password):
+            release.wait(5)
+            return None
+
+        async def run():
+            logins = [
+                asyncio.ensure_future(self.async_client.post(
+                    reverse('login'), {'phone': '01000000000', 'password': 'password1234!'},
+                    content_type='application/json',
+                ))
+                for _ in range(settings.LOGIN_HASH_WORKERS + 2)
+            ]
+            await asyncio.sleep(0.1)
+            try:
+                response = await asyncio.wait_for(self.async_client.get(reverse('competition-list')), timeout=2)
+                self.assertFalse(any(login.done() for login in logins))
+            finally:
+                release.set()
+            return response, await asyncio.gather(*logins)
+
+        with mock.patch('users.login._authenticate', blocked_authenticate):
+            response, logins = async_to_sync(run)()
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual([login.status_code for login in logins], [400] * len(logins))
+
+    def test_full_hash_queue_returns_429(self):
+        with mock.patch('users.login._pending', threading.BoundedSemaphore(1)) as pending:
+            pending.acquire()
+            response = self.login('password1234!')
+
+        self.assertEqual(response.status_code, 429)
@@ -0,0 +1,139 @@
+import threading
+import time
+from datetime import timedelta
+
+from django.core.cache import cache, caches
+from django.core.cache.backends.dummy import DummyCache
+from django.core.cache.backends.locmem import LocMemCache
+from django.utils import timezone
+from rest_framework_simplejwt.exceptions import TokenError
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.token_blacklist.models import BlacklistedToken, OutstandingToken
+from rest_framework_simplejwt.tokens import RefreshToken
+from rest_framework_simplejwt.utils import aware_utcnow
+
+
+BLACKLIST_VERSION_KEY = 'users:token_blacklist:version'
+# 동기화 사이에 늦게 커밋된 블랙리스트를 놓치지 않도록 겹쳐서 다시 조회하는 구간
+BLACKLIST_SYNC_OVERLAP = timedelta(minutes=1)
+# 만료된 jti 를 메모리에서 정리하기 위해 전체를 다시 불러오는 주기(초)
+BLACKLIST_FULL_RELOAD_INTERVAL = 60 * 60
+
+
+def shared_cache_configured():
+    """
+    기본 캐시가 워커 프로세스끼리 공유되는 캐시(Redis 등)인지 확인
+    LocMemCache 는 프로세스마다 따로 있어서 다른 프로세스가 올린 블랙리스트 버전을 볼 수 없다.
+    """
+    return not isinstance(caches['default'], (LocMemCache, DummyCache))
+
+
+def bump_blacklist_version():
+    """
+    블랙리스트가 추가될 때 호출 (모든 프로세스가 다음 확인 때 새 항목을 불러오도록 공유 캐시의 버전을 올림)
+    """
+    if not cache.add(BLACKLIST_VERSION_KEY, 1, None):
+        try:
+            cache.incr(BLACKLIST_VERSION_KEY)
+        except ValueError:
+            cache.set(BLACKLIST_VERSION_KEY, 1, None)
+
+
+def _get_blacklist_version():
+    version = cache.get(BLACKLIST_VERSION_KEY)
+    if version is None:
+        # 캐시에서 사라졌으면 새 버전으로 시작해서 모든 프로세스가 다시 동기화하도록 함
+        cache.add(BLACKLIST_VERSION_KEY, int(time.time() * 1000), None)
+        version = cache.get(BLACKLIST_VERSION_KEY)
+    return version
+
+
+class RevokedTokenSet:
+    """
+    블랙리스트에 등록된(만료되지 않은) 리프레시 토큰 jti 를 프로세스 메모리에 들고 있는 집합
+
+    공유 캐시의 버전이 바뀌었을 때만 DB 에서 새로 추가된 항목을 불러오므로
+    블랙리스트에 없는 토큰(대부분의 요청)은 DB 조회 없이 확인할 수 있다.
+    공유 캐시가 설정되지 않은 경우(REDIS_URL 없음)에는 다른 프로세스의 revoke 를 놓치지 않도록 매번 DB 에서 확인한다.
+    """
+    def __init__(self):
+        self.jtis = set()
+        self.version = None
+        self.synced_at = None
+        self.loaded_at = 0
+        self._lock = threading.Lock()
+
+    def is_revoked(self, jti):
+        if not shared_cache_configured():
+            return BlacklistedToken.objects.filter(token__jti=jti).exists()
+        version = _get_blacklist_version()
+        if version != self.version or self._needs_full_reload():
+            self.sync(version)
+        return jti in self.jtis
+
+    def _needs_full_reload(self):
+        return self.synced_at is None or time.monotonic() - self.loaded_at > BLACKLIST_FULL_RELOAD_INTERVAL
+
+    def sync(self, version):
+        with self._lock:
+            full_reload = self._needs_full_reload()
+            if version == self.version and not full_reload:
+                return
+            now = timezone.now()
+            queryset = BlacklistedToken.objects.filter(token__expires_at__gt=aware_utcnow())
+            if not full_reload:
+                queryset = queryset.filter(blacklisted_at__gte=self.synced_at - BLACKLIST_SYNC_OVERLAP)
+
+            jtis = set(queryset.values_list('token__jti', flat=True))
+            if full_reload:
+                self.jtis = jtis
+                self.loaded_at = time.monotonic()
+            else:
+                self.jtis |= jtis
+            self.synced_at = now
+            self.version = version
+
+    def clear(self):
+        with self._lock:
+            self.jtis = set()
+            self.version = None
+            self.synced_at = None
+            self.loaded_at = 0
+
+
+revoked_tokens = RevokedTokenSet()
+
+
+class FastRevocationRefreshToken(RefreshToken):
+    """
+    블랙리스트 확인을 매번 DB 에서 하지 않고 프로세스 메모리의 RevokedTokenSet 으로 확인하는 리프레시 토큰
+    """
+    def check_blacklist(self):
+        jti = self.payload[api_settings.JTI_CLAIM]
+        if revoked_tokens.is_revoked(jti):
+            raise TokenError('Token is blacklisted')
+
+
+def prune_expired_tokens(batch_size=1000, max_batches=None, sleep=0):
+    """
+    만료된 OutstandingToken (+ 연결된 BlacklistedToken) 을 batch_size 개씩 나눠서 삭제
+    한번에 지우지 않으므로 테이블이 커도 락을 오래 잡지 않는다. (스케줄러 / cron 에서 호출)
+    삭제한 OutstandingToken 수를 반환
+    """
+    deleted = 0
+    batches = 0
+    while max_batches is None or batches < max_batches:
+        ids = list(
+            OutstandingToken.objects.filter(expires_at__lte=aware_utcnow())
+            .order_by('id')
+            .values_list('id', flat=True)[:batch_size]
+        )
+        if not ids:
+            break
+        # 연결된 BlacklistedToken 은 CASCADE 로 같은 배치에서 함께 삭제됨
+        _, counts = OutstandingToken.objects.filter(id__in=ids).delete()
+        deleted += counts.get(OutstandingToken._meta.label, 0)
+        batches += 1
+        if sleep:
+            time.sleep(sleep)
+    return deleted
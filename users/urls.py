@@ -1,4 +1,5 @@
 from django.urls import path
+from django.views.decorators.csrf import csrf_exempt
 from rest_framework_simplejwt.views import TokenVerifyView
 from .views import CreateUserView, LoginView, RefreshAccessTokenView, LogoutView, UserDetailView
 
@@ -7,7 +8,7 @@ urlpatterns = [
     path('auth/token/refresh/', RefreshAccessTokenView.as_view(), name='token_refresh'), # 토큰 리프레시
     path('auth/token/verify/', TokenVerifyView.as_view(), name='token_verify'),  # 토큰 검증 # 리프레시토큰 갱신 api
     path('auth/signup/', CreateUserView.as_view(), name='signup'), # 회원가입 api
-    path('auth/signin/', LoginView.as_view(), name='login'), # 로그인 api
+    path('auth/signin/', csrf_exempt(LoginView.as_view()), name='login'), # 로그인 api (비동기 view)
     path('auth/logout/', LogoutView.as_view(), name='logout'),
      path('user/<int:pk>/', UserDetailView.as_view(), name='user-detail'),
 ]
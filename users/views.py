@@ -1,11 +1,17 @@
+import json
+
+from asgiref.sync import sync_to_async
 from rest_framework.views import APIView
 from rest_framework.response import Response
-from rest_framework.request import Request
-from rest_framework_simplejwt.tokens import RefreshToken
 from rest_framework import status
-from rest_framework_simplejwt.views import TokenObtainPairView
+from django.contrib.auth.models import update_last_login
+from django.http import JsonResponse
+from django.views import View
+from rest_framework_simplejwt.settings import api_settings
 from .serializers import CreateUserSerializer, CustomTokenObtainPairSerializer, UserInfoSerializer
 from .models import CustomUser
+from .tokens import FastRevocationRefreshToken
+from .login import LoginOverloaded, authenticate_user
 
 
 
@@ -15,6 +21,7 @@ from .models import CustomUser
 
 # 회원가입 view ##
 class CreateUserView(APIView):
+    query_budget = 7 # 인증 / 전화번호 중복 / 클럽 조회 / 이미지 생성 / 유저 생성 / 검색 문서 / 토큰 등록
 
     def post(self, request, *args, **kwargs):
         serializer = CreateUserSerializer(data=request.data)  # request.data를 직접 사용
@@ -40,22 +47,62 @@ class CreateUserView(APIView):
 
 
 ## 로그인 ##
-from rest_framework import status
-from rest_framework_simplejwt.views import TokenObtainPairView
+class LoginView(View):
+    """
+    비동기 로그인 API
+    authenticate(유저 조회 + 비밀번호 해시)는 로그인 전용 스레드 풀(users/login.py)에서 동시 실행 수를 제한해서 처리하고,
+    대기열이 가득 차면 429 로 응답한다. 토큰 발급만 일반 sync 스레드에서 처리한다.
+    미들웨어가 모두 async 를 지원하므로 ASGI(config/asgi.py)로 실행하면 해시를 기다리는 동안 요청 스레드를 잡지 않는다.
+    (WSGI 로 실행하면 async_to_sync 로 감싸져 요청 스레드가 해시를 기다림)
+    """
+    query_budget = 1 # 토큰 등록 (authenticate 쿼리는 로그인 스레드의 DB 연결에서 실행되어 집계되지 않음)
 
+    async def post(self, request, *args, **kwargs):
+        data = self.parse_body(request)
+        errors = {
+            field: ['이 필드는 필수 항목입니다.']
+            for field in ('phone', 'password') if not data.get(field)
+        }
+        if errors:
+            return JsonResponse(errors, status=status.HTTP_400_BAD_REQUEST)
 
-class LoginView(TokenObtainPairView):
-    def post(self, request: Request, *args, **kwargs) -> Response:
-        res = super().post(request, *args, **kwargs)
-        
-        response = Response({
+        try:
+            user = await authenticate_user(request, data['phone'], data['password'])
+        except LoginOverloaded:
+            response = JsonResponse({
+                'detail': '로그인 요청이 많습니다. 잠시 후 다시 시도해 주세요.'
+            }, status=status.HTTP_429_TOO_MANY_REQUESTS)
+            response['Retry-After'] = '1'
+            return response
+
+        if user is None:
+            return JsonResponse({
+                'nonFieldErrors': ['로그인에 실패하였습니다. 전화번호와 비밀번호를 확인해 주세요.']
+            }, status=status.HTTP_400_BAD_REQUEST)
+
+        refresh = await sync_to_async(self.issue_token)(user)
+        response = JsonResponse({
             "message": "로그인 완료",
-            "access": str(res.data.get('access', None))
+            "access": str(refresh.access_token)
             }, status= status.HTTP_200_OK)
         
-        response.set_cookie("refresh", res.data.get('refresh', None), httponly= True)
+        response.set_cookie("refresh", str(refresh), httponly= True)
         
         return response
+
+    def parse_body(self, request):
+        if request.content_type == 'application/json':
+            try:
+                data = json.loads(request.body or b'{}')
+            except ValueError:
+                return {}
+            return data if isinstance(data, dict) else {}
+        return request.POST
+
+    def issue_token(self, user):
+        if api_settings.UPDATE_LAST_LOGIN:
+            update_last_login(None, user)
+        return CustomTokenObtainPairSerializer.get_token(user)
     
     
      
@@ -78,6 +125,7 @@ from rest_framework.permissions import AllowAny
 
 class RefreshAccessTokenView(APIView):
     permission_classes = (AllowAny,)
+    query_budget = 2 # 인증 1 + 블랙리스트 동기화 1 (버전이 바뀌었을 때만)
 
     def post(self, request, *args, **kwargs):
         refresh_token = request.COOKIES.get('refresh')
@@ -86,7 +134,8 @@ class RefreshAccessTokenView(APIView):
             return Response({"error": "리프레시 토큰이 없습니다."}, status=status.HTTP_400_BAD_REQUEST)
 
         try:
-            token = RefreshToken(refresh_token)
+            # 블랙리스트 확인은 프로세스 메모리의 revoke 목록으로 처리 (대부분 DB 조회 없음)
+            token = FastRevocationRefreshToken(refresh_token)
             new_access_token = str(token.access_token)
 
             # 필요하다면 새 리프레시 토큰도 생성하여 반환할 수 있습니다. 
@@ -111,8 +160,14 @@ class UserDetailView(APIView):
     """
     유저 상세 정보를 제공하는 API
     """
+    query_budget = 2 # 인증 1 + 유저 (이미지 / 클럽 / 팀 JOIN) 1
 
     def get(self, request, pk):
-        user = CustomUser.objects.get(pk=pk)
+        try:
+            user = CustomUser.objects.select_related(
+                'image_url', 'club__image_url', 'team__image_url'
+            ).get(pk=pk)
+        except CustomUser.DoesNotExist:
+            return Response({'error': '해당유저가 존재하지 않습니다.'}, status=404)
         serializer = UserInfoSerializer(user)
         return Response(serializer.data, status=status.HTTP_200_OK)
\ No newline at end of file